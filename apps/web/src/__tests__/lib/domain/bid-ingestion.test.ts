@@ -0,0 +1,201 @@
+/**
+ * Bid Ingestion 파이프라인 유닛 테스트
+ */
+import { describe, it, expect, vi } from 'vitest';
+import {
+  ingestBids,
+  createNaraJangtoTasks,
+  type IngestionPageTask,
+} from '@/lib/domain/usecases/bid-ingestion';
+import { MockBidRepository } from '@/lib/domain/repositories/bid-repository';
+import type { NaraJangtoClient, BidNotice } from '@/lib/clients/narajangto-api';
+import type { BidData, CreateInput } from '@/types';
+
+// ============================================================================
+// 테스트 헬퍼
+// ============================================================================
+
+const createInput = (externalId: string, title = `유량계 구매 ${externalId}`) =>
+  ({
+    source: 'narajangto',
+    externalId,
+    title,
+    organization: '서울특별시',
+    deadline: '2025-02-01T00:00:00.000Z',
+    estimatedAmount: null,
+    status: 'new',
+    priority: 'medium',
+    type: 'product',
+    keywords: [],
+    url: null,
+    rawData: {},
+  }) as unknown as CreateInput<BidData>;
+
+/** ids를 pageSize씩 나눠 next로 연결한 페이지 작업 */
+const createPagedTask = (
+  ids: string[],
+  pageSize: number,
+  onFetch?: () => Promise<void>
+): IngestionPageTask => {
+  const page =
+    (offset: number): IngestionPageTask =>
+    async () => {
+      await onFetch?.();
+      return {
+        items: ids.slice(offset, offset + pageSize).map((id) => createInput(id)),
+        next: offset + pageSize < ids.length ? page(offset + pageSize) : undefined,
+      };
+    };
+  return page(0);
+};
+
+const range = (prefix: string, count: number) =>
+  Array.from({ length: count }, (_, i) => `${prefix}-${i}`);
+
+// ============================================================================
+// ingestBids
+// ============================================================================
+
+describe('ingestBids', () => {
+  it('다음 페이지를 따라가며 모든 공고 저장', async () => {
+    const repository = new MockBidRepository([]);
+
+    const report = await ingestBids(
+      [createPagedTask(range('A', 25), 10), createPagedTask(range('B', 7), 10)],
+      repository,
+      { batchSize: 10 }
+    );
+
+    expect(report.pages).toBe(4);
+    expect(report.fetched).toBe(32);
+    expect(report.created).toBe(32);
+    expect(report.createdBids.map((b) => b.externalId)).toHaveLength(32);
+    expect(report.stages.fetch.items).toBe(32);
+    expect(report.stages.write.items).toBe(32);
+  });
+
+  it('동시 페이지 조회 수 제한', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const onFetch = async () => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      inFlight--;
+    };
+
+    const tasks = Array.from({ length: 6 }, (_, i) =>
+      createPagedTask(range(`K${i}`, 20), 10, onFetch)
+    );
+    const report = await ingestBids(tasks, new MockBidRepository([]), { concurrency: 2 });
+
+    expect(maxInFlight).toBe(2);
+    expect(report.pages).toBe(12);
+    expect(report.created).toBe(120);
+  });
+
+  it('실행 중/기존 저장 중복은 배치당 한 번 조회로 건너뜀', async () => {
+    const repository = new MockBidRepository([]);
+    await repository.create(createInput('A-1'));
+    const lookup = vi.spyOn(repository, 'findExistingExternalIds');
+    const bulkCreate = vi.spyOn(repository, 'bulkCreate');
+    const findByExternalId = vi.spyOn(repository, 'findByExternalId');
+
+    const report = await ingestBids(
+      [createPagedTask(['A-0', 'A-1', 'A-2'], 3), createPagedTask(['A-2', 'A-3'], 2)],
+      repository,
+      { batchSize: 100 }
+    );
+
+    expect(report.created).toBe(3);
+    expect(report.duplicates).toBe(2);
+    expect(report.createdBids.map((b) => b.externalId).sort()).toEqual(['A-0', 'A-2', 'A-3']);
+    expect(lookup).toHaveBeenCalledTimes(1);
+    expect(bulkCreate).toHaveBeenCalledTimes(1);
+    expect(findByExternalId).not.toHaveBeenCalled();
+  });
+
+  it('일괄 저장 실패 시 건별 저장으로 대체', async () => {
+    const repository = new MockBidRepository([]);
+    vi.spyOn(repository, 'bulkCreate').mockResolvedValue({
+      success: false,
+      error: { code: 'BULK_CREATE_FAILED', message: 'constraint' },
+    });
+    const create = vi.spyOn(repository, 'create');
+
+    const report = await ingestBids([createPagedTask(range('A', 5), 5)], repository);
+
+    expect(create).toHaveBeenCalledTimes(5);
+    expect(report.created).toBe(5);
+    expect(report.failed).toBe(0);
+  });
+
+  it('필터 적용, 페이지 오류 후에도 계속 진행', async () => {
+    const failing: IngestionPageTask = async () => {
+      throw new Error('API 오류');
+    };
+    const task: IngestionPageTask = async () => ({
+      items: [createInput('A-0', '유량계 구매'), createInput('A-1', '사무용품 구매')],
+    });
+
+    const report = await ingestBids([failing, task], new MockBidRepository([]), {
+      filter: (bid) => bid.title.includes('유량계'),
+    });
+
+    expect(report.errors).toEqual(['API 오류']);
+    expect(report.fetched).toBe(2);
+    expect(report.filtered).toBe(1);
+    expect(report.created).toBe(1);
+  });
+});
+
+// ============================================================================
+// createNaraJangtoTasks
+// ============================================================================
+
+describe('createNaraJangtoTasks', () => {
+  const notice = (no: string): BidNotice => ({
+    bidNtceNo: no,
+    bidNtceOrd: '00',
+    bidNtceNm: '초음파유량계 구매',
+    ntceInsttNm: '서울특별시',
+    bidClseDt: '2025/02/01 18:00',
+  });
+
+  it('키워드별로 마지막(짧은) 페이지까지 조회', async () => {
+    const searchProductBids = vi.fn(
+      async ({ keywords, pageNo }: { keywords: string[]; pageNo: number }) =>
+        pageNo === 1
+          ? [notice(`${keywords[0]}-1`), notice(`${keywords[0]}-2`)]
+          : [notice(`${keywords[0]}-3`)]
+    );
+    const client = {
+      searchProductBids,
+      mapToBid: (n: BidNotice) => ({
+        source: 'narajangto',
+        external_id: `${n.bidNtceNo}-${n.bidNtceOrd}`,
+        title: n.bidNtceNm,
+        organization: n.ntceInsttNm,
+        deadline: new Date('2025-02-01T09:00:00.000Z'),
+        estimated_amount: 1000,
+        url: null,
+        type: 'product',
+        status: 'new',
+        keywords: ['유량계'],
+        raw_data: n,
+      }),
+    } as unknown as NaraJangtoClient;
+
+    const tasks = createNaraJangtoTasks(client, { keywords: ['유량계', '계측기'], numOfRows: 2 });
+    const report = await ingestBids(tasks, new MockBidRepository([]));
+
+    expect(tasks).toHaveLength(2);
+    expect(searchProductBids).toHaveBeenCalledTimes(4);
+    expect(report.created).toBe(6);
+    expect(report.createdBids[0]).toMatchObject({
+      source: 'narajangto',
+      deadline: '2025-02-01T09:00:00.000Z',
+      estimatedAmount: BigInt(1000),
+    });
+  });
+});
@@ -0,0 +1,135 @@
+// @vitest-environment node
+/**
+ * 대용량 입찰 목록 스트리밍 내보내기 벤치마크
+ *
+ * 기존 방식(전체 행을 메모리에 모은 뒤 한 번에 변환) vs 페이지 단위 스트리밍
+ * 출력은 버리는 Writable로 보내며, 각 실행의 초당 행 수와 메모리 증가량을 함께 출력한다.
+ * 모든 실행이 한 프로세스를 공유하므로 메모리는 실행 직전 GC 후 값을 기준으로 한 증가량
+ * (RSS는 앞 실행이 확보한 페이지를 재사용할 수 있어 힙 증가량도 함께 출력)
+ *
+ * 실행: pnpm --filter @qetta/web bench (--expose-gc 필요, bench 스크립트에 포함)
+ */
+
+import { bench, describe } from 'vitest';
+import { Writable } from 'node:stream';
+import type { BidData } from '@forge-labs/types/bidding';
+import {
+  BID_COLUMNS,
+  encodeCSVChunks,
+  transformBidRowForCSV,
+} from '@/lib/spreadsheet/excel-export';
+import { encodeCSVStream, writeExcelStream } from '@/lib/spreadsheet/excel-stream';
+
+const SIZES = [10_000, 100_000, 1_000_000];
+const PAGE_SIZE = 500;
+
+const createBid = (i: number): BidData =>
+  ({
+    id: `00000000-0000-4000-8000-${String(i).padStart(12, '0')}`,
+    source: 'narajangto',
+    external_id: `2025${String(i).padStart(8, '0')}`,
+    title: `서울시 초음파유량계 구매 ${i}차`,
+    organization: '서울특별시 상수도사업본부',
+    deadline: '2025-01-15',
+    estimated_amount: 450000000 + i,
+    status: 'reviewing',
+    priority: 'high',
+    type: 'product',
+    keywords: ['유량계', '상수도', '초음파'],
+    match_score: 0.92,
+    ai_summary: '상수도 관로 유량 측정용 초음파유량계 구매, 설치 포함',
+    url: 'https://www.g2b.go.kr/',
+  }) as unknown as BidData;
+
+/** 저장소 페이지 조회를 흉내내는 페이지 생성 (페이지마다 새 객체) */
+async function* pages(total: number) {
+  for (let start = 0; start < total; start += PAGE_SIZE) {
+    const size = Math.min(PAGE_SIZE, total - start);
+    yield Array.from({ length: size }, (_, i) => createBid(start + i));
+  }
+}
+
+const discard = () =>
+  new Writable({
+    write(_chunk, _encoding, callback) {
+      callback();
+    },
+  });
+
+const MB = 1024 * 1024;
+
+/** GC 후 메모리 기준값 */
+const baseline = () => {
+  if (typeof global.gc !== 'function') {
+    throw new Error('node --expose-gc로 실행해야 합니다 (pnpm --filter @qetta/web bench)');
+  }
+  global.gc();
+  return process.memoryUsage();
+};
+
+/** 실행 중 기준값 대비 최대 RSS/힙 증가량 측정 후 결과 출력 */
+const measure = async (label: string, rows: number, run: () => Promise<void>) => {
+  const base = baseline();
+  let peakRss = base.rss;
+  let peakHeap = base.heapUsed;
+  const sample = () => {
+    const usage = process.memoryUsage();
+    peakRss = Math.max(peakRss, usage.rss);
+    peakHeap = Math.max(peakHeap, usage.heapUsed);
+  };
+  const timer = setInterval(sample, 10);
+
+  const start = performance.now();
+  await run();
+  const seconds = (performance.now() - start) / 1000;
+  clearInterval(timer);
+  sample();
+
+  console.log(
+    `${label} ${rows.toLocaleString()} rows: ` +
+      `${Math.round(rows / seconds).toLocaleString()} rows/s, ` +
+      `peak RSS +${Math.round((peakRss - base.rss) / MB)} MB, ` +
+      `peak heap +${Math.round((peakHeap - base.heapUsed) / MB)} MB`
+  );
+};
+
+for (const size of SIZES) {
+  describe(`export ${size.toLocaleString()} bids`, () => {
+    bench(
+      'CSV: collect all rows, then encode',
+      () =>
+        measure('csv (buffered)', size, async () => {
+          const rows: Record<string, unknown>[] = [];
+          for await (const page of pages(size)) {
+            for (const bid of page) {
+              rows.push(transformBidRowForCSV(bid as unknown as Record<string, unknown>));
+            }
+          }
+          const output = discard();
+          output.write('\uFEFF' + [...encodeCSVChunks(rows, BID_COLUMNS)].join(''));
+        }),
+      { iterations: 1 }
+    );
+
+    bench(
+      'CSV: stream page by page',
+      () =>
+        measure('csv (stream)', size, async () => {
+          const output = discard();
+          for await (const chunk of encodeCSVStream(pages(size))) {
+            output.write(chunk);
+          }
+        }),
+      { iterations: 1 }
+    );
+
+    bench(
+      'XLSX: stream page by page',
+      () =>
+        measure('xlsx (stream)', size, async () => {
+          await writeExcelStream(pages(size), discard());
+        }),
+      { iterations: 1 }
+    );
+  });
+}
@@ -0,0 +1,219 @@
+// @vitest-environment node
+/**
+ * Excel/CSV 스트리밍 내보내기 유닛 테스트
+ */
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { PassThrough, Readable } from 'node:stream';
+import { saveAs } from 'file-saver';
+import { exportToCSV, BID_COLUMNS } from '@/lib/spreadsheet/excel-export';
+import {
+  batchRows,
+  createCSVStream,
+  encodeCSVStream,
+  readExcelRows,
+  writeExcelStream,
+} from '@/lib/spreadsheet/excel-stream';
+import { iterateBids, BidRepositoryError } from '@/lib/domain/usecases/bid-usecases';
+import type { IBidRepository } from '@/lib/domain/repositories/bid-repository';
+import type { BidData } from '@forge-labs/types/bidding';
+
+// Mock file-saver
+vi.mock('file-saver', () => ({
+  saveAs: vi.fn(),
+}));
+
+// ============================================================================
+// 테스트 헬퍼
+// ============================================================================
+
+const createBid = (i: number): BidData =>
+  ({
+    id: `bid-${i}`,
+    source: i % 2 === 0 ? 'narajangto' : 'ted',
+    external_id: `EXT-${i}`,
+    title: i % 3 === 0 ? `유량계 구매, "${i}"차` : `Flow Meter ${i}`,
+    organization: '서울특별시',
+    deadline: '2025-01-15',
+    estimated_amount: 1000000 + i,
+    status: 'reviewing',
+    priority: 'high',
+    type: 'product',
+    keywords: ['유량계', '상수도'],
+    match_score: 0.92,
+    ai_summary: i % 5 === 0 ? '여러 줄\n요약' : null,
+    url: null,
+  }) as unknown as BidData;
+
+const createBids = (count: number) => Array.from({ length: count }, (_, i) => createBid(i));
+
+/** 배열을 offset 페이지로 돌려주는 저장소 */
+const createRepository = (bids: BidData[]) => {
+  const findAll = vi.fn(
+    async (_filters?: unknown, _sort?: unknown, pagination = { page: 1, limit: 20 }) => {
+      const start = (pagination.page - 1) * pagination.limit;
+      const items = bids.slice(start, start + pagination.limit);
+      return {
+        success: true as const,
+        data: {
+          items,
+          total: bids.length,
+          page: pagination.page,
+          limit: pagination.limit,
+          hasMore: start + items.length < bids.length,
+        },
+      };
+    }
+  );
+  return { repository: { findAll } as unknown as IBidRepository, findAll };
+};
+
+async function* toPages<T>(rows: T[], size: number) {
+  for (let i = 0; i < rows.length; i += size) {
+    yield rows.slice(i, i + size);
+  }
+}
+
+const collect = async <T>(iterable: AsyncIterable<T>) => {
+  const values: T[] = [];
+  for await (const value of iterable) values.push(value);
+  return values;
+};
+
+// ============================================================================
+// iterateBids
+// ============================================================================
+
+describe('iterateBids', () => {
+  it('모든 입찰을 페이지 단위로 순회', async () => {
+    const bids = createBids(1_050);
+    const { repository, findAll } = createRepository(bids);
+
+    const pages = await collect(iterateBids({ pageSize: 500, repository }));
+
+    expect(pages.map((page) => page.length)).toEqual([500, 500, 50]);
+    expect(pages.flat()).toEqual(bids);
+    expect(findAll).toHaveBeenCalledTimes(3);
+  });
+
+  it('페이지 크기는 유지하고 maxRows에서 중단', async () => {
+    const { repository, findAll } = createRepository(createBids(1_050));
+
+    const pages = await collect(iterateBids({ pageSize: 400, maxRows: 900, repository }));
+
+    expect(pages.map((page) => page.length)).toEqual([400, 400, 100]);
+    expect(findAll.mock.calls.map(([, , pagination]) => pagination)).toEqual([
+      { page: 1, limit: 400 },
+      { page: 2, limit: 400 },
+      { page: 3, limit: 400 },
+    ]);
+  });
+
+  it('저장소 조회 실패 시 에러 응답을 담아 throw', async () => {
+    const repository = {
+      findAll: vi.fn(async () => ({
+        success: false as const,
+        error: { code: 'DATABASE_ERROR', message: '조회 실패' },
+      })),
+    } as unknown as IBidRepository;
+
+    await expect(collect(iterateBids({ repository }))).rejects.toThrow('조회 실패');
+
+    // 라우트가 원래 에러 응답을 그대로 돌려줄 수 있도록 응답 포함
+    const error = await collect(iterateBids({ repository })).catch((e: unknown) => e);
+    expect(error).toBeInstanceOf(BidRepositoryError);
+    expect((error as BidRepositoryError).response).toEqual({
+      success: false,
+      error: { code: 'DATABASE_ERROR', message: '조회 실패' },
+    });
+  });
+});
+
+// ============================================================================
+// CSV 스트리밍
+// ============================================================================
+
+describe('encodeCSVStream', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('exportToCSV와 같은 텍스트 생성', async () => {
+    const bids = createBids(300);
+
+    exportToCSV(bids as unknown as Record<string, unknown>[]);
+    const blob = vi.mocked(saveAs).mock.calls[0][0] as Blob;
+    const expected = await blob.text();
+
+    const chunks = await collect(encodeCSVStream(toPages(bids, 64), { chunkSize: 1024 }));
+
+    expect(chunks.length).toBeGreaterThan(1);
+    // Blob.text()는 앞의 BOM을 제거함
+    expect(chunks.join('')).toBe('\uFEFF' + expected);
+  });
+
+  it('빈 목록은 헤더 행만 출력', async () => {
+    const chunks = await collect(encodeCSVStream(toPages([], 10), { bom: false }));
+
+    expect(chunks).toEqual([BID_COLUMNS.map((col) => col.header).join(',')]);
+  });
+});
+
+describe('createCSVStream', () => {
+  it('본문을 읽는 만큼만 페이지 조회', async () => {
+    let pagesRead = 0;
+    async function* pages() {
+      for (let i = 0; i < 100; i++) {
+        pagesRead++;
+        yield createBids(100);
+      }
+    }
+
+    const reader = createCSVStream(pages(), { chunkSize: 4 * 1024 }).getReader();
+    const { value } = await reader.read();
+
+    expect(value).toBeInstanceOf(Uint8Array);
+    expect(pagesRead).toBeLessThan(5);
+
+    await reader.cancel();
+    expect(pagesRead).toBeLessThan(5);
+  });
+});
+
+// ============================================================================
+// Excel 스트리밍
+// ============================================================================
+
+describe('writeExcelStream / readExcelRows', () => {
+  it('스트리밍 워크북 쓰기/읽기 왕복', async () => {
+    const bids = createBids(250);
+    const output = new PassThrough();
+    const buffers: Buffer[] = [];
+    output.on('data', (chunk: Buffer) => buffers.push(chunk));
+
+    const count = await writeExcelStream(toPages(bids, 100), output);
+    expect(count).toBe(250);
+
+    const rows = await collect(readExcelRows(Readable.from(Buffer.concat(buffers))));
+
+    expect(rows).toHaveLength(250);
+    expect(rows[0]).toMatchObject({
+      공고명: bids[0].title,
+      발주기관: '서울특별시',
+      상태: '검토중',
+      우선순위: '높음',
+      키워드: '유량계, 상수도',
+      매칭점수: '92%',
+    });
+    expect(rows[249]['공고번호']).toBe('EXT-249');
+  });
+});
+
+describe('batchRows', () => {
+  it('행을 고정 크기 배치로 묶음', async () => {
+    async function* rows() {
+      for (let i = 0; i < 7; i++) yield i;
+    }
+
+    expect(await collect(batchRows(rows(), 3))).toEqual([[0, 1, 2], [3, 4, 5], [6]]);
+  });
+});
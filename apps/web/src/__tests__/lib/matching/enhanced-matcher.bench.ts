@@ -0,0 +1,93 @@
+/**
+ * 제품 매칭 벤치마크
+ *
+ * SAMPLE_PRODUCTS를 합성 확장한 카탈로그 × 공고 N건:
+ * 컴파일된 ProductMatcher vs 제품마다 키워드 includes + 규격 추출 + 기관 정규화를 반복하는 기존 방식
+ *
+ * 실행: pnpm --filter @qetta/web bench
+ *
+ * 기존 방식 기준선은 매칭 이유 문자열을 만들지 않으므로 실제 기존 코드보다 약간 빠르다.
+ */
+
+import { bench, describe } from 'vitest';
+import {
+  ProductMatcher,
+  SAMPLE_BIDS,
+  SAMPLE_PRODUCTS,
+  type BidAnnouncement,
+  type Product,
+} from '@/lib/matching/enhanced-matcher';
+import { extractPipeSize, matchPipeSize } from '@/lib/matching/pipe-size-extractor';
+import { getOrganizationProductScore } from '@/lib/matching/organization-dictionary';
+
+const PRODUCT_COUNT = 500;
+const BID_COUNT = 10_000;
+
+let seed = 20250101;
+const rand = () => {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+};
+
+// 샘플 제품을 모델별 변형으로 확장 (모델명/규격 키워드 추가)
+const products: Product[] = Array.from({ length: PRODUCT_COUNT }, (_, i) => {
+  const base = SAMPLE_PRODUCTS[i % SAMPLE_PRODUCTS.length];
+  const variant = Math.floor(i / SAMPLE_PRODUCTS.length);
+  return {
+    ...base,
+    id: `${base.id}-${variant}`,
+    strongKeywords: [...base.strongKeywords, `${base.id}-${variant}`, `모델${variant}`],
+    weakKeywords: [...base.weakKeywords, `규격${variant}`],
+    excludeKeywords: [...base.excludeKeywords, `단종${variant}`],
+  };
+});
+
+const bids: BidAnnouncement[] = Array.from({ length: BID_COUNT }, (_, i) => {
+  const base = SAMPLE_BIDS[i % SAMPLE_BIDS.length];
+  return {
+    ...base,
+    id: `BENCH-${i}`,
+    title: `${base.title} 모델${Math.floor(rand() * 100)}`,
+  };
+});
+
+/** 컴파일 이전 방식: 제품마다 텍스트 전체를 다시 스캔 */
+function legacyMatch(bid: BidAnnouncement): number {
+  const text = [bid.title, bid.description || '', bid.organization].join(' ').trim();
+  let best = -Infinity;
+
+  for (const product of products) {
+    const lowerText = text.toLowerCase();
+    if (product.excludeKeywords.some((k) => lowerText.includes(k.toLowerCase()))) continue;
+
+    let score = 0;
+    for (const k of product.strongKeywords) if (lowerText.includes(k.toLowerCase())) score += 10;
+    for (const k of product.weakKeywords) if (lowerText.includes(k.toLowerCase())) score += 3;
+    if (product.pipeSizeRange !== null) {
+      score += matchPipeSize(extractPipeSize(text), product.pipeSizeRange).matchScore;
+    }
+    score += getOrganizationProductScore(bid.organization, product.id).score;
+    best = Math.max(best, score);
+  }
+
+  return best;
+}
+
+describe(`product matching: ${BID_COUNT} bids × ${PRODUCT_COUNT} products`, () => {
+  bench(
+    'ProductMatcher (compiled)',
+    () => {
+      const matcher = new ProductMatcher(products);
+      for (const bid of bids) matcher.match(bid);
+    },
+    { iterations: 3 }
+  );
+
+  bench(
+    'per-product includes (legacy)',
+    () => {
+      for (const bid of bids) legacyMatch(bid);
+    },
+    { iterations: 1 }
+  );
+});
@@ -0,0 +1,105 @@
+/**
+ * 제품 매칭 엔진 유닛 테스트
+ */
+import { describe, it, expect } from 'vitest';
+import { KeywordAutomaton } from '@/lib/matching/keyword-automaton';
+import {
+  ProductMatcher,
+  matchBidToProducts,
+  batchMatchBids,
+  SAMPLE_BIDS,
+  SAMPLE_PRODUCTS,
+  type Product,
+} from '@/lib/matching/enhanced-matcher';
+
+// ============================================================================
+// KeywordAutomaton
+// ============================================================================
+
+describe('KeywordAutomaton', () => {
+  it('String.includes와 같은 키워드 포함 판정', () => {
+    const keywords = ['유량계', '초음파유량계', '량계', 'DN', '하수', '하수처리', '없음', 'Flow'];
+    const automaton = new KeywordAutomaton(keywords);
+    const texts = ['초음파유량계 DN300', '하수처리장 flow meter', '', '전자식 계량기'];
+
+    for (const text of texts) {
+      const found = new Set(automaton.findAll(text));
+      keywords.forEach((keyword, id) => {
+        expect(found.has(id)).toBe(text.toLowerCase().includes(keyword.toLowerCase()));
+      });
+      expect(automaton.test(text)).toBe(found.size > 0);
+    }
+  });
+
+  it('키워드는 처음 나온 순서로 한 번씩만 반환', () => {
+    const automaton = new KeywordAutomaton(['ab', 'b', 'abc']);
+    expect(automaton.findAll('abcab')).toEqual([0, 1, 2]);
+  });
+
+  it('빈 키워드는 항상 매칭', () => {
+    const automaton = new KeywordAutomaton(['', '없음']);
+    expect(automaton.findAll('')).toEqual([0]);
+    expect(automaton.test('아무 텍스트')).toBe(true);
+  });
+});
+
+// ============================================================================
+// ProductMatcher
+// ============================================================================
+
+describe('ProductMatcher', () => {
+  it('샘플 공고를 해당 제품으로 매칭', () => {
+    const expected: Record<string, [string, number]> = {
+      'BID-001': ['UR-1000PLUS', 99],
+      'BID-002': ['UR-1010PLUS', 116],
+      'BID-003': ['SL-3000PLUS', 96],
+      'BID-004': ['EnerRay', 103],
+      'BID-005': ['UR-1000PLUS', 85],
+      'BID-006': ['MF-1000C', 61],
+    };
+
+    for (const bid of SAMPLE_BIDS) {
+      const result = matchBidToProducts(bid);
+      expect(result.bestMatch?.productId).toBe(expected[bid.id][0]);
+      expect(result.bestMatch?.score).toBe(expected[bid.id][1]);
+      expect(result.recommendation).toBe('BID');
+    }
+  });
+
+  it('매칭 키워드는 카탈로그 순서 유지', () => {
+    const result = matchBidToProducts(SAMPLE_BIDS[0]);
+    expect(result.bestMatch?.reasons.slice(0, 2)).toEqual([
+      '강한 키워드 2개: 초음파유량계, 상수도',
+      '약한 키워드 2개: 유량계, 상수',
+    ]);
+  });
+
+  it('제외 키워드가 있으면 제품 제외', () => {
+    const result = matchBidToProducts(SAMPLE_BIDS[5]);
+    const ultrasonic = result.allMatches.find((m) => m.productId === 'UR-1000PLUS');
+
+    expect(ultrasonic?.score).toBe(0);
+    expect(ultrasonic?.reasons).toEqual(['제외 키워드 발견 - 매칭 불가']);
+  });
+
+  it('사용자 카탈로그 점수 계산', () => {
+    const products: Product[] = [
+      ...SAMPLE_PRODUCTS,
+      {
+        id: 'VALVE-1',
+        name: '제어 밸브',
+        category: '배관',
+        pipeSizeRange: { min: 100, max: 500 },
+        strongKeywords: ['밸브', '펌프'],
+        weakKeywords: ['교체'],
+        excludeKeywords: [],
+      },
+    ];
+
+    const [{ result }] = batchMatchBids([SAMPLE_BIDS[4]], new ProductMatcher(products));
+    const valve = result.allMatches.find((m) => m.productId === 'VALVE-1');
+
+    expect(valve?.breakdown.keywordScore).toBe(23);
+    expect(valve?.breakdown.pipeSizeScore).toBe(25);
+  });
+});
@@ -0,0 +1,220 @@
+/**
+ * 프로세스 내 / 하이브리드 Rate Limiter 유닛 테스트
+ */
+import { describe, it, expect, vi } from 'vitest';
+import {
+  LocalRateLimiter,
+  HybridRateLimiter,
+  parseWindow,
+  type QuotaLeaseRequest,
+  type QuotaLeaseStore,
+  type RateLimitResult,
+} from '@/lib/security/local-rate-limiter';
+
+// ============================================================================
+// 테스트 헬퍼
+// ============================================================================
+
+const MINUTE = 60 * 1000;
+
+const createClock = (start = Date.UTC(2025, 0, 1)) => {
+  let time = start;
+  return {
+    now: () => time,
+    advance: (ms: number) => {
+      time += ms;
+    },
+  };
+};
+
+/** Upstash slidingWindow 스크립트와 같은 계산 (기존 Redis 백엔드 기준값) */
+const createUpstashReference = (tokens: number, windowMs: number) => {
+  const counters = new Map<string, number>();
+  return (identifier: string, now: number): RateLimitResult => {
+    const currentWindow = Math.floor(now / windowMs);
+    const currentKey = `${identifier}:${currentWindow}`;
+    const previousKey = `${identifier}:${currentWindow - 1}`;
+    const reset = (currentWindow + 1) * windowMs;
+
+    const current = counters.get(currentKey) ?? 0;
+    const previous = Math.floor(
+      (1 - (now % windowMs) / windowMs) * (counters.get(previousKey) ?? 0)
+    );
+    if (previous + current >= tokens) {
+      return { success: false, remaining: 0, reset, limit: tokens };
+    }
+
+    counters.set(currentKey, current + 1);
+    return { success: true, remaining: tokens - (current + 1 + previous), reset, limit: tokens };
+  };
+};
+
+/** Redis 임대 스크립트와 같은 계산의 메모리 저장소 */
+const createLeaseStore = (delayMs = 0) => {
+  const counters = new Map<string, number>();
+  const lease = vi.fn(async (request: QuotaLeaseRequest) => {
+    if (delayMs > 0) await new Promise((resolve) => setTimeout(resolve, delayMs));
+
+    const currentKey = `${request.key}:${request.window}`;
+    const current = counters.get(currentKey) ?? 0;
+    const previous = counters.get(`${request.key}:${request.window - 1}`) ?? 0;
+    const used = current + Math.floor(previous * request.previousWeight);
+    const available = request.limit - used;
+    if (available <= 0) return { granted: 0, count: used };
+
+    const granted = Math.min(available, request.size);
+    counters.set(currentKey, current + granted);
+    return { granted, count: used + granted };
+  });
+  return { lease } satisfies QuotaLeaseStore;
+};
+
+// ============================================================================
+// parseWindow
+// ============================================================================
+
+describe('parseWindow', () => {
+  it('윈도우 문자열을 밀리초로 변환', () => {
+    expect(parseWindow('1 m')).toBe(MINUTE);
+    expect(parseWindow('15 m')).toBe(15 * MINUTE);
+    expect(parseWindow('30 s')).toBe(30_000);
+    expect(parseWindow('1 h')).toBe(60 * MINUTE);
+    expect(() => parseWindow('1 week')).toThrow();
+  });
+});
+
+// ============================================================================
+// LocalRateLimiter
+// ============================================================================
+
+describe('LocalRateLimiter', () => {
+  it('요청마다 Upstash 슬라이딩 윈도우와 같은 결과', () => {
+    const clock = createClock();
+    const limiter = new LocalRateLimiter({ requests: 10, windowMs: MINUTE, now: clock.now });
+    const reference = createUpstashReference(10, MINUTE);
+
+    let seed = 42;
+    const rand = () => {
+      seed = (seed * 1103515245 + 12345) % 2147483648;
+      return seed / 2147483648;
+    };
+
+    for (let i = 0; i < 5_000; i++) {
+      clock.advance(Math.floor(rand() * 3_000));
+      const identifier = `ip-${Math.floor(rand() * 5)}`;
+      expect(limiter.check(identifier)).toEqual(reference(identifier, clock.now()));
+    }
+  });
+
+  it('버킷 크기까지 버스트 허용, 시간 경과 후 충전', () => {
+    const clock = createClock();
+    const limiter = new LocalRateLimiter({
+      requests: 5,
+      windowMs: MINUTE,
+      algorithm: 'tokenBucket',
+      now: clock.now,
+    });
+
+    const burst = Array.from({ length: 6 }, () => limiter.check('crawl:ted').success);
+    expect(burst).toEqual([true, true, true, true, true, false]);
+
+    // 12초마다 1개 충전
+    clock.advance(12_000);
+    expect(limiter.check('crawl:ted').success).toBe(true);
+    expect(limiter.check('crawl:ted').success).toBe(false);
+  });
+
+  it('식별자는 최대 maxKeys개까지 유지', () => {
+    const limiter = new LocalRateLimiter({ requests: 10, windowMs: MINUTE, maxKeys: 100 });
+
+    for (let i = 0; i < 1_000; i++) {
+      limiter.check(`ip-${i}`);
+    }
+
+    expect(limiter.size).toBeLessThanOrEqual(100);
+  });
+
+  it('두 윈도우 동안 요청 없는 식별자는 제거', () => {
+    const clock = createClock();
+    const limiter = new LocalRateLimiter({ requests: 10, windowMs: MINUTE, now: clock.now });
+    limiter.check('a');
+    limiter.check('b');
+
+    clock.advance(MINUTE);
+    expect(limiter.prune()).toBe(0);
+
+    clock.advance(MINUTE);
+    expect(limiter.prune()).toBe(2);
+    expect(limiter.size).toBe(0);
+  });
+});
+
+// ============================================================================
+// HybridRateLimiter
+// ============================================================================
+
+describe('HybridRateLimiter', () => {
+  it('여러 인스턴스 합계가 전역 한도를 넘지 않음', async () => {
+    const clock = createClock();
+    const store = createLeaseStore();
+    const instances = Array.from(
+      { length: 3 },
+      () =>
+        new HybridRateLimiter({
+          requests: 100,
+          windowMs: MINUTE,
+          prefix: 'rl:api',
+          store,
+          leaseSize: 10,
+          now: clock.now,
+        })
+    );
+
+    let allowed = 0;
+    for (let i = 0; i < 1_000; i++) {
+      const result = await instances[i % 3].limit('user-1');
+      if (result.success) allowed++;
+    }
+
+    expect(allowed).toBe(100);
+    // 임대 10번 + 인스턴스별 한도 소진 확인 1번
+    expect(store.lease).toHaveBeenCalledTimes(13);
+  });
+
+  it('동시 요청은 받아 둔 lease를 나눠 사용', async () => {
+    const store = createLeaseStore(5);
+    const limiter = new HybridRateLimiter({
+      requests: 100,
+      windowMs: MINUTE,
+      prefix: 'rl:api',
+      store,
+      leaseSize: 10,
+    });
+
+    const results = await Promise.all(Array.from({ length: 20 }, () => limiter.limit('user-1')));
+
+    expect(results.every((r) => r.success)).toBe(true);
+    expect(store.lease).toHaveBeenCalledTimes(2);
+  });
+
+  it('저장소 장애 시 로컬 제한으로 대체', async () => {
+    vi.spyOn(console, 'error').mockImplementation(() => undefined);
+    const clock = createClock();
+    const store = { lease: vi.fn(() => Promise.reject(new Error('Redis 연결 실패'))) };
+    const limiter = new HybridRateLimiter({
+      requests: 3,
+      windowMs: MINUTE,
+      prefix: 'rl:ai',
+      store,
+      now: clock.now,
+    });
+
+    const results = [];
+    for (let i = 0; i < 4; i++) {
+      results.push((await limiter.limit('user-1')).success);
+    }
+
+    expect(results).toEqual([true, true, true, false]);
+    expect(store.lease).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,89 @@
+/**
+ * Rate Limiter 부하 벤치마크
+ *
+ * 요청마다 저장소를 왕복하는 방식(기존 Upstash 백엔드) vs 임대 할당량 하이브리드 vs 프로세스 내 판정
+ * 저장소 왕복은 setTimeout 1ms로 흉내내며, 실제 Upstash REST 왕복은 보통 이보다 길다.
+ *
+ * 실행: pnpm --filter @qetta/web bench
+ */
+
+import { bench, describe } from 'vitest';
+import {
+  HybridRateLimiter,
+  LocalRateLimiter,
+  type QuotaLeaseRequest,
+  type RateLimitBackend,
+} from '@/lib/security/local-rate-limiter';
+
+const MINUTE = 60 * 1000;
+const REQUESTS = 2_000;
+const IDENTIFIERS = 20;
+/** 벤치마크 중 한도에 걸리지 않도록 넉넉한 한도 */
+const LIMIT = 1_000_000;
+
+const roundTrip = () => new Promise((resolve) => setTimeout(resolve, 1));
+
+/** 1ms 왕복 후 임대하는 저장소 */
+const createLeaseStore = () => {
+  const counters = new Map<string, number>();
+  return {
+    async lease({ key, window, limit, size }: QuotaLeaseRequest) {
+      await roundTrip();
+      const current = counters.get(`${key}:${window}`) ?? 0;
+      const granted = Math.max(0, Math.min(size, limit - current));
+      counters.set(`${key}:${window}`, current + granted);
+      return { granted, count: current + granted };
+    },
+  };
+};
+
+/** 요청마다 1ms 왕복하는 기존 방식 */
+const createRoundTripLimiter = (): RateLimitBackend => {
+  const local = new LocalRateLimiter({ requests: LIMIT, windowMs: MINUTE });
+  return {
+    async limit(identifier) {
+      await roundTrip();
+      return local.check(identifier);
+    },
+  };
+};
+
+const run = async (limiter: RateLimitBackend) => {
+  for (let i = 0; i < REQUESTS; i++) {
+    await limiter.limit(`ip-${i % IDENTIFIERS}`);
+  }
+};
+
+describe(`rate limit: ${REQUESTS} sequential checks, ${IDENTIFIERS} identifiers`, () => {
+  bench('per-request round trip (1ms)', () => run(createRoundTripLimiter()), { iterations: 1 });
+
+  bench(
+    'hybrid (leaseSize 100, 1ms lease)',
+    () =>
+      run(
+        new HybridRateLimiter({
+          requests: LIMIT,
+          windowMs: MINUTE,
+          prefix: 'rl:bench',
+          store: createLeaseStore(),
+          leaseSize: 100,
+        })
+      ),
+    { iterations: 3 }
+  );
+
+  bench('in-process sliding window', () =>
+    run(new LocalRateLimiter({ requests: LIMIT, windowMs: MINUTE }))
+  );
+});
+
+describe('in-process limiter: 100k checks over 50k identifiers (maxKeys 10,000)', () => {
+  const limiter = new LocalRateLimiter({ requests: 60, windowMs: MINUTE });
+  let n = 0;
+
+  bench('LocalRateLimiter.check', () => {
+    for (let i = 0; i < 100_000; i++) {
+      limiter.check(`ip-${n++ % 50_000}`);
+    }
+  });
+});
@@ -38,6 +38,7 @@ describe('rate-limiter', () => {
     vi.stubEnv('NODE_ENV', 'development');
     vi.stubEnv('UPSTASH_REDIS_REST_URL', '');
     vi.stubEnv('UPSTASH_REDIS_REST_TOKEN', '');
+    vi.stubEnv('RATE_LIMIT_BACKEND', '');
   });
 
   describe('checkRateLimit', () => {
@@ -58,6 +59,32 @@ describe('rate-limiter', () => {
     });
   });
 
+  describe('프로세스 내 백엔드 (RATE_LIMIT_BACKEND=memory)', () => {
+    it('Redis 없이도 한도 적용', async () => {
+      vi.stubEnv('RATE_LIMIT_BACKEND', 'memory');
+
+      const results = [];
+      for (let i = 0; i < 6; i++) {
+        results.push(await checkAuthRateLimit('memory-backend-ip'));
+      }
+
+      expect(results.map((r) => r.success)).toEqual([true, true, true, true, true, false]);
+      expect(results[0]).toMatchObject({ limit: 5, remaining: 4 });
+      expect(results[5].remaining).toBe(0);
+    });
+
+    it('식별자별로 독립된 한도', async () => {
+      vi.stubEnv('RATE_LIMIT_BACKEND', 'memory');
+
+      for (let i = 0; i < 5; i++) {
+        await checkAuthRateLimit('memory-backend-a');
+      }
+
+      expect((await checkAuthRateLimit('memory-backend-a')).success).toBe(false);
+      expect((await checkAuthRateLimit('memory-backend-b')).success).toBe(true);
+    });
+  });
+
   describe('getUserIdentifier', () => {
     it('사용자 ID 기반 식별자 생성', () => {
       const userId = 'user-123';
@@ -6,7 +6,8 @@
 import { NextResponse } from 'next/server';
 import { withAuth, type AuthenticatedRequest } from '@/lib/security/auth-middleware';
 import { withRateLimit, getEndpointIdentifier } from '@/lib/security/rate-limiter';
-import { listBids } from '@/lib/domain/usecases/bid-usecases';
+import { listBids, iterateBids, BidRepositoryError } from '@/lib/domain/usecases/bid-usecases';
+import { createCSVStream } from '@/lib/spreadsheet/excel-stream';
 import { z } from 'zod';
 import type { ApiResponse, BidData } from '@forge-labs/types/bidding';
 
@@ -29,6 +30,25 @@ const exportSchema = z.object({
   limit: z.coerce.number().min(1).max(10000).default(1000),
 });
 
+/** CSV 스트리밍 시 한 번에 조회할 건수 */
+const EXPORT_PAGE_SIZE = 500;
+
+const CSV_HEADER_MAP: Record<string, string> = {
+  id: 'ID',
+  title: '제목',
+  organization: '발주기관',
+  source: '출처',
+  status: '상태',
+  priority: '우선순위',
+  deadline: '마감일',
+  estimatedAmount: '추정가',
+  type: '유형',
+  keywords: '키워드',
+  url: 'URL',
+  createdAt: '등록일',
+  updatedAt: '수정일',
+};
+
 // ============================================================================
 // 유틸리티 함수
 // ============================================================================
@@ -85,39 +105,40 @@ function bidToRow(bid: BidData, columns: string[]): Record<string, string> {
   return row;
 }
 
-function generateCSV(bids: readonly BidData[], columns: string[]): string {
-  const headerMap: Record<string, string> = {
-    id: 'ID',
-    title: '제목',
-    organization: '발주기관',
-    source: '출처',
-    status: '상태',
-    priority: '우선순위',
-    deadline: '마감일',
-    estimatedAmount: '추정가',
-    type: '유형',
-    keywords: '키워드',
-    url: 'URL',
-    createdAt: '등록일',
-    updatedAt: '수정일',
-  };
+/**
+ * CSV 스트림 생성 (페이지 단위로 조회해 바로 인코딩)
+ * 첫 페이지는 미리 조회해 조회 실패 시 스트리밍 전에 저장소 에러 응답 반환
+ */
+async function generateCSVStream(
+  filters: Record<string, string> | undefined,
+  columns: string[],
+  limit: number
+): Promise<ApiResponse<ReadableStream<Uint8Array>>> {
+  const rest = iterateBids({ filters, pageSize: EXPORT_PAGE_SIZE, maxRows: limit });
+
+  let first: IteratorResult<readonly BidData[]>;
+  try {
+    first = await rest.next();
+  } catch (error) {
+    if (error instanceof BidRepositoryError) {
+      return error.response;
+    }
+    throw error;
+  }
+
+  const pages = (async function* () {
+    if (!first.done) yield first.value;
+    yield* rest;
+  })();
 
-  const headers = columns.map((col) => headerMap[col] || col);
-  const rows = bids.map((bid) => {
-    const row = bidToRow(bid, columns);
-    return columns
-      .map((col) => {
-        const value = row[col] || '';
-        // CSV 이스케이프
-        if (value.includes(',') || value.includes('"') || value.includes('\n')) {
-          return `"${value.replace(/"/g, '""')}"`;
-        }
-        return value;
-      })
-      .join(',');
-  });
-
-  return [headers.join(','), ...rows].join('\n');
+  return {
+    success: true,
+    data: createCSVStream(pages, {
+      columns: columns.map((col) => ({ key: col, header: CSV_HEADER_MAP[col] || col })),
+      transform: (bid: BidData) => bidToRow(bid, columns),
+      bom: false,
+    }),
+  };
 }
 
 // ============================================================================
@@ -160,6 +181,26 @@ async function handlePost(
       'type',
     ];
 
+    // CSV는 페이지 단위로 조회하며 스트리밍
+    if (format === 'csv') {
+      const csvResult = await generateCSVStream(
+        filters as Record<string, string> | undefined,
+        exportColumns,
+        limit
+      );
+
+      if (!csvResult.success) {
+        return NextResponse.json(csvResult, { status: 500 });
+      }
+
+      return new NextResponse(csvResult.data, {
+        headers: {
+          'Content-Type': 'text/csv; charset=utf-8',
+          'Content-Disposition': `attachment; filename="qetta_export_${new Date().toISOString().split('T')[0]}.csv"`,
+        },
+      });
+    }
+
     // 입찰 데이터 조회
     const bidsResult = await listBids({
       filters: filters as Record<string, string> | undefined,
@@ -175,16 +216,6 @@ async function handlePost(
 
     // 포맷별 처리
     switch (format) {
-      case 'csv': {
-        const csv = generateCSV(bids, exportColumns);
-        return new NextResponse(csv, {
-          headers: {
-            'Content-Type': 'text/csv; charset=utf-8',
-            'Content-Disposition': `attachment; filename="qetta_export_${new Date().toISOString().split('T')[0]}.csv"`,
-          },
-        });
-      }
-
       case 'json': {
         const jsonData = bids.map((bid) => bidToRow(bid, exportColumns));
         return NextResponse.json({
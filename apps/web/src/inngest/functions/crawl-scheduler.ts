@@ -4,39 +4,157 @@
  */
 
 import { inngest } from '../client';
-import { NaraJangtoClient, type MappedBid } from '@/lib/clients/narajangto-api';
+import { NaraJangtoClient } from '@/lib/clients/narajangto-api';
+import { getTEDClient } from '@/lib/clients/ted-api';
+import { getSAMGovClient } from '@/lib/clients/sam-gov-api';
 import { getBidRepository } from '@/lib/domain/repositories/bid-repository';
-import { createISODateString, createKRW, type CreateInput, type BidData } from '@/types';
-import { sendNotification, type BidNotificationData } from '@/lib/notifications';
+import {
+  ingestBids,
+  createNaraJangtoTasks,
+  createTEDTasks,
+  createSAMTasks,
+  type BidIngestionOptions,
+  type BidIngestionReport,
+  type IngestionPageTask,
+} from '@/lib/domain/usecases/bid-ingestion';
+import { KeywordAutomaton } from '@/lib/matching/keyword-automaton';
+import {
+  sendNotification,
+  type BidNotificationData,
+  type NotificationChannel,
+  type NotificationPayload,
+  type NotificationResult,
+} from '@/lib/notifications';
 
 // ============================================================================
 // 키워드 필터링 유틸리티
 // ============================================================================
 
 /**
- * 공고가 키워드와 매칭되는지 확인
+ * 키워드 필터 생성 (키워드를 한 번 컴파일해 공고마다 한 번만 스캔)
+ * 키워드가 없으면 모든 공고 포함
  */
-function matchesKeywords(notice: MappedBid, keywords: string[]): boolean {
+function createKeywordFilter(keywords: string[]): BidIngestionOptions['filter'] {
   if (!keywords || keywords.length === 0) {
-    return true; // 키워드가 없으면 모든 공고 포함
+    return undefined;
   }
 
-  const searchText = [notice.title, notice.organization, ...(notice.keywords || [])]
-    .join(' ')
-    .toLowerCase();
+  const automaton = new KeywordAutomaton(keywords);
+  return (notice) =>
+    automaton.test([notice.title, notice.organization, ...(notice.keywords || [])].join(' '));
+}
+
+// ============================================================================
+// 수집/알림 유틸리티
+// ============================================================================
+
+const CRAWL_SOURCES = ['narajangto', 'ted', 'sam'] as const;
+
+type CrawlSource = (typeof CRAWL_SOURCES)[number];
+
+/** 알림 한 건에 담을 최대 공고 수 */
+const NOTIFICATION_BATCH_SIZE = 20;
 
-  return keywords.some((keyword) => searchText.includes(keyword.toLowerCase()));
+/**
+ * 소스별 페이지 작업 구성 (API 키가 없는 소스는 스킵)
+ */
+function buildCrawlTasks(
+  sources: readonly CrawlSource[],
+  fromDate: Date,
+  logger: { warn: (...args: unknown[]) => void }
+): IngestionPageTask[] {
+  const tasks: IngestionPageTask[] = [];
+
+  if (sources.includes('narajangto')) {
+    const apiKey = process.env.NARA_JANGTO_API_KEY;
+    if (apiKey) {
+      tasks.push(...createNaraJangtoTasks(new NaraJangtoClient(apiKey), { fromDate }));
+    } else {
+      logger.warn('나라장터 API 키가 없습니다. 스킵합니다.');
+    }
+  }
+
+  if (sources.includes('ted')) {
+    tasks.push(...createTEDTasks(getTEDClient(), { fromDate }));
+  }
+
+  if (sources.includes('sam')) {
+    if (process.env.SAM_GOV_API_KEY) {
+      tasks.push(...createSAMTasks(getSAMGovClient(), { fromDate }));
+    } else {
+      logger.warn('SAM.gov API 키가 없습니다. 스킵합니다.');
+    }
+  }
+
+  return tasks;
 }
 
 /**
- * 키워드로 공고 필터링
+ * 수집 결과 요약 (Inngest step 결과는 JSON 직렬화되므로 bigint 제외)
  */
-function filterByKeywords(notices: MappedBid[], keywords: string[]): MappedBid[] {
-  if (!keywords || keywords.length === 0) {
-    return notices;
+function summarizeIngestion(report: BidIngestionReport) {
+  const { createdBids, ...summary } = report;
+  const notifications: BidNotificationData[] = createdBids.map((bid) => ({
+    id: bid.externalId,
+    title: bid.title,
+    organization: bid.organization,
+    deadline: bid.deadline,
+    estimatedAmount: bid.estimatedAmount !== null ? Number(bid.estimatedAmount) : null,
+    url: bid.url,
+  }));
+
+  return { ...summary, notifications };
+}
+
+function formatStages(report: Pick<BidIngestionReport, 'stages'>): string {
+  return Object.entries(report.stages)
+    .map(
+      ([stage, stats]) =>
+        `${stage}=${stats.items}건/${stats.activeMs}ms(${stats.itemsPerSecond}/s)`
+    )
+    .join(', ');
+}
+
+/**
+ * 알림 채널 구성 (환경변수로 수신자 설정)
+ */
+function getNotificationTargets(): { channels: NotificationChannel[]; recipients: string[] } {
+  const emailRecipients = (process.env.NOTIFICATION_EMAIL_RECIPIENTS || '')
+    .split(',')
+    .filter(Boolean);
+  const kakaoRecipients = (process.env.NOTIFICATION_KAKAO_RECIPIENTS || '')
+    .split(',')
+    .filter(Boolean);
+
+  // Slack + Email + Kakao
+  const channels: NotificationChannel[] = ['slack'];
+  if (emailRecipients.length > 0) channels.push('email');
+  if (kakaoRecipients.length > 0) channels.push('kakao');
+
+  return { channels, recipients: [...emailRecipients, ...kakaoRecipients] };
+}
+
+/**
+ * 공고를 NOTIFICATION_BATCH_SIZE개씩 나눠 알림 발송
+ */
+async function sendBatchedNotification(
+  type: NotificationPayload['type'],
+  bids: BidNotificationData[]
+): Promise<NotificationResult[]> {
+  const { channels, recipients } = getNotificationTargets();
+  const results: NotificationResult[] = [];
+
+  for (let i = 0; i < bids.length; i += NOTIFICATION_BATCH_SIZE) {
+    results.push(
+      ...(await sendNotification(channels, {
+        type,
+        recipients,
+        bids: bids.slice(i, i + NOTIFICATION_BATCH_SIZE),
+      }))
+    );
   }
 
-  return notices.filter((notice) => matchesKeywords(notice, keywords));
+  return results;
 }
 
 // ============================================================================
@@ -55,116 +173,28 @@ export const scheduledCrawl = inngest.createFunction(
   async ({ step, logger }) => {
     logger.info('크롤링 시작');
 
-    // Step 1: 나라장터 크롤링
-    const naraResults = await step.run('crawl-narajangto', async () => {
-      const apiKey = process.env.NARA_JANGTO_API_KEY;
-      if (!apiKey) {
-        logger.warn('나라장터 API 키가 없습니다. 스킵합니다.');
-        return [];
-      }
-
-      const client = new NaraJangtoClient(apiKey);
+    // Step 1: 나라장터/TED/SAM.gov 수집 + DB 저장
+    const result = await step.run('crawl-and-save', async () => {
       const fromDate = new Date();
       fromDate.setDate(fromDate.getDate() - 7); // 최근 7일
 
-      try {
-        const notices = await client.searchFlowMeterBids({ fromDate });
-        logger.info(`나라장터에서 ${notices.length}건 수집`);
-        return notices;
-      } catch (error) {
-        logger.error('나라장터 크롤링 실패:', error);
-        return [];
-      }
-    });
+      const tasks = buildCrawlTasks(CRAWL_SOURCES, fromDate, logger);
+      const report = await ingestBids(tasks, getBidRepository());
 
-    // Step 2: DB 저장
-    const savedCount = await step.run('save-to-db', async () => {
-      if (naraResults.length === 0) {
-        return 0;
+      logger.info(
+        `${report.fetched}건 수집, ${report.created}건 저장 (중복 ${report.duplicates}, 실패 ${report.failed}) - ${formatStages(report)}`
+      );
+      if (report.errors.length > 0) {
+        logger.warn('수집/저장 오류:', report.errors);
       }
 
-      const repository = getBidRepository();
-      let saved = 0;
-
-      for (const bid of naraResults) {
-        try {
-          // 중복 확인
-          const existing = await repository.findByExternalId('narajangto', bid.external_id);
-          if (existing.success && existing.data) {
-            continue; // 이미 존재하면 스킵
-          }
-
-          // 새 공고 저장 (Inngest 직렬화로 Date가 string으로 변환될 수 있음)
-          const deadlineValue = bid.deadline as unknown;
-          const deadlineStr =
-            typeof deadlineValue === 'string'
-              ? deadlineValue
-              : new Date(deadlineValue as string | number | Date).toISOString();
-
-          const createInput: CreateInput<BidData> = {
-            source: 'narajangto',
-            externalId: bid.external_id,
-            title: bid.title,
-            organization: bid.organization,
-            deadline: createISODateString(deadlineStr),
-            estimatedAmount: bid.estimated_amount ? createKRW(BigInt(bid.estimated_amount)) : null,
-            status: 'new',
-            priority: 'medium',
-            type: 'product',
-            keywords: bid.keywords,
-            url: bid.url,
-            rawData: bid.raw_data,
-          };
-
-          const result = await repository.create(createInput);
-          if (result.success) {
-            saved++;
-          }
-        } catch (error) {
-          logger.error(`저장 실패: ${bid.external_id}`, error);
-        }
-      }
-
-      logger.info(`${saved}건 저장 완료`);
-      return saved;
+      return summarizeIngestion(report);
     });
 
-    // Step 3: 알림 발송 (새 공고가 있는 경우)
-    if (savedCount > 0) {
+    // Step 2: 알림 발송 (새로 저장된 공고만)
+    if (result.notifications.length > 0) {
       await step.run('send-notification', async () => {
-        // 저장된 공고 데이터를 알림용으로 변환
-        const notificationBids: BidNotificationData[] = naraResults
-          .slice(0, savedCount)
-          .map((bid) => ({
-            id: bid.external_id,
-            title: bid.title,
-            organization: bid.organization,
-            deadline:
-              typeof bid.deadline === 'string'
-                ? bid.deadline
-                : new Date(bid.deadline).toISOString(),
-            estimatedAmount: bid.estimated_amount,
-            url: bid.url,
-          }));
-
-        // 알림 채널 구성 (환경변수로 수신자 설정)
-        const emailRecipients = (process.env.NOTIFICATION_EMAIL_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-        const kakaoRecipients = (process.env.NOTIFICATION_KAKAO_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-
-        // Slack + Email + Kakao 알림 발송
-        const channels: ('slack' | 'email' | 'kakao')[] = ['slack'];
-        if (emailRecipients.length > 0) channels.push('email');
-        if (kakaoRecipients.length > 0) channels.push('kakao');
-
-        const results = await sendNotification(channels, {
-          type: 'new_bids',
-          recipients: [...emailRecipients, ...kakaoRecipients],
-          bids: notificationBids,
-        });
+        const results = await sendBatchedNotification('new_bids', result.notifications);
 
         const success = results.filter((r) => r.success).length;
         const failed = results.filter((r) => !r.success);
@@ -181,8 +211,8 @@ export const scheduledCrawl = inngest.createFunction(
 
     return {
       success: true,
-      crawled: naraResults.length,
-      saved: savedCount,
+      crawled: result.fetched,
+      saved: result.created,
     };
   }
 );
@@ -205,137 +235,50 @@ export const manualCrawl = inngest.createFunction(
 
     logger.info(`수동 크롤링 시작: source=${source}, keywords=${keywords.length}개`);
 
-    if (source === 'narajangto' || source === 'all') {
-      // Step 1: 나라장터 크롤링 + 키워드 필터링 + DB 저장
-      const result = await step.run('crawl-filter-save', async () => {
-        const apiKey = process.env.NARA_JANGTO_API_KEY;
-        if (!apiKey) {
-          return {
-            success: false,
-            error: 'API 키 없음',
-            total: 0,
-            filtered: 0,
-            saved: 0,
-            notices: [] as MappedBid[],
-          };
-        }
+    const sources = CRAWL_SOURCES.filter((s) => source === 'all' || source === s);
+    if (sources.length === 0) {
+      return { success: true, message: '크롤링 완료' };
+    }
 
-        const client = new NaraJangtoClient(apiKey);
-        const fromDate = new Date();
-        fromDate.setDate(fromDate.getDate() - 30); // 최근 30일
-
-        // 크롤링
-        const notices = await client.searchFlowMeterBids({ fromDate });
-        const total = notices.length;
-
-        // 키워드 필터링
-        const filtered = filterByKeywords(notices, keywords);
-        logger.info(`키워드 필터링: ${total}건 → ${filtered.length}건`);
-
-        // DB 저장
-        const repository = getBidRepository();
-        let saved = 0;
-        const savedNotices: MappedBid[] = [];
-
-        for (const bid of filtered) {
-          try {
-            // 중복 확인
-            const existing = await repository.findByExternalId('narajangto', bid.external_id);
-            if (existing.success && existing.data) {
-              continue;
-            }
-
-            // 새 공고 저장
-            const deadlineStr =
-              typeof bid.deadline === 'string'
-                ? bid.deadline
-                : new Date(bid.deadline).toISOString();
-
-            const createInput: CreateInput<BidData> = {
-              source: 'narajangto',
-              externalId: bid.external_id,
-              title: bid.title,
-              organization: bid.organization,
-              deadline: createISODateString(deadlineStr),
-              estimatedAmount: bid.estimated_amount
-                ? createKRW(BigInt(bid.estimated_amount))
-                : null,
-              status: 'new',
-              priority: 'medium',
-              type: 'product',
-              keywords: bid.keywords,
-              url: bid.url,
-              rawData: bid.raw_data,
-            };
-
-            const createResult = await repository.create(createInput);
-            if (createResult.success) {
-              saved++;
-              savedNotices.push(bid);
-            }
-          } catch (error) {
-            logger.error(`저장 실패: ${bid.external_id}`, error);
-          }
-        }
+    // Step 1: 크롤링 + 키워드 필터링 + DB 저장
+    const result = await step.run('crawl-filter-save', async () => {
+      const fromDate = new Date();
+      fromDate.setDate(fromDate.getDate() - 30); // 최근 30일
+
+      const tasks = buildCrawlTasks(sources, fromDate, logger);
+      if (tasks.length === 0) {
+        return { success: false as const, error: 'API 키 없음' };
+      }
 
-        return {
-          success: true,
-          total,
-          filtered: filtered.length,
-          saved,
-          notices: savedNotices,
-        };
+      const report = await ingestBids(tasks, getBidRepository(), {
+        filter: createKeywordFilter(keywords),
       });
 
-      if (!result.success) {
-        return { success: false, error: 'error' in result ? result.error : '알 수 없는 오류' };
-      }
+      logger.info(
+        `키워드 필터링: ${report.fetched}건 → ${report.fetched - report.filtered}건, ${report.created}건 저장 - ${formatStages(report)}`
+      );
 
-      // Step 2: 알림 발송 (새 공고가 있는 경우)
-      if (result.saved > 0) {
-        await step.run('send-manual-crawl-notification', async () => {
-          // Inngest JSON 직렬화로 Date가 string이 됨
-          type SerializedBid = Omit<MappedBid, 'deadline'> & { deadline: string };
-          const notificationBids: BidNotificationData[] = (result.notices as SerializedBid[]).map(
-            (bid) => ({
-              id: bid.external_id,
-              title: bid.title,
-              organization: bid.organization,
-              deadline: bid.deadline,
-              estimatedAmount: bid.estimated_amount,
-              url: bid.url,
-            })
-          );
+      return { success: true as const, ...summarizeIngestion(report) };
+    });
 
-          // 알림 채널 구성
-          const emailRecipients = (process.env.NOTIFICATION_EMAIL_RECIPIENTS || '')
-            .split(',')
-            .filter(Boolean);
-          const kakaoRecipients = (process.env.NOTIFICATION_KAKAO_RECIPIENTS || '')
-            .split(',')
-            .filter(Boolean);
-          const channels: ('slack' | 'email' | 'kakao')[] = ['slack'];
-          if (emailRecipients.length > 0) channels.push('email');
-          if (kakaoRecipients.length > 0) channels.push('kakao');
-
-          await sendNotification(channels, {
-            type: 'new_bids',
-            recipients: [...emailRecipients, ...kakaoRecipients],
-            bids: notificationBids,
-          });
-        });
-      }
+    if (!result.success) {
+      return { success: false, error: result.error };
+    }
 
-      return {
-        success: true,
-        total: result.total,
-        filtered: result.filtered,
-        saved: result.saved,
-        keywords: keywords.length > 0 ? keywords : '(전체)',
-      };
+    // Step 2: 알림 발송 (새 공고가 있는 경우)
+    if (result.notifications.length > 0) {
+      await step.run('send-manual-crawl-notification', async () => {
+        await sendBatchedNotification('new_bids', result.notifications);
+      });
     }
 
-    return { success: true, message: '크롤링 완료' };
+    return {
+      success: true,
+      total: result.fetched,
+      filtered: result.fetched - result.filtered,
+      saved: result.created,
+      keywords: keywords.length > 0 ? keywords : '(전체)',
+    };
   }
 );
 
@@ -394,22 +337,7 @@ export const deadlineReminder = inngest.createFunction(
           daysRemaining: 3,
         }));
 
-        // 알림 채널 구성
-        const emailRecipients = (process.env.NOTIFICATION_EMAIL_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-        const kakaoRecipients = (process.env.NOTIFICATION_KAKAO_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-        const channels: ('slack' | 'email' | 'kakao')[] = ['slack'];
-        if (emailRecipients.length > 0) channels.push('email');
-        if (kakaoRecipients.length > 0) channels.push('kakao');
-
-        const results = await sendNotification(channels, {
-          type: 'deadline_d3',
-          recipients: [...emailRecipients, ...kakaoRecipients],
-          bids: notificationBids,
-        });
+        const results = await sendBatchedNotification('deadline_d3', notificationBids);
 
         logger.info(
           `D-3 알림 발송: ${results.filter((r) => r.success).length}/${results.length} 성공`
@@ -430,22 +358,7 @@ export const deadlineReminder = inngest.createFunction(
           daysRemaining: 1,
         }));
 
-        // 알림 채널 구성
-        const emailRecipients = (process.env.NOTIFICATION_EMAIL_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-        const kakaoRecipients = (process.env.NOTIFICATION_KAKAO_RECIPIENTS || '')
-          .split(',')
-          .filter(Boolean);
-        const channels: ('slack' | 'email' | 'kakao')[] = ['slack'];
-        if (emailRecipients.length > 0) channels.push('email');
-        if (kakaoRecipients.length > 0) channels.push('kakao');
-
-        const results = await sendNotification(channels, {
-          type: 'deadline_d1',
-          recipients: [...emailRecipients, ...kakaoRecipients],
-          bids: notificationBids,
-        });
+        const results = await sendBatchedNotification('deadline_d1', notificationBids);
 
         logger.info(
           `D-1 알림 발송: ${results.filter((r) => r.success).length}/${results.length} 성공`
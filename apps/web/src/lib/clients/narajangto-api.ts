@@ -74,6 +74,18 @@ export interface MappedBid {
   raw_data: BidNotice;
 }
 
+/** 유량계/계측기 검색 키워드 */
+export const FLOW_METER_KEYWORDS = [
+  '유량계',
+  '초음파유량계',
+  '전자유량계',
+  '계측기',
+  '수도미터',
+  '열량계',
+  '수도계량기',
+  '유량측정',
+] as const;
+
 // ============================================================================
 // 클라이언트 구현
 // ============================================================================
@@ -184,22 +196,11 @@ export class NaraJangtoClient {
    * 유량계/계측기 관련 입찰 검색
    */
   async searchFlowMeterBids(options?: Omit<SearchOptions, 'keywords'>): Promise<MappedBid[]> {
-    const flowMeterKeywords = [
-      '유량계',
-      '초음파유량계',
-      '전자유량계',
-      '계측기',
-      '수도미터',
-      '열량계',
-      '수도계량기',
-      '유량측정',
-    ];
-
     const allResults: BidNotice[] = [];
     const seen = new Set<string>();
 
     // 각 키워드로 검색
-    for (const keyword of flowMeterKeywords) {
+    for (const keyword of FLOW_METER_KEYWORDS) {
       const results = await this.searchProductBids({
         keywords: [keyword],
         ...options,
@@ -168,6 +168,8 @@ export class SAMGovAPIClient {
     options: {
       fromDate?: Date;
       toDate?: Date;
+      limit?: number;
+      offset?: number;
     } = {}
   ): Promise<SAMOpportunity[]> {
     // 유량계/계량기 관련 키워드
@@ -199,7 +201,8 @@ export class SAMGovAPIClient {
       naicsCode: relatedNAICS,
       postedFrom: this.formatDate(fromDate),
       postedTo: this.formatDate(toDate),
-      limit: 100,
+      limit: options.limit ?? 100,
+      offset: options.offset ?? 0,
     });
 
     return result.opportunitiesData;
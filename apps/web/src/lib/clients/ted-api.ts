@@ -131,6 +131,8 @@ export class TEDAPIClient {
       fromDate?: Date;
       toDate?: Date;
       countries?: string[];
+      pageNum?: number;
+      pageSize?: number;
     } = {}
   ): Promise<TEDNotice[]> {
     // 유량계/계량기 관련 CPV 코드
@@ -155,7 +157,8 @@ export class TEDAPIClient {
         to: this.formatDate(toDate),
       },
       contractType: 'supplies',
-      pageSize: 100,
+      pageNum: options.pageNum ?? 1,
+      pageSize: options.pageSize ?? 100,
     });
 
     // 국가 필터링 (옵션)
@@ -24,6 +24,9 @@ import type {
 
 const isDevelopment = process.env.NODE_ENV !== 'production';
 
+/** findExistingExternalIds의 IN 절 최대 길이 */
+const EXTERNAL_ID_LOOKUP_CHUNK = 200;
+
 // ============================================================================
 // Repository 인터페이스
 // ============================================================================
@@ -54,6 +57,8 @@ export interface IBidRepository {
   update(id: UUID, data: UpdateInput<BidData>): Promise<ApiResponse<BidData>>;
   delete(id: UUID): Promise<ApiResponse<{ deleted: boolean }>>;
   findByExternalId(source: BidSource, externalId: string): Promise<ApiResponse<BidData | null>>;
+  /** 이미 저장된 externalId 목록 (배치 중복 확인) */
+  findExistingExternalIds(source: BidSource, externalIds: string[]): Promise<ApiResponse<string[]>>;
   findUpcoming(days: number): Promise<ApiResponse<BidData[]>>;
   updateStatus(id: UUID, status: BidStatus): Promise<ApiResponse<BidData>>;
   bulkCreate(
@@ -287,6 +292,43 @@ export class SupabaseBidRepository implements IBidRepository {
     }
   }
 
+  async findExistingExternalIds(
+    source: BidSource,
+    externalIds: string[]
+  ): Promise<ApiResponse<string[]>> {
+    try {
+      const existing: string[] = [];
+
+      // IN 절 길이 제한 (URL 길이) 때문에 청크 단위로 조회
+      for (let i = 0; i < externalIds.length; i += EXTERNAL_ID_LOOKUP_CHUNK) {
+        const chunk = externalIds.slice(i, i + EXTERNAL_ID_LOOKUP_CHUNK);
+        const { data, error } = await this.supabase
+          .from('bids')
+          .select('external_id')
+          .eq('source', source)
+          .in('external_id', chunk);
+
+        if (error) {
+          return {
+            success: false,
+            error: { code: 'DB_ERROR', message: error.message },
+          };
+        }
+
+        for (const row of data ?? []) {
+          existing.push(row.external_id as string);
+        }
+      }
+
+      return { success: true, data: existing };
+    } catch (error) {
+      return {
+        success: false,
+        error: { code: 'DB_ERROR', message: String(error) },
+      };
+    }
+  }
+
   async findUpcoming(days: number): Promise<ApiResponse<BidData[]>> {
     try {
       const today = new Date();
@@ -435,8 +477,16 @@ const MOCK_BIDS: BidData[] = [
   },
 ];
 
-class MockBidRepository implements IBidRepository {
-  private bids: BidData[] = [...MOCK_BIDS];
+/**
+ * 인메모리 Repository (개발 모드 + 테스트용)
+ */
+export class MockBidRepository implements IBidRepository {
+  private bids: BidData[];
+  private nextId = 1;
+
+  constructor(initialBids: BidData[] = MOCK_BIDS) {
+    this.bids = [...initialBids];
+  }
 
   async findById(id: UUID): Promise<ApiResponse<BidData>> {
     const bid = this.bids.find((b) => b.id === id);
@@ -499,7 +549,7 @@ class MockBidRepository implements IBidRepository {
   async create(data: CreateInput<BidData>): Promise<ApiResponse<BidData>> {
     const newBid: BidData = {
       ...data,
-      id: `mock-${Date.now()}` as UUID,
+      id: `mock-${Date.now()}-${this.nextId++}` as UUID,
       createdAt: new Date().toISOString() as ISODateString,
       updatedAt: new Date().toISOString() as ISODateString,
     } as BidData;
@@ -543,6 +593,17 @@ class MockBidRepository implements IBidRepository {
     return { success: true, data: bid ?? null };
   }
 
+  async findExistingExternalIds(
+    source: BidSource,
+    externalIds: string[]
+  ): Promise<ApiResponse<string[]>> {
+    const wanted = new Set(externalIds);
+    const existing = this.bids
+      .filter((b) => b.source === source && wanted.has(b.externalId))
+      .map((b) => b.externalId);
+    return { success: true, data: [...new Set(existing)] };
+  }
+
   async findUpcoming(days: number): Promise<ApiResponse<BidData[]>> {
     const now = new Date();
     const future = new Date(now.getTime() + days * 24 * 60 * 60 * 1000);
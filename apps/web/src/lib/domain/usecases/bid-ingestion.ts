@@ -0,0 +1,430 @@
+/**
+ * @module domain/usecases/bid-ingestion
+ * @description 입찰 공고 수집 파이프라인 (페이지 동시 수집 → 배치 중복 확인 → 벌크 저장)
+ */
+
+import type { BidData, BidSource, CreateInput } from '@forge-labs/types/bidding';
+import { createISODateString, createKRW } from '@/types';
+import type { IBidRepository } from '../repositories/bid-repository';
+import {
+  FLOW_METER_KEYWORDS,
+  type MappedBid,
+  type NaraJangtoClient,
+} from '../../clients/narajangto-api';
+import { convertTEDToBidData, type TEDAPIClient } from '../../clients/ted-api';
+import { convertSAMToBidData, type SAMGovAPIClient } from '../../clients/sam-gov-api';
+
+// ============================================================================
+// 타입 정의
+// ============================================================================
+
+/** 수집 페이지 결과 */
+export interface IngestionPage {
+  items: CreateInput<BidData>[];
+  /** 다음 페이지 (없으면 마지막 페이지) */
+  next?: IngestionPageTask;
+}
+
+/** 페이지 하나를 가져오는 작업 */
+export type IngestionPageTask = () => Promise<IngestionPage>;
+
+export interface BidIngestionOptions {
+  /** 동시에 가져올 페이지 수 (기본 3) */
+  concurrency?: number;
+  /** 중복 확인/저장 배치 크기 (기본 100) */
+  batchSize?: number;
+  /** 저장 전 필터 (false면 제외) */
+  filter?: (bid: CreateInput<BidData>) => boolean;
+}
+
+/** 단계별 처리량 */
+export interface IngestionStageStats {
+  items: number;
+  /** 단계가 실행 중이던 시간 (동시 실행 구간은 한 번만 계산) */
+  activeMs: number;
+  itemsPerSecond: number;
+}
+
+export interface BidIngestionReport {
+  pages: number;
+  fetched: number;
+  /** filter로 제외된 건수 */
+  filtered: number;
+  /** 실행 내 중복 + 이미 저장된 공고 */
+  duplicates: number;
+  created: number;
+  failed: number;
+  errors: string[];
+  stages: {
+    fetch: IngestionStageStats;
+    dedup: IngestionStageStats;
+    write: IngestionStageStats;
+  };
+  elapsedMs: number;
+  createdBids: CreateInput<BidData>[];
+}
+
+// ============================================================================
+// 상수
+// ============================================================================
+
+/** 쓰기 대기 배치가 이 수를 넘으면 수집을 잠시 멈춤 */
+const MAX_PENDING_WRITES = 2;
+
+const DEFAULT_MAX_PAGES = 10;
+
+// ============================================================================
+// 단계 타이머
+// ============================================================================
+
+class StageTimer {
+  private items = 0;
+  private activeMs = 0;
+  private running = 0;
+  private since = 0;
+
+  begin(): void {
+    if (this.running++ === 0) {
+      this.since = performance.now();
+    }
+  }
+
+  end(items: number): void {
+    this.items += items;
+    if (--this.running === 0) {
+      this.activeMs += performance.now() - this.since;
+    }
+  }
+
+  toStats(): IngestionStageStats {
+    return {
+      items: this.items,
+      activeMs: Math.round(this.activeMs),
+      itemsPerSecond: this.activeMs > 0 ? Math.round((this.items / this.activeMs) * 1000) : 0,
+    };
+  }
+}
+
+// ============================================================================
+// 파이프라인
+// ============================================================================
+
+/**
+ * 페이지 작업들을 동시 실행하며 새 공고만 배치로 저장
+ *
+ * - 페이지는 최대 concurrency개까지 동시에 가져옴 (next 페이지는 큐에 추가)
+ * - 실행 내 중복은 메모리에서, 기존 공고는 배치 조회 한 번으로 제외
+ * - 저장은 batchSize 단위 bulkCreate, 배치 실패 시 건별 저장으로 재시도
+ */
+export async function ingestBids(
+  tasks: IngestionPageTask[],
+  repository: IBidRepository,
+  options: BidIngestionOptions = {}
+): Promise<BidIngestionReport> {
+  const { concurrency = 3, batchSize = 100, filter } = options;
+  const startedAt = performance.now();
+
+  const fetchStage = new StageTimer();
+  const dedupStage = new StageTimer();
+  const writeStage = new StageTimer();
+
+  const report = {
+    pages: 0,
+    fetched: 0,
+    filtered: 0,
+    duplicates: 0,
+    created: 0,
+    failed: 0,
+    errors: [] as string[],
+    createdBids: [] as CreateInput<BidData>[],
+  };
+
+  const seen = new Set<string>();
+  let buffer: CreateInput<BidData>[] = [];
+  let writeChain: Promise<void> = Promise.resolve();
+  let pendingWrites = 0;
+
+  // 건별 저장 (벌크 실패 시)
+  const createIndividually = async (bids: CreateInput<BidData>[]) => {
+    for (const bid of bids) {
+      const result = await repository.create(bid);
+      if (result.success) {
+        report.created++;
+        report.createdBids.push(bid);
+      } else {
+        report.failed++;
+        report.errors.push(`${bid.source}/${bid.externalId}: ${result.error.message}`);
+      }
+    }
+  };
+
+  const writeSource = async (source: BidSource, bids: CreateInput<BidData>[]) => {
+    dedupStage.begin();
+    const existing = await repository.findExistingExternalIds(
+      source,
+      bids.map((bid) => bid.externalId)
+    );
+    dedupStage.end(bids.length);
+
+    if (!existing.success) {
+      report.failed += bids.length;
+      report.errors.push(`${source}: ${existing.error.message}`);
+      return;
+    }
+
+    const existingIds = new Set(existing.data);
+    const fresh = bids.filter((bid) => !existingIds.has(bid.externalId));
+    report.duplicates += bids.length - fresh.length;
+    if (fresh.length === 0) return;
+
+    writeStage.begin();
+    try {
+      const result = await repository.bulkCreate(fresh);
+
+      if (!result.success) {
+        await createIndividually(fresh);
+      } else if (result.data.failed === 0) {
+        report.created += fresh.length;
+        report.createdBids.push(...fresh);
+      } else {
+        // 일부만 저장된 경우 실제 저장된 공고를 다시 확인
+        const saved = await repository.findExistingExternalIds(
+          source,
+          fresh.map((bid) => bid.externalId)
+        );
+        const savedIds = new Set(saved.success ? saved.data : []);
+        for (const bid of fresh) {
+          if (savedIds.has(bid.externalId)) {
+            report.created++;
+            report.createdBids.push(bid);
+          } else {
+            report.failed++;
+          }
+        }
+      }
+    } finally {
+      writeStage.end(fresh.length);
+    }
+  };
+
+  const writeBatch = async (batch: CreateInput<BidData>[]) => {
+    const bySource = new Map<BidSource, CreateInput<BidData>[]>();
+    for (const bid of batch) {
+      const group = bySource.get(bid.source);
+      if (group) group.push(bid);
+      else bySource.set(bid.source, [bid]);
+    }
+
+    for (const [source, bids] of bySource) {
+      try {
+        await writeSource(source, bids);
+      } catch (error) {
+        report.failed += bids.length;
+        report.errors.push(`${source}: ${error instanceof Error ? error.message : String(error)}`);
+      }
+    }
+  };
+
+  // 쓰기는 한 번에 한 배치씩 순서대로
+  const enqueueWrite = (batch: CreateInput<BidData>[]) => {
+    pendingWrites++;
+    writeChain = writeChain.then(async () => {
+      await writeBatch(batch);
+      pendingWrites--;
+    });
+  };
+
+  const accept = (items: CreateInput<BidData>[]) => {
+    report.fetched += items.length;
+
+    for (const bid of items) {
+      if (filter && !filter(bid)) {
+        report.filtered++;
+        continue;
+      }
+
+      const key = `${bid.source}:${bid.externalId}`;
+      if (seen.has(key)) {
+        report.duplicates++;
+        continue;
+      }
+      seen.add(key);
+      buffer.push(bid);
+    }
+
+    while (buffer.length >= batchSize) {
+      enqueueWrite(buffer.slice(0, batchSize));
+      buffer = buffer.slice(batchSize);
+    }
+  };
+
+  const queue = [...tasks];
+
+  const worker = async () => {
+    for (let task = queue.shift(); task; task = queue.shift()) {
+      fetchStage.begin();
+      let count = 0;
+      try {
+        const page = await task();
+        count = page.items.length;
+        report.pages++;
+        accept(page.items);
+        if (page.next) queue.push(page.next);
+      } catch (error) {
+        report.errors.push(error instanceof Error ? error.message : String(error));
+      } finally {
+        fetchStage.end(count);
+      }
+
+      // 쓰기가 밀리면 수집 속도를 맞춤
+      if (pendingWrites > MAX_PENDING_WRITES) {
+        await writeChain;
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.max(1, Math.min(concurrency, tasks.length)) }, worker)
+  );
+
+  if (buffer.length > 0) {
+    enqueueWrite(buffer);
+    buffer = [];
+  }
+  await writeChain;
+
+  return {
+    ...report,
+    stages: {
+      fetch: fetchStage.toStats(),
+      dedup: dedupStage.toStats(),
+      write: writeStage.toStats(),
+    },
+    elapsedMs: Math.round(performance.now() - startedAt),
+  };
+}
+
+// ============================================================================
+// 소스별 페이지 작업
+// ============================================================================
+
+/**
+ * 나라장터 변환 결과 → 저장 입력
+ * (Inngest 직렬화로 Date가 string으로 변환될 수 있음)
+ */
+export function toBidCreateInput(bid: MappedBid): CreateInput<BidData> {
+  const deadlineValue = bid.deadline as unknown;
+  const deadlineStr =
+    typeof deadlineValue === 'string'
+      ? deadlineValue
+      : new Date(deadlineValue as string | number | Date).toISOString();
+
+  return {
+    source: 'narajangto',
+    externalId: bid.external_id,
+    title: bid.title,
+    organization: bid.organization,
+    deadline: createISODateString(deadlineStr),
+    estimatedAmount: bid.estimated_amount ? createKRW(BigInt(bid.estimated_amount)) : null,
+    status: 'new',
+    priority: 'medium',
+    type: bid.type,
+    keywords: bid.keywords,
+    url: bid.url,
+    rawData: bid.raw_data,
+  };
+}
+
+/**
+ * 나라장터 키워드별 페이지 작업
+ */
+export function createNaraJangtoTasks(
+  client: NaraJangtoClient,
+  options: {
+    fromDate?: Date;
+    keywords?: readonly string[];
+    numOfRows?: number;
+    maxPages?: number;
+  } = {}
+): IngestionPageTask[] {
+  const {
+    fromDate,
+    keywords = FLOW_METER_KEYWORDS,
+    numOfRows = 100,
+    maxPages = DEFAULT_MAX_PAGES,
+  } = options;
+
+  const page =
+    (keyword: string, pageNo: number): IngestionPageTask =>
+    async () => {
+      const notices = await client.searchProductBids({
+        keywords: [keyword],
+        fromDate,
+        pageNo,
+        numOfRows,
+      });
+
+      return {
+        items: notices.map((notice) => toBidCreateInput(client.mapToBid(notice, 'product'))),
+        next:
+          notices.length === numOfRows && pageNo < maxPages
+            ? page(keyword, pageNo + 1)
+            : undefined,
+      };
+    };
+
+  return keywords.map((keyword) => page(keyword, 1));
+}
+
+/**
+ * TED 페이지 작업
+ */
+export function createTEDTasks(
+  client: TEDAPIClient,
+  options: { fromDate?: Date; pageSize?: number; maxPages?: number } = {}
+): IngestionPageTask[] {
+  const { fromDate, pageSize = 100, maxPages = DEFAULT_MAX_PAGES } = options;
+
+  const page =
+    (pageNum: number): IngestionPageTask =>
+    async () => {
+      const notices = await client.searchFlowMeterTenders({ fromDate, pageNum, pageSize });
+
+      return {
+        items: notices.map(convertTEDToBidData),
+        next: notices.length === pageSize && pageNum < maxPages ? page(pageNum + 1) : undefined,
+      };
+    };
+
+  return [page(1)];
+}
+
+/**
+ * SAM.gov 페이지 작업
+ */
+export function createSAMTasks(
+  client: SAMGovAPIClient,
+  options: { fromDate?: Date; limit?: number; maxPages?: number } = {}
+): IngestionPageTask[] {
+  const { fromDate, limit = 100, maxPages = DEFAULT_MAX_PAGES } = options;
+
+  const page =
+    (pageIndex: number): IngestionPageTask =>
+    async () => {
+      const opportunities = await client.searchFlowMeterOpportunities({
+        fromDate,
+        limit,
+        offset: pageIndex * limit,
+      });
+
+      return {
+        items: opportunities.map(convertSAMToBidData),
+        next:
+          opportunities.length === limit && pageIndex + 1 < maxPages
+            ? page(pageIndex + 1)
+            : undefined,
+      };
+    };
+
+  return [page(0)];
+}
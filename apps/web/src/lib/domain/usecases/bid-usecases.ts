@@ -8,6 +8,7 @@ import type {
   UUID,
   BidStatus,
   ApiResponse,
+  ApiErrorResponse,
   ProductMatch,
   PaginatedResult,
   CreateInput,
@@ -16,6 +17,7 @@ import {
   getBidRepository,
   type BidFilters,
   type BidSortOptions,
+  type IBidRepository,
 } from '../repositories/bid-repository';
 import { matchProducts } from '../../clients/product-matcher';
 import { validatePromptInput, sanitizeInput } from '../../security/prompt-guard';
@@ -40,6 +42,54 @@ export async function listBids(params: {
   });
 }
 
+/**
+ * 입찰 목록 순회 중 저장소 조회 실패 (원래 에러 응답 포함)
+ */
+export class BidRepositoryError extends Error {
+  constructor(public readonly response: ApiErrorResponse) {
+    super(response.error.message);
+    this.name = 'BidRepositoryError';
+  }
+}
+
+/**
+ * 입찰 목록을 페이지 단위로 순회 (대량 내보내기용)
+ * 한 번에 pageSize건만 메모리에 올림
+ *
+ * @throws {BidRepositoryError} 저장소 조회 실패 시
+ */
+export async function* iterateBids(params: {
+  filters?: BidFilters;
+  sort?: BidSortOptions;
+  pageSize?: number;
+  /** 최대 건수 (미지정 시 전체) */
+  maxRows?: number;
+  repository?: IBidRepository;
+}): AsyncGenerator<readonly BidData[]> {
+  const repository = params.repository ?? getBidRepository();
+  const pageSize = params.pageSize ?? 500;
+  const maxRows = params.maxRows ?? Infinity;
+  let fetched = 0;
+
+  for (let page = 1; fetched < maxRows; page++) {
+    const result = await repository.findAll(params.filters, params.sort, {
+      page,
+      limit: pageSize,
+    });
+    if (!result.success) {
+      throw new BidRepositoryError(result);
+    }
+
+    const { hasMore } = result.data;
+    const items = result.data.items.slice(0, maxRows - fetched);
+    if (items.length > 0) {
+      fetched += items.length;
+      yield items;
+    }
+    if (!hasMore || result.data.items.length < pageSize) return;
+  }
+}
+
 /**
  * 입찰 상세 조회
  */
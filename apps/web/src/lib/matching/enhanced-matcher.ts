@@ -3,8 +3,9 @@
  * 가중치 기반 키워드 + 규격 + 기관 종합 점수 계산
  */
 
-import { extractPipeSize, matchPipeSize } from './pipe-size-extractor';
-import { getOrganizationProductScore } from './organization-dictionary';
+import { extractPipeSize, matchPipeSize, type PipeSizeResult } from './pipe-size-extractor';
+import { normalizeOrganization, scoreNormalizedOrganization } from './organization-dictionary';
+import { KeywordAutomaton } from './keyword-automaton';
 
 /**
  * 제품 정의
@@ -104,83 +105,79 @@ export interface MatchResult {
 }
 
 /**
- * 키워드 매칭 점수 계산
+ * 모든 제품에 대한 매칭 결과
  */
-function calculateKeywordScore(
-  text: string,
-  product: Product
-): {
+export interface BidMatchResult {
+  bestMatch: MatchResult | null;
+  allMatches: MatchResult[];
+  recommendation: 'BID' | 'REVIEW' | 'SKIP';
+}
+
+/**
+ * 키워드 매칭 결과
+ */
+interface KeywordMatch {
   score: number;
   matchedStrong: string[];
   matchedWeak: string[];
-  hasExclude: boolean;
-} {
-  const lowerText = text.toLowerCase();
-  const matchedStrong: string[] = [];
-  const matchedWeak: string[] = [];
-
-  // 제외 키워드 체크 (최우선)
-  for (const keyword of product.excludeKeywords) {
-    if (lowerText.includes(keyword.toLowerCase())) {
-      return { score: -100, matchedStrong: [], matchedWeak: [], hasExclude: true };
-    }
-  }
+}
 
-  // 강한 키워드 매칭 (10점씩)
-  for (const keyword of product.strongKeywords) {
-    if (lowerText.includes(keyword.toLowerCase())) {
-      matchedStrong.push(keyword);
-    }
-  }
+/**
+ * 공고 단위로 한 번만 계산하는 값 (제품 수와 무관)
+ */
+interface BidContext {
+  fullText: string;
+  organization: ReturnType<typeof normalizeOrganization>;
+  getPipeSize: () => PipeSizeResult;
+}
 
-  // 약한 키워드 매칭 (3점씩)
-  for (const keyword of product.weakKeywords) {
-    if (lowerText.includes(keyword.toLowerCase())) {
-      matchedWeak.push(keyword);
-    }
-  }
+type KeywordKind = 'exclude' | 'strong' | 'weak';
 
-  const strongScore = matchedStrong.length * 10;
-  const weakScore = matchedWeak.length * 3;
-  const totalScore = strongScore + weakScore;
+/**
+ * 키워드 → 제품 역색인 항목
+ */
+interface KeywordPosting {
+  product: number;
+  kind: KeywordKind;
+  /** 제품 키워드 목록 내 위치 (매칭 이유 순서 유지용) */
+  position: number;
+}
 
+/** 기관명 정규화 캐시 최대 크기 */
+const ORGANIZATION_CACHE_SIZE = 10_000;
+
+/**
+ * 제외 키워드가 발견된 제품의 결과
+ */
+function createExcludedResult(product: Product): MatchResult {
   return {
-    score: totalScore,
-    matchedStrong,
-    matchedWeak,
-    hasExclude: false,
+    productId: product.id,
+    productName: product.name,
+    score: 0,
+    confidence: 'none',
+    breakdown: {
+      keywordScore: 0,
+      pipeSizeScore: 0,
+      organizationScore: 0,
+      totalScore: 0,
+    },
+    reasons: ['제외 키워드 발견 - 매칭 불가'],
+    isMatch: false,
   };
 }
 
 /**
  * 단일 제품에 대한 매칭 점수 계산
  */
-function matchProduct(bid: BidAnnouncement, product: Product): MatchResult {
-  const fullText = [bid.title, bid.description || '', bid.organization].join(' ').trim();
-
+function scoreProduct(
+  product: Product,
+  keywordResult: KeywordMatch,
+  bid: BidContext
+): MatchResult {
   const reasons: string[] = [];
   let totalScore = 0;
 
-  // 1. 키워드 매칭 (최대 100점)
-  const keywordResult = calculateKeywordScore(fullText, product);
-
-  if (keywordResult.hasExclude) {
-    return {
-      productId: product.id,
-      productName: product.name,
-      score: 0,
-      confidence: 'none',
-      breakdown: {
-        keywordScore: 0,
-        pipeSizeScore: 0,
-        organizationScore: 0,
-        totalScore: 0,
-      },
-      reasons: ['제외 키워드 발견 - 매칭 불가'],
-      isMatch: false,
-    };
-  }
-
+  // 1. 키워드 매칭 (강한 키워드 10점, 약한 키워드 3점)
   totalScore += keywordResult.score;
 
   if (keywordResult.matchedStrong.length > 0) {
@@ -197,7 +194,7 @@ function matchProduct(bid: BidAnnouncement, product: Product): MatchResult {
   // 2. 파이프 규격 매칭 (최대 25점)
   let pipeSizeScore = 0;
   if (product.pipeSizeRange !== null) {
-    const extracted = extractPipeSize(fullText);
+    const extracted = bid.getPipeSize();
     const matchResult = matchPipeSize(extracted, product.pipeSizeRange);
 
     pipeSizeScore = matchResult.matchScore;
@@ -218,7 +215,7 @@ function matchProduct(bid: BidAnnouncement, product: Product): MatchResult {
   }
 
   // 3. 발주기관 매칭 (최대 50점)
-  const orgResult = getOrganizationProductScore(bid.organization, product.id);
+  const orgResult = scoreNormalizedOrganization(bid.organization, product.id);
   const organizationScore = orgResult.score;
   totalScore += organizationScore;
 
@@ -260,20 +257,18 @@ function matchProduct(bid: BidAnnouncement, product: Product): MatchResult {
 }
 
 /**
- * 모든 제품에 대한 매칭 수행 (AI_MATCH 함수 구현)
+ * 제품별 결과 정렬 + 추천 전략 결정
  */
-export function matchBidToProducts(bid: BidAnnouncement): {
-  bestMatch: MatchResult | null;
-  allMatches: MatchResult[];
-  recommendation: 'BID' | 'REVIEW' | 'SKIP';
-} {
-  const allMatches = SAMPLE_PRODUCTS.map((product) => matchProduct(bid, product));
-
+function summarizeMatches(allMatches: MatchResult[]): BidMatchResult {
   // 점수 기준 정렬
   allMatches.sort((a, b) => b.score - a.score);
 
   const bestMatch = allMatches[0];
 
+  if (!bestMatch) {
+    return { bestMatch: null, allMatches, recommendation: 'SKIP' };
+  }
+
   // 추천 전략
   let recommendation: 'BID' | 'REVIEW' | 'SKIP';
   if (bestMatch.confidence === 'high' && bestMatch.score >= 60) {
@@ -291,6 +286,137 @@ export function matchBidToProducts(bid: BidAnnouncement): {
   };
 }
 
+/**
+ * 제품 카탈로그를 컴파일한 매처
+ *
+ * 모든 제품의 키워드를 하나의 오토마톤으로 묶어 공고 텍스트를 한 번만 훑고,
+ * 규격 추출과 기관 정규화는 공고당 한 번만 계산한다.
+ */
+export class ProductMatcher {
+  private readonly automaton: KeywordAutomaton;
+  /** 패턴 id → 해당 키워드를 가진 제품 목록 */
+  private readonly postings: KeywordPosting[][] = [];
+  private readonly organizationCache = new Map<string, ReturnType<typeof normalizeOrganization>>();
+
+  constructor(private readonly products: readonly Product[] = SAMPLE_PRODUCTS) {
+    const patternIds = new Map<string, number>();
+    const patterns: string[] = [];
+
+    const index = (productIndex: number, keywords: string[], kind: KeywordKind) => {
+      keywords.forEach((keyword, position) => {
+        const pattern = keyword.toLowerCase();
+        let id = patternIds.get(pattern);
+        if (id === undefined) {
+          id = patterns.length;
+          patternIds.set(pattern, id);
+          patterns.push(pattern);
+          this.postings.push([]);
+        }
+        this.postings[id].push({ product: productIndex, kind, position });
+      });
+    };
+
+    products.forEach((product, productIndex) => {
+      index(productIndex, product.excludeKeywords, 'exclude');
+      index(productIndex, product.strongKeywords, 'strong');
+      index(productIndex, product.weakKeywords, 'weak');
+    });
+
+    this.automaton = new KeywordAutomaton(patterns);
+  }
+
+  /**
+   * 공고 하나를 모든 제품과 매칭
+   */
+  match(bid: BidAnnouncement): BidMatchResult {
+    const fullText = [bid.title, bid.description || '', bid.organization].join(' ').trim();
+
+    // 1. 한 번의 스캔으로 모든 제품의 키워드 히트 수집
+    const excluded = new Uint8Array(this.products.length);
+    const strongHits: number[][] = [];
+    const weakHits: number[][] = [];
+
+    for (const id of this.automaton.findAll(fullText)) {
+      for (const { product, kind, position } of this.postings[id]) {
+        if (kind === 'exclude') {
+          excluded[product] = 1;
+        } else {
+          const hits = kind === 'strong' ? strongHits : weakHits;
+          (hits[product] ??= []).push(position);
+        }
+      }
+    }
+
+    // 2. 공고 단위 값은 한 번만 계산
+    let pipeSize: PipeSizeResult | null = null;
+    const context: BidContext = {
+      fullText,
+      organization: this.normalizeOrganization(bid.organization),
+      getPipeSize: () => (pipeSize ??= extractPipeSize(fullText)),
+    };
+
+    // 3. 제품별 점수
+    const allMatches = this.products.map((product, i) => {
+      if (excluded[i]) {
+        return createExcludedResult(product);
+      }
+
+      const matchedStrong = (strongHits[i] ?? [])
+        .sort((a, b) => a - b)
+        .map((position) => product.strongKeywords[position]);
+      const matchedWeak = (weakHits[i] ?? [])
+        .sort((a, b) => a - b)
+        .map((position) => product.weakKeywords[position]);
+
+      return scoreProduct(
+        product,
+        {
+          score: matchedStrong.length * 10 + matchedWeak.length * 3,
+          matchedStrong,
+          matchedWeak,
+        },
+        context
+      );
+    });
+
+    return summarizeMatches(allMatches);
+  }
+
+  /**
+   * 기관명 정규화 (같은 기관명은 캐시 재사용)
+   */
+  private normalizeOrganization(orgName: string): ReturnType<typeof normalizeOrganization> {
+    const cached = this.organizationCache.get(orgName);
+    if (cached) return cached;
+
+    const normalized = normalizeOrganization(orgName);
+    if (this.organizationCache.size >= ORGANIZATION_CACHE_SIZE) {
+      this.organizationCache.delete(this.organizationCache.keys().next().value as string);
+    }
+    this.organizationCache.set(orgName, normalized);
+    return normalized;
+  }
+}
+
+let defaultMatcher: ProductMatcher | null = null;
+
+/**
+ * SAMPLE_PRODUCTS 기본 매처
+ */
+function getDefaultMatcher(): ProductMatcher {
+  return (defaultMatcher ??= new ProductMatcher(SAMPLE_PRODUCTS));
+}
+
+/**
+ * 모든 제품에 대한 매칭 수행 (AI_MATCH 함수 구현)
+ */
+export function matchBidToProducts(
+  bid: BidAnnouncement,
+  matcher: ProductMatcher = getDefaultMatcher()
+): BidMatchResult {
+  return matcher.match(bid);
+}
+
 /**
  * NONE 클래스 판단
  * 모든 제품이 low/none 신뢰도면 NONE
@@ -325,13 +451,16 @@ export function generateMatchSummary(result: {
 /**
  * 배치 매칭 (여러 공고 동시 처리)
  */
-export function batchMatchBids(bids: BidAnnouncement[]): Array<{
+export function batchMatchBids(
+  bids: BidAnnouncement[],
+  matcher: ProductMatcher = getDefaultMatcher()
+): Array<{
   bid: BidAnnouncement;
-  result: ReturnType<typeof matchBidToProducts>;
+  result: BidMatchResult;
 }> {
   return bids.map((bid) => ({
     bid,
-    result: matchBidToProducts(bid),
+    result: matcher.match(bid),
   }));
 }
 
@@ -351,7 +480,7 @@ export interface MatchingStats {
 }
 
 export function calculateMatchingStats(
-  results: Array<ReturnType<typeof matchBidToProducts>>
+  results: BidMatchResult[]
 ): MatchingStats {
   const stats: MatchingStats = {
     total: results.length,
@@ -5,4 +5,5 @@
 export * from './pipe-size-extractor';
 export * from './organization-dictionary';
 export * from './labeling-template';
+export * from './keyword-automaton';
 export * from './enhanced-matcher';
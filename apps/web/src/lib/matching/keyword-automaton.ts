@@ -0,0 +1,145 @@
+/**
+ * 다중 키워드 매칭 오토마톤 (Aho-Corasick)
+ * 키워드 목록을 한 번 컴파일해두고 텍스트를 한 번만 훑어 포함된 키워드를 모두 찾음
+ */
+
+/**
+ * 대소문자 무시 다중 키워드 매처
+ *
+ * `text.toLowerCase().includes(keyword.toLowerCase())`를 키워드마다 반복하는 것과
+ * 같은 결과를 텍스트 길이에 비례하는 시간으로 계산한다.
+ */
+export class KeywordAutomaton {
+  /** (노드 × 65536 + 문자 코드) → 다음 노드 */
+  private readonly transitions = new Map<number, number>();
+  /** 실패 링크 */
+  private readonly fail: Int32Array;
+  /** 노드에서 끝나는 패턴 id (실패 링크 경로 포함) */
+  private readonly outputs: number[][];
+  /** 빈 문자열 패턴 (항상 매칭) */
+  private readonly emptyPatterns: number[] = [];
+  private readonly seen: Uint32Array;
+  private generation = 0;
+
+  constructor(patterns: readonly string[]) {
+    const outputs: number[][] = [[]];
+
+    // 1. 트라이 구성
+    patterns.forEach((pattern, id) => {
+      const lower = pattern.toLowerCase();
+      if (lower.length === 0) {
+        this.emptyPatterns.push(id);
+        return;
+      }
+
+      let node = 0;
+      for (let i = 0; i < lower.length; i++) {
+        const key = node * 65536 + lower.charCodeAt(i);
+        let next = this.transitions.get(key);
+        if (next === undefined) {
+          next = outputs.length;
+          outputs.push([]);
+          this.transitions.set(key, next);
+        }
+        node = next;
+      }
+      outputs[node].push(id);
+    });
+
+    // 2. BFS로 실패 링크 계산 (트라이 간선은 삽입 순서상 부모가 먼저)
+    const children: Array<Array<[number, number]>> = outputs.map(() => []);
+    for (const [key, child] of this.transitions) {
+      children[Math.floor(key / 65536)].push([key % 65536, child]);
+    }
+
+    const fail = new Int32Array(outputs.length);
+    const queue: number[] = [];
+    for (const [, child] of children[0]) {
+      queue.push(child);
+    }
+
+    for (let head = 0; head < queue.length; head++) {
+      const node = queue[head];
+      for (const [code, child] of children[node]) {
+        let state = fail[node];
+        let target = this.transitions.get(state * 65536 + code);
+        while (target === undefined && state !== 0) {
+          state = fail[state];
+          target = this.transitions.get(state * 65536 + code);
+        }
+        fail[child] = target ?? 0;
+        if (outputs[fail[child]].length > 0) {
+          outputs[child] = outputs[child].concat(outputs[fail[child]]);
+        }
+        queue.push(child);
+      }
+    }
+
+    this.fail = fail;
+    this.outputs = outputs;
+    this.seen = new Uint32Array(patterns.length);
+  }
+
+  /**
+   * 텍스트에 포함된 패턴 id 목록 (중복 없음, 처음 발견된 순서)
+   */
+  findAll(text: string): number[] {
+    const found = [...this.emptyPatterns];
+    if (!text) return found;
+
+    // 같은 패턴 중복 보고 방지 (세대 번호로 배열 재사용)
+    if (++this.generation === 0xffffffff) {
+      this.seen.fill(0);
+      this.generation = 1;
+    }
+    const generation = this.generation;
+
+    const lower = text.toLowerCase();
+    let node = 0;
+
+    for (let i = 0; i < lower.length; i++) {
+      const code = lower.charCodeAt(i);
+      let next = this.transitions.get(node * 65536 + code);
+      while (next === undefined && node !== 0) {
+        node = this.fail[node];
+        next = this.transitions.get(node * 65536 + code);
+      }
+      node = next ?? 0;
+
+      const output = this.outputs[node];
+      for (let j = 0; j < output.length; j++) {
+        const id = output[j];
+        if (this.seen[id] !== generation) {
+          this.seen[id] = generation;
+          found.push(id);
+        }
+      }
+    }
+
+    return found;
+  }
+
+  /**
+   * 패턴이 하나라도 포함되는지 확인
+   */
+  test(text: string): boolean {
+    if (this.emptyPatterns.length > 0) return true;
+    if (!text) return false;
+
+    const lower = text.toLowerCase();
+    let node = 0;
+
+    for (let i = 0; i < lower.length; i++) {
+      const code = lower.charCodeAt(i);
+      let next = this.transitions.get(node * 65536 + code);
+      while (next === undefined && node !== 0) {
+        node = this.fail[node];
+        next = this.transitions.get(node * 65536 + code);
+      }
+      node = next ?? 0;
+      if (this.outputs[node].length > 0) return true;
+    }
+
+    return false;
+  }
+}
@@ -231,7 +231,22 @@ export function getOrganizationProductScore(
   isRelated: boolean;
   reason: string;
 } {
-  const { canonical, entry, confidence } = normalizeOrganization(orgName);
+  return scoreNormalizedOrganization(normalizeOrganization(orgName), productId);
+}
+
+/**
+ * 정규화된 기관과 제품의 연관도 점수 계산
+ * (같은 기관을 여러 제품과 비교할 때 정규화를 한 번만 하기 위함)
+ */
+export function scoreNormalizedOrganization(
+  normalized: ReturnType<typeof normalizeOrganization>,
+  productId: string
+): {
+  score: number;
+  isRelated: boolean;
+  reason: string;
+} {
+  const { canonical, entry, confidence } = normalized;
 
   if (!entry) {
     return {
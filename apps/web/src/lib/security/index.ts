@@ -16,6 +16,16 @@ export {
   getUserIdentifier,
   getEndpointIdentifier,
 } from './rate-limiter';
+export {
+  LocalRateLimiter,
+  HybridRateLimiter,
+  createRedisLeaseStore,
+  parseWindow,
+  type RateLimitResult,
+  type RateLimitBackend,
+  type RateLimitAlgorithm,
+  type QuotaLeaseStore,
+} from './local-rate-limiter';
 
 // CSRF 보호
 export {
@@ -0,0 +1,458 @@
+/**
+ * @module security/local-rate-limiter
+ * @description 프로세스 내 Rate Limiter (슬라이딩 윈도우/토큰 버킷) 및 Redis 임대 할당량 기반 하이브리드 Limiter
+ */
+
+// ============================================================================
+// 타입 정의
+// ============================================================================
+
+export interface RateLimitResult {
+  success: boolean;
+  remaining: number;
+  reset: number;
+  limit: number;
+}
+
+/**
+ * Rate Limit 백엔드 (Upstash Ratelimit과 같은 형태)
+ */
+export interface RateLimitBackend {
+  limit(identifier: string): Promise<RateLimitResult>;
+}
+
+export type RateLimitAlgorithm = 'slidingWindow' | 'tokenBucket';
+
+export interface LocalRateLimiterOptions {
+  /** 윈도우당 허용 요청 수 (토큰 버킷은 버킷 크기) */
+  requests: number;
+  windowMs: number;
+  algorithm?: RateLimitAlgorithm;
+  /** 보관할 최대 식별자 수 (기본 10,000) */
+  maxKeys?: number;
+  now?: () => number;
+}
+
+const DEFAULT_MAX_KEYS = 10_000;
+
+const WINDOW_UNITS: Record<string, number> = {
+  ms: 1,
+  s: 1000,
+  m: 60 * 1000,
+  h: 60 * 60 * 1000,
+  d: 24 * 60 * 60 * 1000,
+};
+
+/**
+ * 윈도우 문자열 → ms ('1 m', '15 m', '1 h')
+ */
+export function parseWindow(window: string): number {
+  const match = /^(\d+)\s*(ms|s|m|h|d)$/.exec(window.trim());
+  if (!match) {
+    throw new Error(`잘못된 윈도우 형식: ${window}`);
+  }
+  return Number(match[1]) * WINDOW_UNITS[match[2]];
+}
+
+// ============================================================================
+// 용량 제한 키 저장소
+// ============================================================================
+
+interface ExpiringEntry {
+  /** 이 시각 이후에는 기본 상태와 같아 버려도 됨 */
+  expiresAt: number;
+}
+
+/**
+ * 최대 maxKeys개를 보관하는 2세대 Map
+ * 현재 세대가 maxKeys / 2개로 차면 이전 세대를 버리고 새 세대를 시작한다.
+ * 이전 세대에서 다시 쓰인 키는 현재 세대로 옮겨지므로, 버려지는 것은 한 세대 동안 쓰이지 않은 키뿐이다.
+ */
+class BoundedKeyMap<T extends ExpiringEntry> {
+  private current = new Map<string, T>();
+  private previous = new Map<string, T>();
+  private readonly generationSize: number;
+
+  constructor(maxKeys: number) {
+    this.generationSize = Math.max(1, Math.floor(maxKeys / 2));
+  }
+
+  get size(): number {
+    return this.current.size + this.previous.size;
+  }
+
+  get(key: string, now: number): T | undefined {
+    let entry = this.current.get(key);
+    if (entry !== undefined) {
+      if (entry.expiresAt > now) return entry;
+      this.current.delete(key);
+      return undefined;
+    }
+
+    entry = this.previous.get(key);
+    if (entry === undefined) return undefined;
+
+    this.previous.delete(key);
+    if (entry.expiresAt <= now) return undefined;
+    this.set(key, entry);
+    return entry;
+  }
+
+  /** 새 키 추가 (get이 undefined를 반환한 키만) */
+  set(key: string, entry: T): void {
+    if (this.current.size >= this.generationSize) {
+      this.previous = this.current;
+      this.current = new Map();
+    }
+    this.current.set(key, entry);
+  }
+
+  /**
+   * 만료 키 전체 제거
+   */
+  sweep(now: number): number {
+    let removed = 0;
+    for (const generation of [this.current, this.previous]) {
+      for (const [key, entry] of generation) {
+        if (entry.expiresAt <= now) {
+          generation.delete(key);
+          removed++;
+        }
+      }
+    }
+    return removed;
+  }
+}
+
+// ============================================================================
+// 프로세스 내 Limiter
+// ============================================================================
+
+interface SlidingWindowEntry extends ExpiringEntry {
+  window: number;
+  current: number;
+  previous: number;
+}
+
+interface TokenBucketEntry extends ExpiringEntry {
+  tokens: number;
+  updatedAt: number;
+}
+
+/**
+ * 프로세스 내 Rate Limiter
+ *
+ * slidingWindow는 Upstash `Ratelimit.slidingWindow`와 같은 계산
+ * (이전 윈도우 요청 수 × 남은 비율 + 현재 윈도우 요청 수)을 메모리에서 수행한다.
+ * 보관 한도를 넘어 버려진 키는 카운트가 초기화되므로 maxKeys는 윈도우 안의 활성 식별자 수보다 넉넉히 잡는다.
+ */
+export class LocalRateLimiter implements RateLimitBackend {
+  private readonly requests: number;
+  private readonly windowMs: number;
+  private readonly algorithm: RateLimitAlgorithm;
+  private readonly now: () => number;
+  private readonly entries: BoundedKeyMap<SlidingWindowEntry | TokenBucketEntry>;
+
+  constructor(options: LocalRateLimiterOptions) {
+    this.requests = options.requests;
+    this.windowMs = options.windowMs;
+    this.algorithm = options.algorithm ?? 'slidingWindow';
+    this.now = options.now ?? Date.now;
+    this.entries = new BoundedKeyMap(options.maxKeys ?? DEFAULT_MAX_KEYS);
+  }
+
+  /** 보관 중인 식별자 수 */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  async limit(identifier: string): Promise<RateLimitResult> {
+    return this.check(identifier);
+  }
+
+  /**
+   * 동기 체크 (요청 1건 소비)
+   */
+  check(identifier: string): RateLimitResult {
+    const now = this.now();
+    return this.algorithm === 'tokenBucket'
+      ? this.checkTokenBucket(identifier, now)
+      : this.checkSlidingWindow(identifier, now);
+  }
+
+  /**
+   * 만료된 식별자 정리
+   * @returns 제거된 수
+   */
+  prune(): number {
+    return this.entries.sweep(this.now());
+  }
+
+  private checkSlidingWindow(identifier: string, now: number): RateLimitResult {
+    const window = Math.floor(now / this.windowMs);
+    const reset = (window + 1) * this.windowMs;
+
+    let entry = this.entries.get(identifier, now) as SlidingWindowEntry | undefined;
+    if (!entry) {
+      entry = { window, current: 0, previous: 0, expiresAt: 0 };
+      this.entries.set(identifier, entry);
+    } else if (entry.window !== window) {
+      entry.previous = entry.window === window - 1 ? entry.current : 0;
+      entry.current = 0;
+      entry.window = window;
+    }
+    // 다음 윈도우까지는 이전 윈도우 가중치로 남음
+    entry.expiresAt = (window + 2) * this.windowMs;
+
+    const weighted = Math.floor((1 - (now % this.windowMs) / this.windowMs) * entry.previous);
+    if (weighted + entry.current >= this.requests) {
+      return { success: false, remaining: 0, reset, limit: this.requests };
+    }
+
+    entry.current++;
+    return {
+      success: true,
+      remaining: this.requests - (entry.current + weighted),
+      reset,
+      limit: this.requests,
+    };
+  }
+
+  private checkTokenBucket(identifier: string, now: number): RateLimitResult {
+    const refillPerMs = this.requests / this.windowMs;
+
+    let entry = this.entries.get(identifier, now) as TokenBucketEntry | undefined;
+    if (!entry) {
+      entry = { tokens: this.requests, updatedAt: now, expiresAt: 0 };
+      this.entries.set(identifier, entry);
+    } else {
+      entry.tokens = Math.min(this.requests, entry.tokens + (now - entry.updatedAt) * refillPerMs);
+      entry.updatedAt = now;
+    }
+
+    const success = entry.tokens >= 1;
+    if (success) entry.tokens -= 1;
+
+    // 버킷이 다 차면 기본 상태와 같음
+    entry.expiresAt = now + Math.ceil((this.requests - entry.tokens) / refillPerMs);
+
+    return {
+      success,
+      remaining: Math.floor(entry.tokens),
+      // 다음 요청이 통과할 수 있는 시각
+      reset: now + Math.ceil(Math.max(0, 1 - entry.tokens) / refillPerMs),
+      limit: this.requests,
+    };
+  }
+}
+
+// ============================================================================
+// 하이브리드 Limiter (임대 할당량 + Redis 일괄 동기화)
+// ============================================================================
+
+export interface QuotaLeaseRequest {
+  /** 식별자 키 (prefix 포함) */
+  key: string;
+  /** 윈도우 번호 (floor(now / windowMs)) */
+  window: number;
+  windowMs: number;
+  limit: number;
+  /** 요청할 할당량 */
+  size: number;
+  /** 이전 윈도우 요청 수에 곱할 가중치 (0~1) */
+  previousWeight: number;
+}
+
+export interface QuotaLease {
+  /** 실제로 임대된 수 (0이면 한도 소진) */
+  granted: number;
+  /** 임대 후 전역 사용량 (이전 윈도우 가중치 포함) */
+  count: number;
+}
+
+/**
+ * 전역 할당량 저장소 (Redis 등)
+ */
+export interface QuotaLeaseStore {
+  lease(request: QuotaLeaseRequest): Promise<QuotaLease>;
+}
+
+/**
+ * 슬라이딩 윈도우 할당량 임대 스크립트
+ * KEYS: 현재/이전 윈도우, ARGV: limit, size, previousWeight, ttlMs
+ */
+const LEASE_SCRIPT = `
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local used = current + math.floor(previous * tonumber(ARGV[3]))
+local available = tonumber(ARGV[1]) - used
+if available <= 0 then
+  return {0, used}
+end
+local granted = math.min(available, tonumber(ARGV[2]))
+redis.call('INCRBY', KEYS[1], granted)
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return {granted, used + granted}
+`;
+
+interface RedisScriptClient {
+  eval<TArgs extends unknown[], TData = unknown>(
+    script: string,
+    keys: string[],
+    args: TArgs
+  ): Promise<TData>;
+}
+
+/**
+ * Redis 할당량 저장소 (Upstash Redis EVAL)
+ */
+export function createRedisLeaseStore(redis: RedisScriptClient): QuotaLeaseStore {
+  return {
+    async lease({ key, window, windowMs, limit, size, previousWeight }) {
+      const [granted, count] = await redis.eval<(string | number)[], [number, number]>(
+        LEASE_SCRIPT,
+        [`${key}:${window}`, `${key}:${window - 1}`],
+        [limit, size, previousWeight, windowMs * 2]
+      );
+      return { granted: Number(granted), count: Number(count) };
+    },
+  };
+}
+
+export interface HybridRateLimiterOptions {
+  requests: number;
+  windowMs: number;
+  /** 저장소 키 prefix */
+  prefix: string;
+  store: QuotaLeaseStore;
+  /** 한 번에 임대할 할당량 (기본 한도의 10%, 최소 1) */
+  leaseSize?: number;
+  /** 한도 소진/저장소 오류 시 저장소 재확인 없이 로컬 판정할 시간 (기본 1초) */
+  denyCacheMs?: number;
+  maxKeys?: number;
+  now?: () => number;
+}
+
+interface LeaseEntry extends ExpiringEntry {
+  window: number;
+  granted: number;
+  used: number;
+  /** 마지막 임대 시점의 전역 사용량 */
+  count: number;
+  /** 한도 소진 시 다음 임대 시도 시각 */
+  retryAt: number;
+  pending: Promise<void> | null;
+}
+
+/**
+ * 하이브리드 Rate Limiter
+ *
+ * 저장소에서 leaseSize만큼 할당량을 미리 임대해 두고 그 안에서는 로컬로 판정한다.
+ * 임대는 전역 한도를 넘지 않으므로 여러 인스턴스 합계도 한도를 넘지 않으며,
+ * 인스턴스가 윈도우 안에 다 쓰지 못한 할당량만큼 실제 허용량이 줄어든다.
+ * 저장소 오류 시에는 denyCacheMs 동안 프로세스 내 Limiter로 판정한다.
+ */
+export class HybridRateLimiter implements RateLimitBackend {
+  private readonly requests: number;
+  private readonly windowMs: number;
+  private readonly prefix: string;
+  private readonly store: QuotaLeaseStore;
+  private readonly leaseSize: number;
+  private readonly denyCacheMs: number;
+  private readonly now: () => number;
+  private readonly entries: BoundedKeyMap<LeaseEntry>;
+  private readonly fallback: LocalRateLimiter;
+  /** 저장소 오류 후 이 시각까지는 저장소를 건너뜀 */
+  private storeRetryAt = 0;
+
+  constructor(options: HybridRateLimiterOptions) {
+    this.requests = options.requests;
+    this.windowMs = options.windowMs;
+    this.prefix = options.prefix;
+    this.store = options.store;
+    this.leaseSize = options.leaseSize ?? Math.max(1, Math.ceil(options.requests / 10));
+    this.denyCacheMs = options.denyCacheMs ?? 1000;
+    this.now = options.now ?? Date.now;
+    this.entries = new BoundedKeyMap(options.maxKeys ?? DEFAULT_MAX_KEYS);
+    this.fallback = new LocalRateLimiter({
+      requests: options.requests,
+      windowMs: options.windowMs,
+      maxKeys: options.maxKeys,
+      now: this.now,
+    });
+  }
+
+  async limit(identifier: string): Promise<RateLimitResult> {
+    for (;;) {
+      const now = this.now();
+      const window = Math.floor(now / this.windowMs);
+      const reset = (window + 1) * this.windowMs;
+
+      let entry = this.entries.get(identifier, now);
+      if (!entry || entry.window !== window) {
+        entry = {
+          window,
+          granted: 0,
+          used: 0,
+          count: 0,
+          retryAt: 0,
+          pending: null,
+          expiresAt: reset,
+        };
+        this.entries.set(identifier, entry);
+      }
+
+      // 임대받은 할당량 안에서는 로컬 판정
+      if (entry.used < entry.granted) {
+        entry.used++;
+        return {
+          success: true,
+          remaining: Math.max(0, this.requests - (entry.count - entry.granted + entry.used)),
+          reset,
+          limit: this.requests,
+        };
+      }
+
+      if (now < entry.retryAt) {
+        return { success: false, remaining: 0, reset, limit: this.requests };
+      }
+
+      if (now < this.storeRetryAt) {
+        return this.fallback.check(identifier);
+      }
+
+      // 같은 식별자의 동시 요청은 임대 한 번을 공유
+      const current = entry;
+      current.pending ??= this.acquire(identifier, current, now).finally(() => {
+        current.pending = null;
+      });
+
+      try {
+        await current.pending;
+      } catch (error) {
+        if (now >= this.storeRetryAt) {
+          console.error('Rate limit 할당량 임대 실패:', error);
+          this.storeRetryAt = now + this.denyCacheMs;
+        }
+        return this.fallback.check(identifier);
+      }
+    }
+  }
+
+  private async acquire(identifier: string, entry: LeaseEntry, now: number): Promise<void> {
+    const lease = await this.store.lease({
+      key: `${this.prefix}:${identifier}`,
+      window: entry.window,
+      windowMs: this.windowMs,
+      limit: this.requests,
+      size: this.leaseSize,
+      previousWeight: 1 - (now % this.windowMs) / this.windowMs,
+    });
+
+    entry.granted += lease.granted;
+    entry.count = lease.count;
+    if (lease.granted === 0) {
+      entry.retryAt = Math.min(now + this.denyCacheMs, entry.expiresAt);
+    }
+  }
+}
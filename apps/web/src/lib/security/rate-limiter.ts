@@ -1,12 +1,21 @@
 /**
  * @module security/rate-limiter
- * @description Rate Limiting 구현 (Upstash Redis 기반)
+ * @description Rate Limiting 구현 (Upstash Redis / 프로세스 내 / 하이브리드 백엔드)
  */
 
 import { Ratelimit } from '@upstash/ratelimit';
 import { Redis } from '@upstash/redis';
 import { NextRequest, NextResponse } from 'next/server';
 import type { ApiErrorResponse } from '@forge-labs/types/bidding';
+import {
+  LocalRateLimiter,
+  HybridRateLimiter,
+  createRedisLeaseStore,
+  parseWindow,
+  type RateLimitAlgorithm,
+  type RateLimitBackend,
+  type RateLimitResult,
+} from './local-rate-limiter';
 
 // ============================================================================
 // 개발 모드 감지
@@ -33,10 +42,11 @@ function getRedis(): Redis | null {
       if (process.env.NODE_ENV === 'development') {
         console.warn('[DEV] Upstash Redis 미설정 - Rate Limiting 비활성화');
       }
-      redisAvailable = false;
-      return null;
+    } else {
+      console.warn('Upstash Redis 미설정 - 프로세스 내 Rate Limiting 사용');
     }
-    throw new Error('Upstash Redis 환경 변수가 설정되지 않았습니다');
+    redisAvailable = false;
+    return null;
   }
 
   redis = new Redis({ url, token });
@@ -49,10 +59,25 @@ function getRedis(): Redis | null {
 
 type RateLimitType = 'default' | 'api' | 'ai' | 'crawling' | 'auth';
 
+/**
+ * Rate Limit 백엔드 종류 (RATE_LIMIT_BACKEND 환경 변수)
+ * - redis: 요청마다 Upstash Redis 조회
+ * - hybrid: Redis에서 할당량을 임대해 로컬 판정 (임대 시에만 Redis 조회)
+ * - memory: 프로세스 내 판정 (인스턴스별 한도)
+ * - off: 비활성화
+ *
+ * 미설정 시 Redis가 있으면 redis, 없으면 개발 모드 off / 프로덕션 memory
+ */
+type RateLimitBackendKind = 'redis' | 'hybrid' | 'memory' | 'off';
+
+const BACKEND_KINDS: readonly RateLimitBackendKind[] = ['redis', 'hybrid', 'memory', 'off'];
+
 interface RateLimitConfig {
   requests: number;
   window: `${number} ${'s' | 'm' | 'h' | 'd'}`;
   prefix: string;
+  /** 프로세스 내 백엔드 알고리즘 (기본 slidingWindow) */
+  algorithm?: RateLimitAlgorithm;
 }
 
 const RATE_LIMIT_CONFIGS: Record<RateLimitType, RateLimitConfig> = {
@@ -63,39 +88,67 @@ const RATE_LIMIT_CONFIGS: Record<RateLimitType, RateLimitConfig> = {
   auth: { requests: 5, window: '15 m', prefix: 'rl:auth' }, // 인증 시도 제한
 };
 
-const rateLimiters = new Map<RateLimitType, Ratelimit>();
+const rateLimiters = new Map<string, RateLimitBackend>();
+
+function getBackendKind(): RateLimitBackendKind {
+  const configured = process.env.RATE_LIMIT_BACKEND as RateLimitBackendKind | undefined;
+  if (configured && BACKEND_KINDS.includes(configured)) {
+    return configured;
+  }
+  if (getRedis()) return 'redis';
+  return isDevelopment ? 'off' : 'memory';
+}
+
+function getRateLimiter(type: RateLimitType): RateLimitBackend | null {
+  const kind = getBackendKind();
+  if (kind === 'off') return null;
 
-function getRateLimiter(type: RateLimitType): Ratelimit | null {
-  const redisClient = getRedis();
-  if (!redisClient) return null;
+  const cacheKey = `${kind}:${type}`;
+  const cached = rateLimiters.get(cacheKey);
+  if (cached) return cached;
 
-  if (rateLimiters.has(type)) {
-    return rateLimiters.get(type)!;
+  const limiter = createRateLimiter(kind, RATE_LIMIT_CONFIGS[type]);
+  rateLimiters.set(cacheKey, limiter);
+  return limiter;
+}
+
+function createRateLimiter(
+  kind: Exclude<RateLimitBackendKind, 'off'>,
+  config: RateLimitConfig
+): RateLimitBackend {
+  const windowMs = parseWindow(config.window);
+  // redis/hybrid인데 Redis 미설정이면 프로세스 내 판정
+  const redisClient = kind === 'memory' ? null : getRedis();
+
+  if (!redisClient) {
+    return new LocalRateLimiter({
+      requests: config.requests,
+      windowMs,
+      algorithm: config.algorithm,
+    });
+  }
+
+  if (kind === 'hybrid') {
+    return new HybridRateLimiter({
+      requests: config.requests,
+      windowMs,
+      prefix: `${config.prefix}:lease`,
+      store: createRedisLeaseStore(redisClient),
+    });
   }
 
-  const config = RATE_LIMIT_CONFIGS[type];
-  const limiter = new Ratelimit({
+  return new Ratelimit({
     redis: redisClient,
     limiter: Ratelimit.slidingWindow(config.requests, config.window),
     prefix: config.prefix,
     analytics: true,
   });
-
-  rateLimiters.set(type, limiter);
-  return limiter;
 }
 
 // ============================================================================
 // Rate Limit 체크 함수
 // ============================================================================
 
-interface RateLimitResult {
-  success: boolean;
-  remaining: number;
-  reset: number;
-  limit: number;
-}
-
 /**
  * Rate Limit 체크
  * @param identifier - 식별자 (IP, 사용자 ID 등)
@@ -108,7 +161,7 @@ export async function checkRateLimit(
   try {
     const limiter = getRateLimiter(type);
 
-    // 개발 모드에서 Redis 미설정 시 항상 통과
+    // 비활성화 (개발 모드에서 Redis 미설정 시 기본값) - 항상 통과
     if (!limiter) {
       return {
         success: true,
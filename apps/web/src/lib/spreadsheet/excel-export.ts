@@ -76,6 +76,135 @@ const SOURCE_MAP: Record<string, string> = {
   manual: '수동입력',
 };
 
+/** CSV 조각 크기 (문자 수) */
+export const CSV_CHUNK_SIZE = 64 * 1024;
+
+/**
+ * 입찰 행 값 변환 (Excel용: 한글 라벨, 키워드 쉼표 구분, 매칭점수 %)
+ */
+export function transformBidRow(
+  row: Record<string, unknown>,
+  columns: ColumnConfig[] = BID_COLUMNS
+): Record<string, unknown> {
+  const transformedRow: Record<string, unknown> = {};
+
+  columns.forEach((col) => {
+    let value = row[col.key];
+
+    // 값 변환
+    if (col.key === 'status' && typeof value === 'string') {
+      value = STATUS_MAP[value] || value;
+    } else if (col.key === 'priority' && typeof value === 'string') {
+      value = PRIORITY_MAP[value] || value;
+    } else if (col.key === 'source' && typeof value === 'string') {
+      value = SOURCE_MAP[value] || value;
+    } else if (col.key === 'keywords' && Array.isArray(value)) {
+      value = value.join(', ');
+    } else if (col.key === 'match_score' && typeof value === 'number') {
+      value = `${Math.round(value * 100)}%`;
+    }
+
+    transformedRow[col.key] = value;
+  });
+
+  return transformedRow;
+}
+
+/**
+ * 입찰 행 값 변환 (CSV용: 한글 라벨, 배열 세미콜론 구분)
+ */
+export function transformBidRowForCSV(
+  row: Record<string, unknown>,
+  columns: ColumnConfig[] = BID_COLUMNS
+): Record<string, unknown> {
+  const transformedRow: Record<string, unknown> = {};
+
+  columns.forEach((col) => {
+    let value = row[col.key];
+
+    // 값 변환
+    if (col.key === 'status' && typeof value === 'string') {
+      value = STATUS_MAP[value] || value;
+    } else if (col.key === 'priority' && typeof value === 'string') {
+      value = PRIORITY_MAP[value] || value;
+    } else if (col.key === 'source' && typeof value === 'string') {
+      value = SOURCE_MAP[value] || value;
+    } else if (Array.isArray(value)) {
+      value = value.join('; ');
+    }
+
+    transformedRow[col.key] = value;
+  });
+
+  return transformedRow;
+}
+
+/**
+ * CSV 값 이스케이프
+ */
+export function escapeCSVValue(value: unknown): string {
+  const str = String(value ?? '');
+  if (str.includes(',') || str.includes('"') || str.includes('\n')) {
+    return `"${str.replace(/"/g, '""')}"`;
+  }
+  return str;
+}
+
+/**
+ * CSV 한 줄 (줄바꿈 제외)
+ */
+export function toCSVLine(
+  row: Record<string, unknown>,
+  columns: Pick<ColumnConfig, 'key'>[] = BID_COLUMNS
+): string {
+  let line = '';
+  for (let i = 0; i < columns.length; i++) {
+    if (i > 0) line += ',';
+    line += escapeCSVValue(row[columns[i].key]);
+  }
+  return line;
+}
+
+/**
+ * CSV 헤더 줄
+ */
+export function toCSVHeader(columns: Pick<ColumnConfig, 'header'>[] = BID_COLUMNS): string {
+  return columns.map((col) => escapeCSVValue(col.header)).join(',');
+}
+
+/**
+ * 이어 쓰던 조각(chunk) 뒤에 행을 줄 단위로 붙이며 chunkSize가 찬 조각을 생성
+ * 다 차지 않은 마지막 조각은 yield하지 않고 반환 (다음 페이지에서 이어 쓰기)
+ */
+export function* encodeCSVLines(
+  rows: Iterable<Record<string, unknown>>,
+  columns: Pick<ColumnConfig, 'key'>[],
+  chunkSize: number,
+  chunk: string
+): Generator<string, string> {
+  for (const row of rows) {
+    chunk += '\n' + toCSVLine(row, columns);
+    if (chunk.length >= chunkSize) {
+      yield chunk;
+      chunk = '';
+    }
+  }
+  return chunk;
+}
+
+/**
+ * CSV 텍스트를 chunkSize 단위 조각으로 생성 (헤더 포함, 마지막 줄바꿈 없음)
+ * 전체를 하나의 문자열로 합치지 않고 Blob/스트림에 조각째 넘기기 위함
+ */
+export function* encodeCSVChunks(
+  rows: Iterable<Record<string, unknown>>,
+  columns: Pick<ColumnConfig, 'key' | 'header'>[] = BID_COLUMNS,
+  chunkSize = CSV_CHUNK_SIZE
+): Generator<string> {
+  const chunk = yield* encodeCSVLines(rows, columns, chunkSize, toCSVHeader(columns));
+  if (chunk) yield chunk;
+}
+
 /**
  * 데이터를 Excel 파일로 내보내기
  */
@@ -110,28 +239,7 @@ export async function exportToExcel(
 
   // 데이터 추가 (값 변환 포함)
   data.forEach((row) => {
-    const transformedRow: Record<string, unknown> = {};
-
-    BID_COLUMNS.forEach((col) => {
-      let value = row[col.key];
-
-      // 값 변환
-      if (col.key === 'status' && typeof value === 'string') {
-        value = STATUS_MAP[value] || value;
-      } else if (col.key === 'priority' && typeof value === 'string') {
-        value = PRIORITY_MAP[value] || value;
-      } else if (col.key === 'source' && typeof value === 'string') {
-        value = SOURCE_MAP[value] || value;
-      } else if (col.key === 'keywords' && Array.isArray(value)) {
-        value = value.join(', ');
-      } else if (col.key === 'match_score' && typeof value === 'number') {
-        value = `${Math.round(value * 100)}%`;
-      }
-
-      transformedRow[col.key] = value;
-    });
-
-    worksheet.addRow(transformedRow);
+    worksheet.addRow(transformBidRow(row));
   });
 
   // 헤더 스타일 적용
@@ -239,39 +347,18 @@ export async function importFromExcel(file: File): Promise<Record<string, unknow
 
 /**
  * CSV로 내보내기
+ * (조각 단위로 Blob에 넘겨 전체 CSV 문자열을 한 번에 만들지 않음)
  */
 export function exportToCSV(
   data: Record<string, unknown>[],
   filename = `Qetta_${new Date().toISOString().split('T')[0]}`
 ): void {
-  const headers = BID_COLUMNS.map((col) => col.header);
-  const rows = data.map((row) =>
-    BID_COLUMNS.map((col) => {
-      let value = row[col.key];
-
-      // 값 변환
-      if (col.key === 'status' && typeof value === 'string') {
-        value = STATUS_MAP[value] || value;
-      } else if (col.key === 'priority' && typeof value === 'string') {
-        value = PRIORITY_MAP[value] || value;
-      } else if (col.key === 'source' && typeof value === 'string') {
-        value = SOURCE_MAP[value] || value;
-      } else if (Array.isArray(value)) {
-        value = value.join('; ');
-      }
-
-      // CSV 이스케이프
-      const str = String(value ?? '');
-      if (str.includes(',') || str.includes('"') || str.includes('\n')) {
-        return `"${str.replace(/"/g, '""')}"`;
-      }
-      return str;
-    }).join(',')
-  );
+  const rows = (function* () {
+    for (const row of data) yield transformBidRowForCSV(row);
+  })();
 
-  const csv = [headers.join(','), ...rows].join('\n');
   const BOM = '\uFEFF'; // UTF-8 BOM for Excel 한글 지원
-  const blob = new Blob([BOM + csv], { type: 'text/csv;charset=utf-8' });
+  const blob = new Blob([BOM, ...encodeCSVChunks(rows)], { type: 'text/csv;charset=utf-8' });
   saveAs(blob, `${filename}.csv`);
 }
 
@@ -292,6 +379,9 @@ const excelExport = {
   importFromExcel,
   exportToCSV,
   exportToJSON,
+  transformBidRow,
+  transformBidRowForCSV,
+  encodeCSVChunks,
   BID_COLUMNS,
 };
 
@@ -0,0 +1,283 @@
+/**
+ * @module ExcelStream
+ * @description 대용량 입찰 목록 스트리밍 내보내기/가져오기 (서버 전용)
+ *
+ * 행을 페이지 단위로 받아 바로 내보내므로 전체 데이터를 메모리에 올리지 않음
+ * - CSV: 조각 단위 인코딩
+ * - .xlsx: ExcelJS 스트리밍 WorkbookWriter / WorkbookReader
+ *
+ * node:stream을 사용하므로 클라이언트 번들에 포함되지 않도록 spreadsheet/index에서 re-export하지 않음
+ */
+
+import { once } from 'node:events';
+import { PassThrough, Readable, type Writable } from 'node:stream';
+import ExcelJS from 'exceljs';
+import {
+  BID_COLUMNS,
+  CSV_CHUNK_SIZE,
+  encodeCSVLines,
+  toCSVHeader,
+  transformBidRow,
+  transformBidRowForCSV,
+  type ColumnConfig,
+  type ExportOptions,
+} from './excel-export';
+
+/** 페이지 단위 행 (예: iterateBids) */
+export type RowPages<T = Record<string, unknown>> = AsyncIterable<readonly T[]>;
+
+export interface StreamExportOptions<T = Record<string, unknown>> {
+  /** 내보낼 컬럼 (기본 BID_COLUMNS) */
+  columns?: ColumnConfig[];
+  /** 원본 행 → 컬럼 키 기준 행 (기본: 입찰 값 한글 변환) */
+  transform?: (row: T) => Record<string, unknown>;
+}
+
+export interface CSVStreamOptions<T = Record<string, unknown>> extends StreamExportOptions<T> {
+  /** UTF-8 BOM 포함 (Excel 한글 호환, 기본 true) */
+  bom?: boolean;
+  chunkSize?: number;
+}
+
+const encoder = new TextEncoder();
+
+/**
+ * Async 조각 → 바이트 ReadableStream (소비자가 읽을 때만 다음 조각 생성)
+ */
+function toReadableStream(chunks: AsyncIterator<string>): ReadableStream<Uint8Array> {
+  return new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      const { value, done } = await chunks.next();
+      if (done) {
+        controller.close();
+      } else {
+        controller.enqueue(encoder.encode(value));
+      }
+    },
+    async cancel() {
+      await chunks.return?.();
+    },
+  });
+}
+
+// ============================================================================
+// CSV
+// ============================================================================
+
+/**
+ * CSV 조각 생성 (헤더 포함, exportToCSV와 같은 형식)
+ */
+export async function* encodeCSVStream<T = Record<string, unknown>>(
+  pages: RowPages<T>,
+  options: CSVStreamOptions<T> = {}
+): AsyncGenerator<string> {
+  const {
+    columns = BID_COLUMNS,
+    transform = transformBidRowForCSV as unknown as (row: T) => Record<string, unknown>,
+    bom = true,
+    chunkSize = CSV_CHUNK_SIZE,
+  } = options;
+
+  // 다 차지 않은 조각은 다음 페이지로 넘겨 이어 씀
+  let chunk = (bom ? '\uFEFF' : '') + toCSVHeader(columns);
+
+  for await (const page of pages) {
+    chunk = yield* encodeCSVLines(transformRows(page, transform), columns, chunkSize, chunk);
+  }
+
+  if (chunk) yield chunk;
+}
+
+function* transformRows<T>(
+  page: readonly T[],
+  transform: (row: T) => Record<string, unknown>
+): Generator<Record<string, unknown>> {
+  for (const row of page) yield transform(row);
+}
+
+/**
+ * CSV 스트리밍 응답 본문 (NextResponse에 그대로 전달)
+ */
+export function createCSVStream<T = Record<string, unknown>>(
+  pages: RowPages<T>,
+  options: CSVStreamOptions<T> = {}
+): ReadableStream<Uint8Array> {
+  return toReadableStream(encodeCSVStream(pages, options));
+}
+
+// ============================================================================
+// Excel (.xlsx)
+// ============================================================================
+
+const BORDER_COLOR = { argb: 'FFE5E7EB' };
+
+/**
+ * .xlsx 스트리밍 쓰기
+ * 행은 페이지마다 커밋되고, 출력이 밀리면 drain까지 다음 페이지를 읽지 않음
+ * (자동 너비는 전체 데이터가 필요하므로 컬럼 width 사용)
+ *
+ * @returns 쓴 데이터 행 수
+ */
+export async function writeExcelStream<T = Record<string, unknown>>(
+  pages: RowPages<T>,
+  output: Writable,
+  options: ExportOptions & StreamExportOptions<T> = {}
+): Promise<number> {
+  const {
+    sheetName = 'Qetta 입찰목록',
+    includeHeaders = true,
+    freezeHeader = true,
+    columns = BID_COLUMNS,
+    transform = transformBidRow as unknown as (row: T) => Record<string, unknown>,
+  } = options;
+
+  const workbook = new ExcelJS.stream.xlsx.WorkbookWriter({
+    stream: output,
+    useStyles: true,
+    // 공유 문자열 표는 전체 문자열을 메모리에 모으므로 사용하지 않음
+    useSharedStrings: false,
+  });
+  workbook.creator = 'Qetta';
+  workbook.created = new Date();
+  workbook.modified = new Date();
+
+  const worksheet = workbook.addWorksheet(sheetName, {
+    views: freezeHeader ? [{ state: 'frozen', ySplit: 1 }] : [],
+  });
+
+  worksheet.columns = columns.map((col) => ({
+    header: col.header,
+    key: col.key,
+    width: col.width || 15,
+  }));
+
+  // 헤더 스타일 적용
+  const headerRow = worksheet.getRow(1);
+  if (includeHeaders) {
+    headerRow.font = { bold: true, color: { argb: 'FFFFFFFF' } };
+    headerRow.fill = {
+      type: 'pattern',
+      pattern: 'solid',
+      fgColor: { argb: 'FF2563EB' }, // Qetta 브랜드 컬러
+    };
+    headerRow.alignment = { vertical: 'middle', horizontal: 'center' };
+    headerRow.height = 25;
+  }
+  headerRow.commit();
+
+  let count = 0;
+  for await (const page of pages) {
+    for (const source of page) {
+      const row = worksheet.addRow(transform(source));
+      const rowNumber = count + 2;
+
+      // 데이터 행 스타일
+      row.eachCell((cell) => {
+        cell.border = {
+          top: { style: 'thin', color: BORDER_COLOR },
+          left: { style: 'thin', color: BORDER_COLOR },
+          bottom: { style: 'thin', color: BORDER_COLOR },
+          right: { style: 'thin', color: BORDER_COLOR },
+        };
+      });
+
+      // 짝수 행 배경색
+      if (rowNumber % 2 === 0) {
+        row.fill = {
+          type: 'pattern',
+          pattern: 'solid',
+          fgColor: { argb: 'FFF9FAFB' },
+        };
+      }
+
+      row.commit();
+      count++;
+    }
+
+    // 출력 backpressure
+    if (output.writableNeedDrain) {
+      await once(output, 'drain');
+    }
+  }
+
+  worksheet.commit();
+  await workbook.commit();
+  return count;
+}
+
+/**
+ * .xlsx 스트리밍 응답 본문 (NextResponse에 그대로 전달)
+ */
+export function createExcelStream<T = Record<string, unknown>>(
+  pages: RowPages<T>,
+  options: ExportOptions & StreamExportOptions<T> = {}
+): ReadableStream<Uint8Array> {
+  const output = new PassThrough();
+  writeExcelStream(pages, output, options).catch((error) => {
+    output.destroy(error instanceof Error ? error : new Error(String(error)));
+  });
+  return Readable.toWeb(output) as unknown as ReadableStream<Uint8Array>;
+}
+
+/**
+ * .xlsx 스트리밍 읽기 (첫 워크시트)
+ * 첫 행을 헤더로 보고 나머지 행을 { 헤더: 값 } 객체로 하나씩 반환 (importFromExcel과 같은 형식)
+ *
+ * @param input - 파일 경로 또는 읽기 스트림
+ */
+export async function* readExcelRows(
+  input: string | Readable
+): AsyncGenerator<Record<string, unknown>> {
+  const workbook = new ExcelJS.stream.xlsx.WorkbookReader(input, {
+    worksheets: 'emit',
+    // Excel이 저장한 파일은 문자열을 공유 문자열 표에 두므로 캐시 필요
+    sharedStrings: 'cache',
+    hyperlinks: 'ignore',
+    styles: 'ignore',
+    entries: 'emit',
+  });
+
+  for await (const worksheet of workbook) {
+    const headers: string[] = [];
+
+    for await (const row of worksheet) {
+      if (row.number === 1) {
+        // 헤더 행
+        row.eachCell((cell, colNumber) => {
+          headers[colNumber - 1] = String(cell.value || '');
+        });
+        continue;
+      }
+
+      // 데이터 행
+      const rowData: Record<string, unknown> = {};
+      row.eachCell((cell, colNumber) => {
+        const header = headers[colNumber - 1];
+        if (header) {
+          rowData[header] = cell.value;
+        }
+      });
+      yield rowData;
+    }
+
+    // 첫 워크시트만
+    return;
+  }
+
+  throw new Error('워크시트를 찾을 수 없습니다.');
+}
+
+/**
+ * 행 → 페이지 묶음 (가져오기 결과를 batch 단위로 저장할 때)
+ */
+export async function* batchRows<T>(rows: AsyncIterable<T>, size: number): RowPages<T> {
+  let batch: T[] = [];
+  for await (const row of rows) {
+    batch.push(row);
+    if (batch.length >= size) {
+      yield batch;
+      batch = [];
+    }
+  }
+  if (batch.length > 0) yield batch;
+}
@@ -0,0 +1,144 @@
+/**
+ * @qetta/core - Candle Store Tests
+ * 구간 인식 캔들 캐시 테스트
+ */
+
+import { describe, it, expect } from 'vitest';
+import { CandleStore, parseCandleTimestamp } from '../services/candle-store';
+import type { HephaitosTypes } from '@qetta/types';
+
+type IOHLCV = HephaitosTypes.IOHLCV;
+
+// ═══════════════════════════════════════════════════════════════
+// 테스트 데이터 헬퍼
+// ═══════════════════════════════════════════════════════════════
+
+const HOUR = 60 * 60 * 1000;
+const BASE = Date.UTC(2024, 0, 1);
+
+const createCandles = (fromHour: number, toHour: number, price: number = 100): IOHLCV[] => {
+  const candles: IOHLCV[] = [];
+  for (let h = fromHour; h <= toHour; h++) {
+    candles.push({
+      timestamp: new Date(BASE + h * HOUR).toISOString(),
+      open: price + h,
+      high: price + h + 1,
+      low: price + h - 1,
+      close: price + h + 0.5,
+      volume: 10 + h,
+    });
+  }
+  return candles;
+};
+
+const at = (hour: number): number => BASE + hour * HOUR;
+
+// ═══════════════════════════════════════════════════════════════
+// parseCandleTimestamp
+// ═══════════════════════════════════════════════════════════════
+
+describe('parseCandleTimestamp', () => {
+  it('시간대 없는 문자열은 UTC로 해석', () => {
+    expect(parseCandleTimestamp('2024-01-01T00:00:00')).toBe(BASE);
+    expect(parseCandleTimestamp('2024-01-01T00:00:00Z')).toBe(BASE);
+    expect(parseCandleTimestamp('2024-01-01T09:00:00+09:00')).toBe(BASE);
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// CandleStore
+// ═══════════════════════════════════════════════════════════════
+
+describe('CandleStore', () => {
+  it('빈 캐시는 요청 구간 전체가 gap', () => {
+    const store = new CandleStore();
+    const result = store.lookup('BTC/USDT-1h', at(0), at(10));
+
+    expect(result.candles).toEqual([]);
+    expect(result.gaps).toEqual([[at(0), at(10)]]);
+  });
+
+  it('캐시된 구간 사이의 gap만 반환', () => {
+    const store = new CandleStore();
+    store.insert('k', at(0), at(5), createCandles(0, 5));
+    store.insert('k', at(10), at(15), createCandles(10, 15));
+
+    const result = store.lookup('k', at(3), at(20));
+
+    expect(result.candles.map((c) => c.open)).toEqual([103, 104, 105, 110, 111, 112, 113, 114, 115]);
+    expect(result.gaps).toEqual([
+      [at(5) + 1, at(10) - 1],
+      [at(15) + 1, at(20)],
+    ]);
+  });
+
+  it('겹치거나 맞닿은 구간은 병합', () => {
+    const store = new CandleStore();
+    store.insert('k', at(0), at(5), createCandles(0, 5));
+    store.insert('k', at(8), at(12), createCandles(8, 12));
+    store.insert('k', at(5) + 1, at(8) - 1, createCandles(6, 7));
+
+    expect(store.segmentCount).toBe(1);
+    expect(store.covers('k', at(0), at(12))).toBe(true);
+    expect(store.lookup('k', at(0), at(12)).candles).toHaveLength(13);
+  });
+
+  it('중복 타임스탬프는 새 데이터로 대체', () => {
+    const store = new CandleStore();
+    store.insert('k', at(0), at(5), createCandles(0, 5, 100));
+    store.insert('k', at(3), at(8), createCandles(3, 8, 200));
+
+    const candles = store.lookup('k', at(0), at(8)).candles;
+
+    expect(candles).toHaveLength(9);
+    expect(candles[2].open).toBe(102);
+    expect(candles[3].open).toBe(203);
+  });
+
+  it('coverage 밖 캔들은 저장하지 않음', () => {
+    const store = new CandleStore();
+    store.insert('k', at(2), at(4), createCandles(0, 6));
+
+    expect(store.lookup('k', at(0), at(6)).candles).toHaveLength(3);
+  });
+
+  it('바이트 예산 초과 시 LRU 구간부터 제거', () => {
+    // 캔들 10개 = 480바이트
+    const store = new CandleStore({ maxBytes: 1000 });
+    store.insert('a', at(0), at(9), createCandles(0, 9));
+    store.insert('b', at(0), at(9), createCandles(0, 9));
+
+    // a를 최근 사용으로 갱신 후 c 추가 → b 제거
+    store.lookup('a', at(0), at(1));
+    store.insert('c', at(0), at(9), createCandles(0, 9));
+
+    expect(store.size).toBeLessThanOrEqual(1000);
+    expect(store.evictionCount).toBe(1);
+    expect(store.covers('a', at(0), at(9))).toBe(true);
+    expect(store.covers('b', at(0), at(9))).toBe(false);
+    expect(store.covers('c', at(0), at(9))).toBe(true);
+  });
+
+  it('serialize/load 왕복', () => {
+    const store = new CandleStore();
+    store.insert('BTC/USDT-1h', at(0), at(23), createCandles(0, 23));
+    store.insert('BTC/USDT-1h', at(48), at(50), createCandles(48, 50));
+    store.insert('ETH/USDT-1d', at(0), at(0), createCandles(0, 0, 2000));
+
+    const restored = new CandleStore();
+    restored.load(store.serialize());
+
+    expect(restored.segmentCount).toBe(3);
+    expect(restored.size).toBe(store.size);
+    expect(restored.lookup('BTC/USDT-1h', at(0), at(50))).toEqual(
+      store.lookup('BTC/USDT-1h', at(0), at(50))
+    );
+    expect(restored.lookup('ETH/USDT-1d', at(0), at(0)).candles[0].open).toBe(2000);
+  });
+
+  it('잘못된 파일은 에러', () => {
+    expect(() => new CandleStore().load(new Uint8Array([1, 2, 3, 4, 5, 6, 7, 8]))).toThrow(
+      'Invalid candle store file'
+    );
+  });
+});
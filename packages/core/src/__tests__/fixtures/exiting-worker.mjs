@@ -0,0 +1,7 @@
+/**
+ * MonteCarloWorkerPool 테스트용 워커 ('error' 없이 바로 종료)
+ */
+
+import { parentPort } from 'node:worker_threads';
+
+parentPort.on('message', () => process.exit(3));
@@ -0,0 +1,18 @@
+/**
+ * MonteCarloWorkerPool 테스트용 워커 (services/monte-carlo-worker.ts와 동일, 빌드 없이 실행)
+ */
+
+import { parentPort } from 'node:worker_threads';
+import { simulateMonteCarloChunk } from '@qetta/utils';
+
+parentPort.on('message', (chunk) => {
+  try {
+    const result = simulateMonteCarloChunk(chunk);
+    parentPort.postMessage({ ok: true, buffer: result.buffer }, [result.buffer]);
+  } catch (error) {
+    parentPort.postMessage({
+      ok: false,
+      error: error instanceof Error ? error.message : String(error),
+    });
+  }
+});
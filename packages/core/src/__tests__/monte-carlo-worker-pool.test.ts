@@ -0,0 +1,97 @@
+/**
+ * @qetta/core - Monte Carlo Worker Pool Tests
+ * 실제 worker_threads 풀로 몬테카를로 VaR 실행 테스트
+ */
+
+import { describe, it, expect, afterAll, vi } from 'vitest';
+import {
+  MONTE_CARLO_CHUNK_SIZE,
+  calculateMonteCarloCVaR,
+  calculateMonteCarloCVaRAsync,
+  calculatePortfolioMonteCarloCVaR,
+  calculatePortfolioMonteCarloCVaRAsync,
+  createSeededRandom,
+} from '@qetta/utils';
+import { MonteCarloWorkerPool } from '../services/monte-carlo-worker-pool';
+
+// 소스(.ts)에서는 기본 워커 진입점을 바로 실행할 수 없으므로 .mjs 워커 사용
+const WORKER_FIXTURE = new URL('./fixtures/monte-carlo-worker.mjs', import.meta.url);
+const EXITING_WORKER_FIXTURE = new URL('./fixtures/exiting-worker.mjs', import.meta.url);
+
+const createReturns = (count: number, seed: number): number[] => {
+  const random = createSeededRandom(seed);
+  return Array.from({ length: count }, () => (random() - 0.5) * 0.04 * Math.sqrt(3));
+};
+
+describe('MonteCarloWorkerPool', () => {
+  const pool = new MonteCarloWorkerPool(2, WORKER_FIXTURE);
+
+  afterAll(async () => {
+    await pool.terminate();
+  });
+
+  it('워커 풀 결과가 동기 계산과 동일', async () => {
+    const returns = createReturns(500, 1);
+    const options = { simulations: MONTE_CARLO_CHUNK_SIZE * 3 + 17, seed: 42 };
+
+    const run = vi.spyOn(pool, 'run');
+
+    const sync = calculateMonteCarloCVaR(returns, 1000000, options);
+    const viaPool = await calculateMonteCarloCVaRAsync(returns, 1000000, { ...options, pool });
+
+    expect(run).toHaveBeenCalledTimes(4);
+    run.mockRestore();
+    expect(viaPool.value).toBe(sync.value);
+    expect(viaPool.cvarValue).toBe(sync.cvarValue);
+  });
+
+  it('다자산 포트폴리오도 동기 계산과 동일', async () => {
+    const assets = [createReturns(300, 2), createReturns(300, 3), createReturns(300, 4)];
+    const weights = [0.5, 0.3, 0.2];
+    const options = { simulations: MONTE_CARLO_CHUNK_SIZE * 2, seed: 7 };
+
+    const sync = calculatePortfolioMonteCarloCVaR(assets, weights, 1000000, undefined, options);
+    const viaPool = await calculatePortfolioMonteCarloCVaRAsync(
+      assets,
+      weights,
+      1000000,
+      undefined,
+      { ...options, pool }
+    );
+
+    expect(viaPool.value).toBe(sync.value);
+    expect(viaPool.cvarValue).toBe(sync.cvarValue);
+  });
+
+  it('종료 후 작업은 거부', async () => {
+    const stopped = new MonteCarloWorkerPool(1, WORKER_FIXTURE);
+    await stopped.terminate();
+
+    await expect(
+      calculateMonteCarloCVaRAsync(createReturns(100, 5), 1000000, {
+        simulations: MONTE_CARLO_CHUNK_SIZE * 2,
+        seed: 1,
+        pool: stopped,
+      })
+    ).rejects.toThrow('terminated');
+  });
+
+  it('error 없이 종료된 워커는 작업을 reject하고 풀에서 제거', async () => {
+    const exiting = new MonteCarloWorkerPool(1, EXITING_WORKER_FIXTURE);
+    const options = {
+      simulations: MONTE_CARLO_CHUNK_SIZE * 2,
+      seed: 3,
+      pool: exiting,
+    };
+
+    await expect(
+      calculateMonteCarloCVaRAsync(createReturns(100, 6), 1000000, options)
+    ).rejects.toThrow('exited with code 3');
+    // 제거된 자리에 새 워커를 띄우므로 다음 작업도 멈추지 않고 끝남
+    await expect(
+      calculateMonteCarloCVaRAsync(createReturns(100, 7), 1000000, options)
+    ).rejects.toThrow('exited with code 3');
+
+    await exiting.terminate();
+  });
+});
@@ -571,6 +571,188 @@ describe('RealPriceDataService', () => {
   });
 });
 
+// ═══════════════════════════════════════════════════════════════
+// RealPriceDataService 구간 캐시 테스트
+// ═══════════════════════════════════════════════════════════════
+
+describe('RealPriceDataService 구간 캐시', () => {
+  const HOUR = 60 * 60 * 1000;
+  const BASE = Date.UTC(2021, 0, 1);
+  const iso = (hour: number) => new Date(BASE + hour * HOUR).toISOString();
+
+  let originalFetch: typeof global.fetch;
+
+  /** URL의 interval/startTime/endTime/limit에 맞춰 Binance klines 생성 */
+  const installBinanceFake = (delayMs: number = 0) => {
+    const fake = vi.fn().mockImplementation(async (url: string) => {
+      const params = new URL(url).searchParams;
+      const interval = params.get('interval') === '1m' ? 60 * 1000 : HOUR;
+      const start = Number(params.get('startTime'));
+      const end = Number(params.get('endTime'));
+      const limit = Number(params.get('limit'));
+
+      const rows: unknown[] = [];
+      for (let ts = Math.ceil(start / interval) * interval; ts <= end && rows.length < limit; ts += interval) {
+        const price = String(100 + (ts - BASE) / interval);
+        rows.push([ts, price, price, price, price, '1', ts + interval - 1, '0', 0, '0', '0', '0']);
+      }
+      if (delayMs > 0) await new Promise((resolve) => setTimeout(resolve, delayMs));
+      return { ok: true, json: () => Promise.resolve(rows) };
+    });
+    global.fetch = fake;
+    return fake;
+  };
+
+  /** to(exclusive)/count에 맞춰 Upbit 1시간 캔들 생성 (최신순, 시간대 없는 UTC 문자열) */
+  const installUpbitFake = () => {
+    const fake = vi.fn().mockImplementation(async (url: string) => {
+      const params = new URL(url).searchParams;
+      const to = Date.parse(params.get('to') ?? new Date(BASE + 1000 * HOUR).toISOString());
+      const count = Number(params.get('count'));
+
+      const rows: unknown[] = [];
+      for (let ts = Math.ceil(to / HOUR) * HOUR - HOUR; rows.length < count; ts -= HOUR) {
+        const price = 100 + (ts - BASE) / HOUR;
+        rows.push({
+          market: params.get('market'),
+          candle_date_time_utc: new Date(ts).toISOString().slice(0, 19),
+          opening_price: price,
+          high_price: price,
+          low_price: price,
+          trade_price: price,
+          candle_acc_trade_volume: 1,
+        });
+      }
+      return { ok: true, json: () => Promise.resolve(rows) };
+    });
+    global.fetch = fake;
+    return fake;
+  };
+
+  beforeEach(() => {
+    originalFetch = global.fetch;
+  });
+
+  afterEach(() => {
+    global.fetch = originalFetch;
+  });
+
+  it('Upbit 캐시+신규 캔들 합친 결과도 모두 ISO 타임스탬프', async () => {
+    const fake = installUpbitFake();
+    const service = new RealPriceDataService();
+
+    await service.getHistoricalPrices('BTC/KRW', '1h', iso(0), iso(23));
+    const result = await service.getHistoricalPrices('BTC/KRW', '1h', iso(12), iso(35));
+
+    expect(fake).toHaveBeenCalledTimes(2);
+    expect(service.getCacheStats().partialHits).toBe(1);
+    expect(result.data?.candles.map((candle) => candle.timestamp)).toEqual(
+      Array.from({ length: 24 }, (_, i) => iso(12 + i))
+    );
+  });
+
+  it('겹치는 기간은 비어 있는 구간만 요청', async () => {
+    const fake = installBinanceFake();
+    const service = new RealPriceDataService();
+
+    await service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(23));
+    const result = await service.getHistoricalPrices('BTC/USDT', '1h', iso(12), iso(35));
+
+    expect(fake).toHaveBeenCalledTimes(2);
+    expect(fake).toHaveBeenCalledWith(expect.stringContaining(`startTime=${BASE + 23 * HOUR + 1}`));
+    expect(result.data?.candles).toHaveLength(24);
+    expect(result.data?.candles[0].timestamp).toBe(iso(12));
+    expect(result.data?.candles[23].timestamp).toBe(iso(35));
+    expect(service.getCacheStats().partialHits).toBe(1);
+  });
+
+  it('1000개 초과 구간은 페이지 단위로 조회', async () => {
+    const fake = installBinanceFake();
+    const service = new RealPriceDataService();
+
+    const result = await service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(2499));
+
+    expect(fake).toHaveBeenCalledTimes(3);
+    expect(result.data?.candles).toHaveLength(2500);
+    expect(service.getCacheStats().fetches).toBe(1);
+  });
+
+  it('동시 요청은 하나의 fetch로 합침', async () => {
+    const fake = installBinanceFake(20);
+    const service = new RealPriceDataService();
+
+    const results = await Promise.all([
+      service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(47)),
+      service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(47)),
+      service.getHistoricalPrices('BTC/USDT', '1h', iso(10), iso(20)),
+    ]);
+
+    expect(fake).toHaveBeenCalledTimes(1);
+    expect(results[1].data?.candles).toHaveLength(48);
+    expect(results[2].data?.candles).toHaveLength(11);
+    expect(service.getCacheStats().coalesced).toBeGreaterThanOrEqual(2);
+  });
+
+  it('상위 타임프레임은 캐시된 하위 캔들에서 리샘플링', async () => {
+    const fake = installBinanceFake();
+    const service = new RealPriceDataService();
+
+    await service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(47));
+    const result = await service.getHistoricalPrices('BTC/USDT', '4h', iso(0), iso(44));
+
+    expect(fake).toHaveBeenCalledTimes(1);
+    expect(result.metadata?.cached).toBe(true);
+    expect(result.data?.candles).toHaveLength(12);
+    expect(result.data?.candles[1]).toEqual({
+      timestamp: iso(4),
+      open: 104,
+      high: 107,
+      low: 104,
+      close: 107,
+      volume: 4,
+    });
+    expect(service.getCacheStats().derived).toBe(1);
+  });
+
+  it('하위 캔들이 구간을 다 덮지 못하면 거래소 조회', async () => {
+    const fake = installBinanceFake();
+    const service = new RealPriceDataService();
+
+    await service.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(10));
+    await service.getHistoricalPrices('BTC/USDT', '4h', iso(0), iso(8));
+
+    expect(fake).toHaveBeenCalledTimes(2);
+    expect(fake).toHaveBeenCalledWith(expect.stringContaining('interval=4h'));
+  });
+
+  it('saveCache/loadCache로 warm start', async () => {
+    const { mkdtemp, rm } = await import('node:fs/promises');
+    const { tmpdir } = await import('node:os');
+    const { join } = await import('node:path');
+    const dir = await mkdtemp(join(tmpdir(), 'qetta-candles-'));
+    const cachePath = join(dir, 'candles.bin');
+
+    try {
+      installBinanceFake();
+      const first = new RealPriceDataService({ cachePath });
+      await first.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(23));
+      await first.saveCache();
+
+      const fake = installBinanceFake();
+      const second = new RealPriceDataService({ cachePath });
+      expect(await second.loadCache()).toBe(true);
+      const result = await second.getHistoricalPrices('BTC/USDT', '1h', iso(0), iso(23));
+
+      expect(fake).toHaveBeenCalledTimes(0);
+      expect(result.data?.candles).toHaveLength(24);
+      expect(second.getCacheStats().hits).toBe(1);
+      expect(await second.loadCache(join(dir, 'missing.bin'))).toBe(false);
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+});
+
 // ═══════════════════════════════════════════════════════════════
 // InMemoryPriceDataService 테스트
 // ═══════════════════════════════════════════════════════════════
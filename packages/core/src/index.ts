@@ -24,11 +24,28 @@ export {
 // L2 Services - Price Data
 export {
   type IPriceDataService,
+  type IRealPriceDataServiceOptions,
+  type IPriceCacheStats,
   InMemoryPriceDataService,
   RealPriceDataService,
   createPriceDataService,
 } from './services/price-data-service.js';
 
+// L2 Services - Candle Store
+export {
+  type ICandleSegment,
+  type ICandleStoreOptions,
+  type ICandleRangeLookup,
+  CandleStore,
+  parseCandleTimestamp,
+} from './services/candle-store.js';
+
+// L2 Services - Monte Carlo Worker Pool
+export {
+  type MonteCarloWorkerMessage,
+  MonteCarloWorkerPool,
+} from './services/monte-carlo-worker-pool.js';
+
 // L2 Repositories - Strategy
 export {
   type IStrategyRepository,
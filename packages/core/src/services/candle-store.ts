@@ -0,0 +1,394 @@
+/**
+ * @qetta/core - Candle Store
+ * L2 (Cells) - 구간 인식 OHLCV 캔들 캐시
+ *
+ * 심볼/타임프레임별로 연속 구간(segment)을 컬럼 배열로 보관:
+ * - 요청 구간 중 비어 있는 부분(gap)만 계산
+ * - 새 구간은 겹치거나 맞닿은 구간과 병합 (타임스탬프 중복 제거)
+ * - 바이트 예산 초과 시 가장 오래 사용되지 않은 구간부터 제거
+ * - 바이너리 컬럼 포맷으로 직렬화 (재시작 후 warm start)
+ */
+
+import type { HephaitosTypes } from '@qetta/types';
+
+type IOHLCV = HephaitosTypes.IOHLCV;
+
+/** 캔들 하나당 바이트 (timestamp + OHLCV, Float64 × 6) */
+const BYTES_PER_CANDLE = 6 * 8;
+
+const FILE_MAGIC = 0x31534351; // 'QCS1' (little-endian)
+
+/**
+ * 연속 구간 (coverage는 양끝 포함 ms)
+ *
+ * coverage 안에 캔들이 없는 시각은 "거래소에 캔들이 없음"을 의미한다.
+ */
+export interface ICandleSegment {
+  start: number;
+  end: number;
+  timestamps: Float64Array;
+  open: Float64Array;
+  high: Float64Array;
+  low: Float64Array;
+  close: Float64Array;
+  volume: Float64Array;
+}
+
+/**
+ * 캔들 스토어 옵션
+ */
+export interface ICandleStoreOptions {
+  /** 최대 메모리 사용량 (바이트, 기본 64MB) */
+  maxBytes?: number;
+}
+
+/**
+ * 구간 조회 결과
+ */
+export interface ICandleRangeLookup {
+  /** 캐시에 있는 캔들 (시간순) */
+  candles: IOHLCV[];
+  /** 캐시에 없는 구간 목록 ([start, end], 양끝 포함 ms) */
+  gaps: Array<[number, number]>;
+}
+
+/**
+ * 타임스탬프 문자열 → ms
+ *
+ * 시간대 표기가 없으면 UTC로 간주 (Upbit candle_date_time_utc 형식)
+ */
+export function parseCandleTimestamp(timestamp: string): number {
+  const hasZone = /(?:Z|[+-]\d{2}:?\d{2})$/i.test(timestamp);
+  const isDateOnly = /^\d{4}-\d{2}-\d{2}$/.test(timestamp);
+  return new Date(hasZone || isDateOnly ? timestamp : `${timestamp}Z`).getTime();
+}
+
+function createSegment(start: number, end: number, length: number): ICandleSegment {
+  return {
+    start,
+    end,
+    timestamps: new Float64Array(length),
+    open: new Float64Array(length),
+    high: new Float64Array(length),
+    low: new Float64Array(length),
+    close: new Float64Array(length),
+    volume: new Float64Array(length),
+  };
+}
+
+function segmentFromCandles(start: number, end: number, candles: IOHLCV[]): ICandleSegment {
+  const rows = candles
+    .map((candle) => ({ ts: parseCandleTimestamp(candle.timestamp), candle }))
+    .filter((row) => row.ts >= start && row.ts <= end)
+    .sort((a, b) => a.ts - b.ts);
+
+  // 같은 타임스탬프는 뒤에 온 캔들 우선
+  const deduped: typeof rows = [];
+  for (const row of rows) {
+    if (deduped.length > 0 && deduped[deduped.length - 1].ts === row.ts) {
+      deduped[deduped.length - 1] = row;
+    } else {
+      deduped.push(row);
+    }
+  }
+
+  const segment = createSegment(start, end, deduped.length);
+  deduped.forEach(({ ts, candle }, i) => {
+    segment.timestamps[i] = ts;
+    segment.open[i] = candle.open;
+    segment.high[i] = candle.high;
+    segment.low[i] = candle.low;
+    segment.close[i] = candle.close;
+    segment.volume[i] = candle.volume;
+  });
+  return segment;
+}
+
+function copyRow(from: ICandleSegment, i: number, to: ICandleSegment, j: number): void {
+  to.timestamps[j] = from.timestamps[i];
+  to.open[j] = from.open[i];
+  to.high[j] = from.high[i];
+  to.low[j] = from.low[i];
+  to.close[j] = from.close[i];
+  to.volume[j] = from.volume[i];
+}
+
+/**
+ * 두 구간 병합 (타임스탬프가 같으면 newer 우선)
+ */
+function mergeSegments(older: ICandleSegment, newer: ICandleSegment): ICandleSegment {
+  const a = older.timestamps;
+  const b = newer.timestamps;
+  const merged = createSegment(
+    Math.min(older.start, newer.start),
+    Math.max(older.end, newer.end),
+    a.length + b.length
+  );
+
+  let i = 0;
+  let j = 0;
+  let k = 0;
+  while (i < a.length || j < b.length) {
+    if (j >= b.length || (i < a.length && a[i] < b[j])) {
+      copyRow(older, i++, merged, k++);
+    } else {
+      if (i < a.length && a[i] === b[j]) i++;
+      copyRow(newer, j++, merged, k++);
+    }
+  }
+
+  return k === merged.timestamps.length ? merged : sliceSegment(merged, 0, k);
+}
+
+function sliceSegment(segment: ICandleSegment, from: number, to: number): ICandleSegment {
+  return {
+    start: segment.start,
+    end: segment.end,
+    timestamps: segment.timestamps.slice(from, to),
+    open: segment.open.slice(from, to),
+    high: segment.high.slice(from, to),
+    low: segment.low.slice(from, to),
+    close: segment.close.slice(from, to),
+    volume: segment.volume.slice(from, to),
+  };
+}
+
+/** 정렬된 배열에서 value 이상인 첫 인덱스 */
+function lowerBound(values: Float64Array, value: number): number {
+  let lo = 0;
+  let hi = values.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (values[mid] < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function segmentBytes(segment: ICandleSegment): number {
+  return segment.timestamps.length * BYTES_PER_CANDLE;
+}
+
+/**
+ * 구간 인식 캔들 스토어
+ */
+export class CandleStore {
+  private series: Map<string, ICandleSegment[]> = new Map();
+  /** LRU 순서 (Map 삽입 순서 = 오래된 순) */
+  private lru: Map<ICandleSegment, string> = new Map();
+  private bytes = 0;
+  private evictions = 0;
+  private readonly maxBytes: number;
+
+  constructor(options: ICandleStoreOptions = {}) {
+    this.maxBytes = options.maxBytes ?? 64 * 1024 * 1024;
+  }
+
+  /** 현재 메모리 사용량 (바이트) */
+  get size(): number {
+    return this.bytes;
+  }
+
+  /** 보유 구간 수 */
+  get segmentCount(): number {
+    return this.lru.size;
+  }
+
+  /** 누적 제거 구간 수 */
+  get evictionCount(): number {
+    return this.evictions;
+  }
+
+  /**
+   * 구간 조회: 캐시된 캔들 + 비어 있는 구간
+   */
+  lookup(key: string, start: number, end: number): ICandleRangeLookup {
+    const candles: IOHLCV[] = [];
+    const gaps: Array<[number, number]> = [];
+    let cursor = start;
+
+    for (const segment of this.series.get(key) ?? []) {
+      if (segment.end < cursor) continue;
+      if (segment.start > end) break;
+
+      if (segment.start > cursor) gaps.push([cursor, segment.start - 1]);
+      this.touch(segment, key);
+
+      const from = lowerBound(segment.timestamps, cursor);
+      const to = lowerBound(segment.timestamps, end + 1);
+      for (let i = from; i < to; i++) {
+        candles.push({
+          timestamp: new Date(segment.timestamps[i]).toISOString(),
+          open: segment.open[i],
+          high: segment.high[i],
+          low: segment.low[i],
+          close: segment.close[i],
+          volume: segment.volume[i],
+        });
+      }
+
+      cursor = segment.end + 1;
+      if (cursor > end) break;
+    }
+
+    if (cursor <= end) gaps.push([cursor, end]);
+    return { candles, gaps };
+  }
+
+  /**
+   * 구간 [start, end]가 모두 캐시되어 있는지
+   */
+  covers(key: string, start: number, end: number): boolean {
+    for (const segment of this.series.get(key) ?? []) {
+      if (segment.start <= start && segment.end >= end) return true;
+      if (segment.start > start) return false;
+    }
+    return false;
+  }
+
+  /**
+   * 구간 [start, end]를 캔들로 채움 (구간 밖 캔들은 무시)
+   */
+  insert(key: string, start: number, end: number, candles: IOHLCV[]): void {
+    if (end < start) return;
+    this.insertSegment(key, segmentFromCandles(start, end, candles));
+    this.evict();
+  }
+
+  /**
+   * 캐시 전체 삭제
+   */
+  clear(): void {
+    this.series.clear();
+    this.lru.clear();
+    this.bytes = 0;
+  }
+
+  /**
+   * 바이너리 컬럼 포맷으로 직렬화
+   *
+   * [magic u32][header 길이 u32][header JSON][8바이트 정렬 패딩][구간별 Float64 컬럼 × 6]
+   */
+  serialize(): Uint8Array {
+    const header: Array<{ key: string; segments: Array<[number, number, number]> }> = [];
+    let columnBytes = 0;
+
+    for (const [key, segments] of this.series) {
+      header.push({
+        key,
+        segments: segments.map((s) => [s.start, s.end, s.timestamps.length]),
+      });
+      for (const segment of segments) columnBytes += segmentBytes(segment);
+    }
+
+    const headerBytes = new TextEncoder().encode(JSON.stringify(header));
+    const dataOffset = Math.ceil((8 + headerBytes.length) / 8) * 8;
+    const buffer = new ArrayBuffer(dataOffset + columnBytes);
+    const view = new DataView(buffer);
+    view.setUint32(0, FILE_MAGIC, true);
+    view.setUint32(4, headerBytes.length, true);
+    new Uint8Array(buffer, 8, headerBytes.length).set(headerBytes);
+
+    let offset = dataOffset;
+    for (const segments of this.series.values()) {
+      for (const segment of segments) {
+        const n = segment.timestamps.length;
+        for (const column of [
+          segment.timestamps,
+          segment.open,
+          segment.high,
+          segment.low,
+          segment.close,
+          segment.volume,
+        ]) {
+          new Float64Array(buffer, offset, n).set(column);
+          offset += n * 8;
+        }
+      }
+    }
+
+    return new Uint8Array(buffer);
+  }
+
+  /**
+   * 직렬화된 캐시 병합 (기존 구간과 겹치면 기존 데이터 우선)
+   */
+  load(bytes: Uint8Array): void {
+    // Float64Array 뷰를 위해 8바이트 정렬된 복사본 사용 (Buffer는 풀을 공유)
+    const buffer = new Uint8Array(bytes).buffer;
+    const view = new DataView(buffer);
+    if (buffer.byteLength < 8 || view.getUint32(0, true) !== FILE_MAGIC) {
+      throw new Error('Invalid candle store file');
+    }
+
+    const headerLength = view.getUint32(4, true);
+    const header = JSON.parse(
+      new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength))
+    ) as Array<{ key: string; segments: Array<[number, number, number]> }>;
+
+    let offset = Math.ceil((8 + headerLength) / 8) * 8;
+    for (const { key, segments } of header) {
+      for (const [start, end, n] of segments) {
+        const column = (): Float64Array => {
+          const values = new Float64Array(buffer, offset, n).slice();
+          offset += n * 8;
+          return values;
+        };
+        const segment: ICandleSegment = {
+          start,
+          end,
+          timestamps: column(),
+          open: column(),
+          high: column(),
+          low: column(),
+          close: column(),
+          volume: column(),
+        };
+        this.insertSegment(key, segment, true);
+      }
+    }
+
+    this.evict();
+  }
+
+  private insertSegment(key: string, incoming: ICandleSegment, preferExisting = false): void {
+    const segments = this.series.get(key) ?? [];
+    const kept: ICandleSegment[] = [];
+    let merged = incoming;
+
+    for (const segment of segments) {
+      // 겹치거나 맞닿은 구간 병합
+      if (segment.end + 1 >= merged.start && segment.start <= merged.end + 1) {
+        merged = preferExisting ? mergeSegments(merged, segment) : mergeSegments(segment, merged);
+        this.lru.delete(segment);
+        this.bytes -= segmentBytes(segment);
+      } else {
+        kept.push(segment);
+      }
+    }
+
+    kept.push(merged);
+    kept.sort((a, b) => a.start - b.start);
+    this.series.set(key, kept);
+    this.lru.set(merged, key);
+    this.bytes += segmentBytes(merged);
+  }
+
+  private touch(segment: ICandleSegment, key: string): void {
+    this.lru.delete(segment);
+    this.lru.set(segment, key);
+  }
+
+  private evict(): void {
+    while (this.bytes > this.maxBytes && this.lru.size > 0) {
+      const [segment, key] = this.lru.entries().next().value as [ICandleSegment, string];
+      this.lru.delete(segment);
+      this.bytes -= segmentBytes(segment);
+      this.evictions++;
+
+      const remaining = (this.series.get(key) ?? []).filter((s) => s !== segment);
+      if (remaining.length > 0) this.series.set(key, remaining);
+      else this.series.delete(key);
+    }
+  }
+}
@@ -0,0 +1,140 @@
+/**
+ * @qetta/core - Monte Carlo Worker Pool
+ * L2 (Cells) - 몬테카를로 VaR 시뮬레이션 워커 풀
+ */
+
+import { availableParallelism } from 'node:os';
+import { extname } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { Worker } from 'node:worker_threads';
+import type { IMonteCarloChunk, IMonteCarloWorkerPool } from '@qetta/utils';
+
+/** 기본 워커 진입점 (이 모듈과 같은 확장자: 빌드 후 .js, 소스 실행 시 .ts) */
+const WORKER_URL = new URL(
+  `./monte-carlo-worker${extname(fileURLToPath(import.meta.url))}`,
+  import.meta.url
+);
+
+interface IPendingJob {
+  chunk: IMonteCarloChunk;
+  resolve: (result: Float64Array) => void;
+  reject: (error: Error) => void;
+}
+
+/** 워커 응답 */
+export type MonteCarloWorkerMessage =
+  | { ok: true; buffer: ArrayBuffer }
+  | { ok: false; error: string };
+
+/**
+ * worker_threads 기반 몬테카를로 워커 풀
+ *
+ * - 워커는 첫 작업 시 지연 생성되고 이후 재사용
+ * - 결과 버퍼는 transferable로 복사 없이 전달
+ * - 유휴 워커는 unref되어 프로세스 종료를 막지 않음
+ *
+ * @example
+ * const pool = new MonteCarloWorkerPool();
+ * const result = await calculateMonteCarloCVaRAsync(returns, 1_000_000, {
+ *   simulations: 1_000_000,
+ *   seed: 42,
+ *   pool,
+ * });
+ * await pool.terminate();
+ *
+ * @param size - 최대 워커 수 (기본: CPU 수 - 1)
+ * @param workerUrl - 워커 진입점 (기본: monte-carlo-worker, 테스트 등에서 교체)
+ */
+export class MonteCarloWorkerPool implements IMonteCarloWorkerPool {
+  public readonly size: number;
+  private workers: Worker[] = [];
+  private idle: Worker[] = [];
+  private queue: IPendingJob[] = [];
+  private active = new Map<Worker, IPendingJob>();
+  private terminated = false;
+
+  constructor(
+    size: number = Math.max(1, availableParallelism() - 1),
+    private readonly workerUrl: URL = WORKER_URL
+  ) {
+    this.size = Math.max(1, Math.floor(size));
+  }
+
+  run(chunk: IMonteCarloChunk): Promise<Float64Array> {
+    if (this.terminated) {
+      return Promise.reject(new Error('Monte Carlo worker pool has been terminated'));
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ chunk, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  /**
+   * 모든 워커 종료 (대기 중인 작업은 reject)
+   */
+  async terminate(): Promise<void> {
+    this.terminated = true;
+    const error = new Error('Monte Carlo worker pool has been terminated');
+    for (const job of this.queue) job.reject(error);
+    for (const job of this.active.values()) job.reject(error);
+    this.queue = [];
+    this.active.clear();
+    this.idle = [];
+
+    const workers = this.workers;
+    this.workers = [];
+    await Promise.all(workers.map((worker) => worker.terminate()));
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      const worker = this.idle.pop() ?? this.spawn();
+      if (!worker) return;
+
+      const job = this.queue.shift()!;
+      this.active.set(worker, job);
+      worker.ref();
+      worker.postMessage(job.chunk);
+    }
+  }
+
+  private spawn(): Worker | undefined {
+    if (this.workers.length >= this.size) return undefined;
+
+    const worker = new Worker(this.workerUrl);
+    worker.on('message', (message: MonteCarloWorkerMessage) => {
+      const job = this.active.get(worker);
+      this.active.delete(worker);
+      worker.unref();
+      this.idle.push(worker);
+
+      if (job) {
+        if (message.ok) job.resolve(new Float64Array(message.buffer));
+        else job.reject(new Error(message.error));
+      }
+      this.dispatch();
+    });
+    worker.on('error', (error) => this.retire(worker, error));
+    // 'error' 없이 종료된 워커도 작업을 reject하고 풀에서 제거
+    worker.on('exit', (code) =>
+      this.retire(worker, new Error(`Monte Carlo worker exited with code ${code}`))
+    );
+
+    this.workers.push(worker);
+    return worker;
+  }
+
+  /**
+   * 워커를 풀에서 제거하고 진행 중이던 작업 reject (error 후 exit처럼 두 번 불려도 무방)
+   */
+  private retire(worker: Worker, error: Error): void {
+    const job = this.active.get(worker);
+    this.active.delete(worker);
+    this.workers = this.workers.filter((w) => w !== worker);
+    this.idle = this.idle.filter((w) => w !== worker);
+    job?.reject(error);
+    if (!this.terminated) this.dispatch();
+  }
+}
@@ -0,0 +1,20 @@
+/**
+ * @qetta/core - Monte Carlo Worker
+ * MonteCarloWorkerPool 워커 스레드 진입점
+ */
+
+import { parentPort } from 'node:worker_threads';
+import { simulateMonteCarloChunk, type IMonteCarloChunk } from '@qetta/utils';
+import type { MonteCarloWorkerMessage } from './monte-carlo-worker-pool.js';
+
+parentPort!.on('message', (chunk: IMonteCarloChunk) => {
+  let message: MonteCarloWorkerMessage;
+  try {
+    const result = simulateMonteCarloChunk(chunk);
+    message = { ok: true, buffer: result.buffer as ArrayBuffer };
+    parentPort!.postMessage(message, [message.buffer]);
+  } catch (error) {
+    message = { ok: false, error: error instanceof Error ? error.message : String(error) };
+    parentPort!.postMessage(message);
+  }
+});
@@ -4,6 +4,7 @@
  */
 
 import type { HephaitosTypes, IResult, Timestamp } from '@qetta/types';
+import { CandleStore, parseCandleTimestamp } from './candle-store.js';
 
 type IOHLCV = HephaitosTypes.IOHLCV;
 type IPriceData = HephaitosTypes.IPriceData;
@@ -64,6 +65,99 @@ function timeframeToMs(tf: Timeframe): number {
   }
 }
 
+const TIMEFRAMES: Timeframe[] = ['1m', '5m', '15m', '30m', '1h', '4h', '1d', '1w', '1M'];
+
+/** 주봉 기준 (월요일 00:00 UTC, epoch는 목요일) */
+const WEEK_OFFSET_MS = 4 * 24 * 60 * 60 * 1000;
+
+/**
+ * 캔들 시각이 속한 타임프레임 구간의 시작 시각
+ * (거래소와 동일하게 UTC 기준, 주봉은 월요일, 월봉은 달력 월)
+ */
+function bucketStart(ms: number, tf: Timeframe): number {
+  if (tf === '1M') {
+    const date = new Date(ms);
+    return Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1);
+  }
+  const size = timeframeToMs(tf);
+  const offset = tf === '1w' ? WEEK_OFFSET_MS : 0;
+  return Math.floor((ms - offset) / size) * size + offset;
+}
+
+function nextBucketStart(bucket: number, tf: Timeframe): number {
+  if (tf === '1M') {
+    const date = new Date(bucket);
+    return Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + 1, 1);
+  }
+  return bucket + timeframeToMs(tf);
+}
+
+/**
+ * target 캔들을 만들 수 있는 하위 타임프레임 (큰 것부터)
+ */
+function derivableSources(target: Timeframe): Timeframe[] {
+  const targetMs = timeframeToMs(target);
+  const dayMs = timeframeToMs('1d');
+
+  return TIMEFRAMES.filter((source) => {
+    if (source === '1w' || source === '1M') return false;
+    const sourceMs = timeframeToMs(source);
+    if (target === '1M') return sourceMs <= dayMs;
+    return sourceMs < targetMs && targetMs % sourceMs === 0;
+  }).reverse();
+}
+
+/**
+ * 타임프레임 리샘플링 (구간 시작 시각 기준 집계)
+ */
+function resampleCandles(
+  candles: IOHLCV[],
+  sourceTimeframe: Timeframe,
+  targetTimeframe: Timeframe
+): IOHLCV[] {
+  if (timeframeToMs(targetTimeframe) <= timeframeToMs(sourceTimeframe)) {
+    // 더 작은 타임프레임으로는 리샘플링 불가
+    return candles;
+  }
+
+  const result: IOHLCV[] = [];
+  let current: IOHLCV | null = null;
+  let currentBucket = NaN;
+
+  for (const candle of candles) {
+    const bucket = bucketStart(parseCandleTimestamp(candle.timestamp), targetTimeframe);
+
+    if (current && bucket === currentBucket) {
+      if (candle.high > current.high) current.high = candle.high;
+      if (candle.low < current.low) current.low = candle.low;
+      current.close = candle.close;
+      current.volume += candle.volume;
+      continue;
+    }
+
+    if (current) result.push(current);
+    current = {
+      timestamp: new Date(bucket).toISOString(),
+      open: candle.open,
+      high: candle.high,
+      low: candle.low,
+      close: candle.close,
+      volume: candle.volume,
+    };
+    currentBucket = bucket;
+  }
+
+  if (current) result.push(current);
+  return result;
+}
+
+function sortByTimestamp(candles: IOHLCV[]): IOHLCV[] {
+  return candles
+    .map((candle) => ({ ts: parseCandleTimestamp(candle.timestamp), candle }))
+    .sort((a, b) => a.ts - b.ts)
+    .map(({ candle }) => candle);
+}
+
 /**
  * 인메모리 가격 데이터 서비스 (테스트용)
  *
@@ -202,47 +296,87 @@ export class InMemoryPriceDataService implements IPriceDataService {
     sourceTimeframe: Timeframe,
     targetTimeframe: Timeframe
   ): IOHLCV[] {
-    const sourceMs = timeframeToMs(sourceTimeframe);
-    const targetMs = timeframeToMs(targetTimeframe);
-
-    if (targetMs <= sourceMs) {
-      // 더 작은 타임프레임으로는 리샘플링 불가
-      return candles;
-    }
-
-    const ratio = targetMs / sourceMs;
-    const result: IOHLCV[] = [];
-
-    for (let i = 0; i < candles.length; i += ratio) {
-      const chunk = candles.slice(i, Math.min(i + ratio, candles.length));
-      if (chunk.length === 0) break;
+    return resampleCandles(candles, sourceTimeframe, targetTimeframe);
+  }
+}
 
-      const aggregated: IOHLCV = {
-        timestamp: chunk[0].timestamp,
-        open: chunk[0].open,
-        high: Math.max(...chunk.map((c) => c.high)),
-        low: Math.min(...chunk.map((c) => c.low)),
-        close: chunk[chunk.length - 1].close,
-        volume: chunk.reduce((sum, c) => sum + c.volume, 0),
-      };
+/**
+ * RealPriceDataService 옵션
+ */
+export interface IRealPriceDataServiceOptions {
+  /** 캔들 캐시 메모리 예산 (바이트, 기본 64MB) */
+  maxCacheBytes?: number;
+  /** 캔들 캐시 파일 경로 (loadCache/saveCache 기본값) */
+  cachePath?: string;
+}
 
-      result.push(aggregated);
-    }
+/**
+ * 가격 데이터 캐시 통계
+ */
+export interface IPriceCacheStats {
+  /** 캐시만으로 응답한 요청 */
+  hits: number;
+  /** 일부 구간만 캐시에 있던 요청 */
+  partialHits: number;
+  /** 캐시에 전혀 없던 요청 */
+  misses: number;
+  /** 하위 타임프레임 캐시에서 리샘플링으로 응답한 요청 */
+  derived: number;
+  /** 거래소 구간 fetch 횟수 (페이지 단위 아님) */
+  fetches: number;
+  /** 진행 중인 fetch에 합류한 횟수 */
+  coalesced: number;
+  fetchErrors: number;
+  avgFetchLatencyMs: number;
+  maxFetchLatencyMs: number;
+  /** 캔들 캐시 메모리 사용량 */
+  bytes: number;
+  segments: number;
+  evictions: number;
+}
 
-    return result;
-  }
+interface IInflightFetch {
+  key: string;
+  start: number;
+  end: number;
+  promise: Promise<IOHLCV[]>;
 }
 
 /**
  * 실제 거래소 API 기반 가격 데이터 서비스
  * Binance와 Upbit의 공개 API를 사용하여 실제 가격 데이터 제공
+ *
+ * 과거 캔들은 CandleStore에 구간 단위로 캐시되어,
+ * 겹치는 백테스트 기간은 비어 있는 구간만 거래소에서 가져온다.
  */
 export class RealPriceDataService implements IPriceDataService {
-  private cache: Map<string, { data: IOHLCV[]; timestamp: number }> = new Map();
-  private readonly CACHE_TTL_MS = 5 * 60 * 1000; // 5분 캐시
+  private store: CandleStore;
+  private latestCache: Map<string, { data: IOHLCV[]; timestamp: number }> = new Map();
+  private inflight: Map<string, IInflightFetch> = new Map();
+  private counters = {
+    hits: 0,
+    partialHits: 0,
+    misses: 0,
+    derived: 0,
+    fetches: 0,
+    coalesced: 0,
+    fetchErrors: 0,
+    totalFetchLatencyMs: 0,
+    maxFetchLatencyMs: 0,
+  };
+  private readonly cachePath?: string;
+  private readonly LATEST_CACHE_TTL_MS = 60 * 1000; // 최신 캔들 1분 캐시
+  private readonly LATEST_CACHE_MAX_ENTRIES = 256;
+  private readonly BINANCE_PAGE_LIMIT = 1000;
+  private readonly UPBIT_PAGE_LIMIT = 200;
   private readonly BINANCE_BASE_URL = 'https://api.binance.com';
   private readonly UPBIT_BASE_URL = 'https://api.upbit.com';
 
+  constructor(options: IRealPriceDataServiceOptions = {}) {
+    this.store = new CandleStore({ maxBytes: options.maxCacheBytes });
+    this.cachePath = options.cachePath;
+  }
+
   /**
    * 타임프레임을 거래소별 형식으로 변환
    */
@@ -336,12 +470,17 @@ export class RealPriceDataService implements IPriceDataService {
   private async fetchUpbitOHLCV(
     symbol: string,
     timeframe: Timeframe,
-    count: number = 200
+    count: number = 200,
+    to?: number
   ): Promise<IOHLCV[]> {
     const upbitSymbol = this.convertSymbol(symbol, 'upbit');
     const upbitInterval = this.convertTimeframe(timeframe, 'upbit');
 
-    const url = `${this.UPBIT_BASE_URL}/v1/candles/${upbitInterval}?market=${upbitSymbol}&count=${count}`;
+    let url = `${this.UPBIT_BASE_URL}/v1/candles/${upbitInterval}?market=${upbitSymbol}&count=${count}`;
+    // to: 마지막 캔들 시각 (exclusive, 초 단위 ISO 8601)
+    if (to !== undefined) {
+      url += `&to=${encodeURIComponent(new Date(to).toISOString().replace(/\.\d{3}Z$/, 'Z'))}`;
+    }
 
     const response = await fetch(url);
     if (!response.ok) {
@@ -359,8 +498,9 @@ export class RealPriceDataService implements IPriceDataService {
     }>;
 
     // Upbit은 최신순으로 반환하므로 역순으로 정렬
+    // candle_date_time_utc는 시간대 표기가 없으므로 캐시 캔들과 같은 ISO 형식으로 변환
     return data.reverse().map((candle) => ({
-      timestamp: candle.candle_date_time_utc,
+      timestamp: new Date(parseCandleTimestamp(candle.candle_date_time_utc)).toISOString(),
       open: candle.opening_price,
       high: candle.high_price,
       low: candle.low_price,
@@ -384,65 +524,60 @@ export class RealPriceDataService implements IPriceDataService {
     endDate: string
   ): Promise<IResult<IPriceData>> {
     const startTime = Date.now();
-    const cacheKey = `${symbol}-${timeframe}-${startDate}-${endDate}`;
+    const startMs = new Date(startDate).getTime();
+    const endMs = new Date(endDate).getTime();
+    const key = this.seriesKey(symbol, timeframe);
 
-    // 캐시 확인
-    const cached = this.cache.get(cacheKey);
-    if (cached && Date.now() - cached.timestamp < this.CACHE_TTL_MS) {
-      return {
-        success: true,
-        data: {
-          symbol,
-          timeframe,
-          candles: cached.data,
-          startTime: startDate,
-          endTime: endDate,
-        },
-        metadata: {
-          timestamp: new Date().toISOString(),
-          duration_ms: Date.now() - startTime,
-          cached: true,
-        },
-      };
-    }
+    const respond = (candles: IOHLCV[], cached: boolean): IResult<IPriceData> => ({
+      success: true,
+      data: {
+        symbol,
+        timeframe,
+        candles,
+        startTime: startDate,
+        endTime: endDate,
+      },
+      metadata: {
+        timestamp: new Date().toISOString(),
+        duration_ms: Date.now() - startTime,
+        cached,
+      },
+    });
 
     try {
-      const exchange = this.detectExchange(symbol);
-      let candles: IOHLCV[];
+      // 같은 구간을 가져오는 중인 요청이 있으면 먼저 기다림
+      const pending = [...this.inflight.values()].filter(
+        (f) => f.key === key && f.start <= endMs && f.end >= startMs
+      );
+      if (pending.length > 0) {
+        this.counters.coalesced += pending.length;
+        await Promise.allSettled(pending.map((f) => f.promise));
+      }
 
-      const startMs = new Date(startDate).getTime();
-      const endMs = new Date(endDate).getTime();
+      const lookup = this.store.lookup(key, startMs, endMs);
+      if (lookup.gaps.length === 0) {
+        this.counters.hits++;
+        return respond(lookup.candles, true);
+      }
 
-      if (exchange === 'binance') {
-        candles = await this.fetchBinanceOHLCV(symbol, timeframe, startMs, endMs, 1000);
-      } else {
-        // Upbit은 최대 200개만 지원하므로 여러 번 호출 필요할 수 있음
-        candles = await this.fetchUpbitOHLCV(symbol, timeframe, 200);
-        // 날짜 필터링
-        candles = candles.filter((c) => {
-          const ts = new Date(c.timestamp).getTime();
-          return ts >= startMs && ts <= endMs;
-        });
+      const derived = this.deriveFromLowerTimeframe(symbol, timeframe, startMs, endMs);
+      if (derived) {
+        this.counters.derived++;
+        return respond(derived, true);
       }
 
-      // 캐시 저장
-      this.cache.set(cacheKey, { data: candles, timestamp: Date.now() });
+      if (lookup.candles.length > 0) this.counters.partialHits++;
+      else this.counters.misses++;
 
-      return {
-        success: true,
-        data: {
-          symbol,
-          timeframe,
-          candles,
-          startTime: startDate,
-          endTime: endDate,
-        },
-        metadata: {
-          timestamp: new Date().toISOString(),
-          duration_ms: Date.now() - startTime,
-          cached: false,
-        },
-      };
+      // 비어 있는 구간만 가져와서 캐시된 캔들과 합침
+      const fetched = await Promise.all(
+        lookup.gaps.map(([gapStart, gapEnd]) =>
+          this.fetchGap(symbol, timeframe, gapStart, gapEnd)
+        )
+      );
+
+      const candles = sortByTimestamp(lookup.candles.concat(...fetched));
+      return respond(candles, false);
     } catch (error) {
       return {
         success: false,
@@ -464,8 +599,8 @@ export class RealPriceDataService implements IPriceDataService {
     const cacheKey = `${symbol}-${timeframe}-latest-${limit}`;
 
     // 캐시 확인 (최신 데이터는 1분 캐시)
-    const cached = this.cache.get(cacheKey);
-    if (cached && Date.now() - cached.timestamp < 60 * 1000) {
+    const cached = this.latestCache.get(cacheKey);
+    if (cached && Date.now() - cached.timestamp < this.LATEST_CACHE_TTL_MS) {
       return {
         success: true,
         data: cached.data,
@@ -487,8 +622,15 @@ export class RealPriceDataService implements IPriceDataService {
         candles = await this.fetchUpbitOHLCV(symbol, timeframe, Math.min(limit, 200));
       }
 
-      // 캐시 저장
-      this.cache.set(cacheKey, { data: candles, timestamp: Date.now() });
+      // 캐시 저장 (오래된 항목부터 제거)
+      this.latestCache.delete(cacheKey);
+      this.latestCache.set(cacheKey, { data: candles, timestamp: Date.now() });
+      if (this.latestCache.size > this.LATEST_CACHE_MAX_ENTRIES) {
+        this.latestCache.delete(this.latestCache.keys().next().value as string);
+      }
+
+      // 마감된 캔들은 구간 캐시에도 반영
+      this.storeLatest(symbol, timeframe, candles);
 
       return {
         success: true,
@@ -516,40 +658,198 @@ export class RealPriceDataService implements IPriceDataService {
     sourceTimeframe: Timeframe,
     targetTimeframe: Timeframe
   ): IOHLCV[] {
-    const sourceMs = timeframeToMs(sourceTimeframe);
-    const targetMs = timeframeToMs(targetTimeframe);
+    return resampleCandles(candles, sourceTimeframe, targetTimeframe);
+  }
 
-    if (targetMs <= sourceMs) {
-      return candles;
+  /**
+   * 캐시 통계
+   */
+  getCacheStats(): IPriceCacheStats {
+    const { totalFetchLatencyMs, ...counters } = this.counters;
+    return {
+      ...counters,
+      avgFetchLatencyMs: counters.fetches > 0 ? totalFetchLatencyMs / counters.fetches : 0,
+      bytes: this.store.size,
+      segments: this.store.segmentCount,
+      evictions: this.store.evictionCount,
+    };
+  }
+
+  /**
+   * 디스크에서 캔들 캐시 로드 (파일이 없으면 false)
+   */
+  async loadCache(path: string | undefined = this.cachePath): Promise<boolean> {
+    if (!path) throw new Error('Candle cache path is not configured');
+    const { readFile } = await import('node:fs/promises');
+
+    try {
+      this.store.load(await readFile(path));
+      return true;
+    } catch (error) {
+      if ((error as { code?: string }).code === 'ENOENT') return false;
+      throw error;
     }
+  }
 
-    const ratio = targetMs / sourceMs;
-    const result: IOHLCV[] = [];
+  /**
+   * 캔들 캐시를 디스크에 저장 (임시 파일 후 rename)
+   */
+  async saveCache(path: string | undefined = this.cachePath): Promise<void> {
+    if (!path) throw new Error('Candle cache path is not configured');
+    const { writeFile, rename } = await import('node:fs/promises');
 
-    for (let i = 0; i < candles.length; i += ratio) {
-      const chunk = candles.slice(i, Math.min(i + ratio, candles.length));
-      if (chunk.length === 0) break;
+    const tempPath = `${path}.${process.pid}.tmp`;
+    await writeFile(tempPath, this.store.serialize());
+    await rename(tempPath, path);
+  }
 
-      const aggregated: IOHLCV = {
-        timestamp: chunk[0].timestamp,
-        open: chunk[0].open,
-        high: Math.max(...chunk.map((c) => c.high)),
-        low: Math.min(...chunk.map((c) => c.low)),
-        close: chunk[chunk.length - 1].close,
-        volume: chunk.reduce((sum, c) => sum + c.volume, 0),
-      };
+  /**
+   * 캐시 초기화
+   */
+  clearCache(): void {
+    this.store.clear();
+    this.latestCache.clear();
+  }
 
-      result.push(aggregated);
+  private seriesKey(symbol: string, timeframe: Timeframe): string {
+    return `${symbol}-${timeframe}`;
+  }
+
+  /**
+   * 하위 타임프레임 캐시가 구간을 모두 덮으면 리샘플링으로 응답
+   */
+  private deriveFromLowerTimeframe(
+    symbol: string,
+    timeframe: Timeframe,
+    startMs: number,
+    endMs: number
+  ): IOHLCV[] | null {
+    // 요청 구간에 걸친 상위 캔들 전체가 필요 (coverage는 캔들 시작 시각 기준)
+    const from = bucketStart(startMs, timeframe);
+    const lastBucketEnd = nextBucketStart(bucketStart(endMs, timeframe), timeframe);
+
+    for (const source of derivableSources(timeframe)) {
+      const key = this.seriesKey(symbol, source);
+      const to = lastBucketEnd - timeframeToMs(source);
+      if (!this.store.covers(key, from, to)) continue;
+
+      const { candles } = this.store.lookup(key, from, to);
+      return resampleCandles(candles, source, timeframe).filter((candle) => {
+        const ts = parseCandleTimestamp(candle.timestamp);
+        return ts >= startMs && ts <= endMs;
+      });
     }
 
-    return result;
+    return null;
   }
 
   /**
-   * 캐시 초기화
+   * 구간 하나를 거래소에서 가져와 캐시에 저장
+   * (같은 구간을 가져오는 중이면 그 요청에 합류)
    */
-  clearCache(): void {
-    this.cache.clear();
+  private fetchGap(
+    symbol: string,
+    timeframe: Timeframe,
+    start: number,
+    end: number
+  ): Promise<IOHLCV[]> {
+    const key = this.seriesKey(symbol, timeframe);
+    const flightKey = `${key}:${start}:${end}`;
+
+    const existing = this.inflight.get(flightKey);
+    if (existing) {
+      this.counters.coalesced++;
+      return existing.promise;
+    }
+
+    const promise = (async () => {
+      const fetchStart = Date.now();
+      try {
+        const candles = await this.fetchRange(symbol, timeframe, start, end);
+        const latency = Date.now() - fetchStart;
+        this.counters.fetches++;
+        this.counters.totalFetchLatencyMs += latency;
+        this.counters.maxFetchLatencyMs = Math.max(this.counters.maxFetchLatencyMs, latency);
+
+        // 아직 마감되지 않은 캔들 구간은 캐시하지 않음
+        const closedEnd = Math.min(end, fetchStart - timeframeToMs(timeframe));
+        this.store.insert(key, start, closedEnd, candles);
+        return candles;
+      } catch (error) {
+        this.counters.fetchErrors++;
+        throw error;
+      } finally {
+        this.inflight.delete(flightKey);
+      }
+    })();
+
+    this.inflight.set(flightKey, { key, start, end, promise });
+    return promise;
+  }
+
+  /**
+   * 구간 [start, end] 캔들 전체 조회 (페이지 반복)
+   */
+  private async fetchRange(
+    symbol: string,
+    timeframe: Timeframe,
+    start: number,
+    end: number
+  ): Promise<IOHLCV[]> {
+    const candles: IOHLCV[] = [];
+
+    if (this.detectExchange(symbol) === 'binance') {
+      let cursor = start;
+      while (cursor <= end) {
+        const page = await this.fetchBinanceOHLCV(
+          symbol,
+          timeframe,
+          cursor,
+          end,
+          this.BINANCE_PAGE_LIMIT
+        );
+        candles.push(...page);
+        if (page.length < this.BINANCE_PAGE_LIMIT) break;
+
+        const next = parseCandleTimestamp(page[page.length - 1].timestamp) + 1;
+        if (next <= cursor) break;
+        cursor = next;
+      }
+    } else {
+      // Upbit은 최대 200개씩 최신 → 과거 방향으로만 조회 가능
+      let to = Math.ceil((end + 1) / 1000) * 1000;
+      for (;;) {
+        const page = await this.fetchUpbitOHLCV(symbol, timeframe, this.UPBIT_PAGE_LIMIT, to);
+        let oldest = Infinity;
+        for (const candle of page) {
+          const ts = parseCandleTimestamp(candle.timestamp);
+          oldest = Math.min(oldest, ts);
+          if (ts >= start && ts <= end) candles.push(candle);
+        }
+        if (page.length < this.UPBIT_PAGE_LIMIT || oldest <= start || oldest >= to) break;
+        to = oldest;
+      }
+    }
+
+    return sortByTimestamp(candles);
+  }
+
+  /**
+   * 최신 캔들 응답 중 마감된 부분을 구간 캐시에 반영
+   */
+  private storeLatest(symbol: string, timeframe: Timeframe, candles: IOHLCV[]): void {
+    if (candles.length === 0) return;
+
+    let first = Infinity;
+    let last = -Infinity;
+    for (const candle of candles) {
+      const ts = parseCandleTimestamp(candle.timestamp);
+      first = Math.min(first, ts);
+      last = Math.max(last, ts);
+    }
+
+    const closedEnd = Math.min(last, Date.now() - timeframeToMs(timeframe));
+    this.store.insert(this.seriesKey(symbol, timeframe), first, closedEnd, candles);
   }
 }
 
@@ -0,0 +1,385 @@
+/**
+ * @qetta/crm - Attio Sync Service Tests
+ * 병렬/증분 동기화, 체크포인트 재개, 웹훅 배치 테스트
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { createServer, type Server } from 'node:http';
+import type { AddressInfo } from 'node:net';
+import {
+  AttioSyncService,
+  InMemoryAttioSyncStore,
+  type ISyncRecord,
+} from '../providers/attio/sync-service.js';
+
+// ═══════════════════════════════════════════════════════════════
+// Attio 모의 서버
+// ═══════════════════════════════════════════════════════════════
+
+interface IMockRecord {
+  id: { record_id: string };
+  /** 없으면 updated_at 필터 조회에 나오지 않음 */
+  updated_at?: string;
+  created_at?: string;
+}
+
+interface IMockAttio {
+  baseUrl: string;
+  records: IMockRecord[];
+  /** 페이지 조회로 응답한 레코드 수 (limit 1 구간 탐색 제외) */
+  served: number;
+  requests: number;
+  maxInFlight: number;
+  /** 앞으로 429를 돌려줄 요청 수 */
+  rateLimited: number;
+  /** offset이 이 값 이상인 페이지 응답은 보류 (null: 보류 안 함) */
+  pauseFrom: number | null;
+  /** 보류 중인 페이지 응답 */
+  held: Array<() => void>;
+  /** 보류한 응답을 모두 보냄 */
+  resume(): void;
+  close(): Promise<void>;
+}
+
+const BASE = Date.UTC(2025, 0, 1);
+
+/** count개 레코드, sameTime개씩 같은 updated_at */
+const createRecords = (count: number, sameTime = 1): IMockRecord[] =>
+  Array.from({ length: count }, (_, i) => ({
+    id: { record_id: `rec-${i}` },
+    updated_at: new Date(BASE + Math.floor(i / sameTime) * 1000).toISOString(),
+  }));
+
+const matches = (record: IMockRecord, filter: Record<string, string>): boolean => {
+  if (Object.keys(filter).length === 0) return true;
+  if (record.updated_at === undefined) return false;
+  const t = Date.parse(record.updated_at);
+  if (filter.$gte !== undefined && t < Date.parse(filter.$gte)) return false;
+  if (filter.$lt !== undefined && t >= Date.parse(filter.$lt)) return false;
+  if (filter.$lte !== undefined && t > Date.parse(filter.$lte)) return false;
+  return true;
+};
+
+const startMockAttio = async (records: IMockRecord[]): Promise<IMockAttio> => {
+  let inFlight = 0;
+  const mock = {
+    records,
+    served: 0,
+    requests: 0,
+    maxInFlight: 0,
+    rateLimited: 0,
+    pauseFrom: null,
+    held: [],
+  } as unknown as IMockAttio;
+
+  const server: Server = createServer((req, res) => {
+    let body = '';
+    req.on('data', (chunk) => (body += chunk));
+    req.on('end', () => {
+      mock.requests++;
+      inFlight++;
+      mock.maxInFlight = Math.max(mock.maxInFlight, inFlight);
+
+      setTimeout(() => {
+        inFlight--;
+        if (mock.rateLimited > 0) {
+          mock.rateLimited--;
+          res.writeHead(429, { 'Retry-After': '0' }).end('{}');
+          return;
+        }
+
+        const query = JSON.parse(body);
+        const respond = () => {
+          const direction = query.sorts?.[0]?.direction === 'desc' ? -1 : 1;
+          const filtered = mock.records.filter((r) => matches(r, query.filter?.updated_at ?? {}));
+          // 정렬 조건이 없으면 저장 순서
+          if (query.sorts) {
+            filtered.sort(
+              (a, b) => direction * (Date.parse(a.updated_at!) - Date.parse(b.updated_at!))
+            );
+          }
+          const page = filtered.slice(query.offset, query.offset + query.limit);
+
+          if (query.limit > 1) mock.served += page.length;
+          res.writeHead(200, { 'Content-Type': 'application/json' });
+          res.end(JSON.stringify({ data: page }));
+        };
+
+        if (query.limit > 1 && mock.pauseFrom !== null && query.offset >= mock.pauseFrom) {
+          mock.held.push(respond);
+          return;
+        }
+        respond();
+      }, 2);
+    });
+  });
+
+  await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+  const { port } = server.address() as AddressInfo;
+  mock.baseUrl = `http://127.0.0.1:${port}/v2`;
+  mock.resume = () => {
+    const held = mock.held;
+    mock.held = [];
+    held.forEach((respond) => respond());
+  };
+  mock.close = () =>
+    new Promise<void>((resolve) => {
+      server.closeAllConnections();
+      server.close(() => resolve());
+    });
+  return mock;
+};
+
+/** upsertRecords 호출을 기록하는 저장소 */
+class RecordingStore extends InMemoryAttioSyncStore {
+  upsertCalls: number[] = [];
+  failOnCall: number | null = null;
+
+  async upsertRecords(objectType: string, records: ISyncRecord[]): Promise<void> {
+    this.upsertCalls.push(records.length);
+    if (this.upsertCalls.length === this.failOnCall) {
+      throw new Error('DB write failed');
+    }
+    await super.upsertRecords(objectType, records);
+  }
+}
+
+const storedIds = (store: InMemoryAttioSyncStore, objectType = 'deals') =>
+  [...(store.records.get(objectType)?.keys() ?? [])].sort();
+
+const allIds = (records: IMockRecord[]) => records.map((r) => r.id.record_id).sort();
+
+const waitUntil = async (condition: () => boolean) => {
+  while (!condition()) {
+    await new Promise((resolve) => setTimeout(resolve, 1));
+  }
+};
+
+// ═══════════════════════════════════════════════════════════════
+// 동기화
+// ═══════════════════════════════════════════════════════════════
+
+describe('AttioSyncService.syncAll', () => {
+  let mock: IMockAttio;
+  let store: RecordingStore;
+
+  beforeEach(async () => {
+    // 페이지 경계에 같은 시각 레코드가 걸치도록 7개씩 같은 updated_at
+    mock = await startMockAttio(createRecords(300, 7));
+    store = new RecordingStore();
+  });
+
+  afterEach(async () => {
+    await mock.close();
+  });
+
+  const createService = () =>
+    new AttioSyncService('test-key', mock.baseUrl, {
+      store,
+      concurrency: 3,
+      pageSize: 20,
+      writeBatchSize: 100,
+      retryBaseDelayMs: 1,
+    });
+
+  it('모든 레코드를 한 번씩 조회해 일괄 저장', async () => {
+    const result = await createService().syncAll(['deals']);
+
+    expect(result.success).toBe(true);
+    expect(result.data?.status).toBe('success');
+    expect(result.data?.syncedRecords).toBe(300);
+    expect(mock.served).toBe(300);
+    expect(storedIds(store)).toEqual(allIds(mock.records));
+    expect(store.upsertCalls.length).toBeLessThanOrEqual(6);
+    expect(mock.maxInFlight).toBeLessThanOrEqual(3);
+
+    const checkpoint = await store.loadCheckpoint('deals');
+    expect(checkpoint?.run).toBeNull();
+    expect(checkpoint?.highWaterMark).not.toBeNull();
+  });
+
+  it('증분 모드는 마지막 동기화 이후 변경분만 조회', async () => {
+    const service = createService();
+    await service.syncAll(['deals']);
+    mock.served = 0;
+
+    const changedAt = new Date().toISOString();
+    mock.records.slice(0, 5).forEach((r) => (r.updated_at = changedAt));
+
+    const result = await service.syncIncremental(['deals']);
+
+    expect(result.data?.syncedRecords).toBe(5);
+    expect(mock.served).toBe(5);
+    expect(store.records.get('deals')?.get('rec-0')?.updatedAt).toBe(changedAt);
+  });
+
+  it('증분 모드는 같은 시각 레코드가 페이지 경계에 걸쳐도 한 번씩 조회', async () => {
+    const service = createService();
+    await service.syncAll(['deals']);
+    mock.served = 0;
+
+    // 마지막 동기화 이후 7개씩 같은 updated_at으로 100개 변경
+    const since = Date.parse((await store.loadCheckpoint('deals'))!.highWaterMark!);
+    mock.records.slice(0, 100).forEach((r, i) => {
+      r.updated_at = new Date(since + 1 + Math.floor(i / 7)).toISOString();
+    });
+    await new Promise((resolve) => setTimeout(resolve, 30));
+
+    const result = await service.syncIncremental(['deals']);
+
+    expect(result.data?.syncedRecords).toBe(100);
+    expect(mock.served).toBe(100);
+    expect(store.records.get('deals')?.get('rec-99')?.updatedAt).toBe(mock.records[99].updated_at);
+  });
+
+  it('updated_at 없는 레코드도 전체 동기화, 이후 변경분은 증분 조회', async () => {
+    // 10개 중 1개는 updated_at 없이 created_at만 있음
+    mock.records.forEach((r, i) => {
+      if (i % 10 === 0) {
+        r.created_at = r.updated_at;
+        delete r.updated_at;
+      }
+    });
+    const service = createService();
+
+    const full = await service.syncAll(['deals']);
+    expect(full.data?.status).toBe('success');
+    expect(full.data?.syncedRecords).toBe(300);
+    expect(mock.served).toBe(300);
+    expect(storedIds(store)).toEqual(allIds(mock.records));
+    expect(store.records.get('deals')?.get('rec-0')?.updatedAt).toBe(mock.records[0].created_at);
+
+    mock.served = 0;
+    const changedAt = new Date().toISOString();
+    mock.records.slice(0, 3).forEach((r) => (r.updated_at = changedAt));
+
+    const incremental = await service.syncIncremental(['deals']);
+    expect(incremental.data?.syncedRecords).toBe(3);
+    expect(mock.served).toBe(3);
+    expect(store.records.get('deals')?.get('rec-0')?.updatedAt).toBe(changedAt);
+  });
+
+  it('429 응답 시 대기 후 재시도, 동시 요청 수 유지', async () => {
+    mock.rateLimited = 4;
+
+    const result = await createService().syncAll(['deals']);
+
+    expect(result.data?.status).toBe('success');
+    expect(mock.rateLimited).toBe(0);
+    expect(mock.maxInFlight).toBeLessThanOrEqual(3);
+    expect(storedIds(store)).toEqual(allIds(mock.records));
+  });
+
+  it('쓰기 실패 후 체크포인트부터 이어서 동기화', async () => {
+    store.failOnCall = 2;
+
+    const failed = await createService().syncAll(['deals']);
+    expect(failed.data?.status).toBe('error');
+    expect(failed.data?.failedRecords).toBeGreaterThan(0);
+    expect((await store.loadCheckpoint('deals'))?.run).not.toBeNull();
+
+    store.failOnCall = null;
+    mock.served = 0;
+
+    const resumed = await createService().syncAll(['deals']);
+    expect(resumed.data?.status).toBe('success');
+    expect(mock.served).toBeLessThan(300);
+    expect(storedIds(store)).toEqual(allIds(mock.records));
+    expect((await store.loadCheckpoint('deals'))?.run).toBeNull();
+  });
+
+  it('웹훅 배치에서 동기화 페이지 쓰기가 실패해도 커밋된 페이지부터 재개', async () => {
+    const event = (recordId: string) => ({
+      id: `evt-${recordId}`,
+      type: 'record.updated' as const,
+      objectType: 'companies',
+      recordId,
+      timestamp: new Date(BASE).toISOString(),
+      data: {},
+    });
+    // 페이지는 웹훅 타이머 flush로만 저장되도록 배치 크기를 크게
+    const service = new AttioSyncService('test-key', mock.baseUrl, {
+      store,
+      concurrency: 3,
+      pageSize: 20,
+      writeBatchSize: 1000,
+      webhookFlushIntervalMs: 1,
+    });
+
+    // 1) 두 페이지를 받은 뒤 모든 worker가 다음 페이지를 기다리는 상태에서 웹훅 저장 (성공)
+    mock.pauseFrom = 40;
+    const syncing = service.syncAll(['deals']);
+    await waitUntil(() => mock.held.length === 3);
+    await service.handleWebhookEvent(event('hook-1'));
+
+    // 2) 세 페이지를 더 받은 뒤 웹훅 저장 실패 (대기 중인 동기화 페이지 포함)
+    mock.pauseFrom = 100;
+    mock.resume();
+    await waitUntil(() => mock.held.length === 3);
+    store.failOnCall = store.upsertCalls.length + 1;
+    await expect(service.handleWebhookEvent(event('hook-2'))).rejects.toThrow('DB write failed');
+
+    // 3) 나머지 조회 후 마지막 flush는 성공
+    store.failOnCall = null;
+    mock.pauseFrom = null;
+    mock.resume();
+    const failed = await syncing;
+
+    expect(failed.data?.status).toBe('error');
+    expect(failed.data?.failedRecords).toBe(
+      (failed.data?.totalRecords ?? 0) - (failed.data?.syncedRecords ?? 0)
+    );
+    expect(failed.data?.syncedRecords).toBe(40);
+
+    // 체크포인트는 저장된 페이지까지만 진행
+    const checkpoint = await store.loadCheckpoint('deals');
+    expect(checkpoint?.highWaterMark).toBeNull();
+    expect(checkpoint?.run?.offset).toBe(40);
+    const stored = new Set(storedIds(store));
+    expect(allIds(mock.records.slice(0, 40)).filter((id) => !stored.has(id))).toEqual([]);
+
+    mock.served = 0;
+    const resumed = await createService().syncAll(['deals']);
+    expect(resumed.data?.status).toBe('success');
+    expect(mock.served).toBeLessThan(300);
+    expect(storedIds(store)).toEqual(allIds(mock.records));
+    expect((await store.loadCheckpoint('deals'))?.run).toBeNull();
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// 웹훅
+// ═══════════════════════════════════════════════════════════════
+
+describe('AttioSyncService.handleWebhookEvent', () => {
+  const event = (type: 'record.updated' | 'record.deleted', recordId: string, second: number) => ({
+    id: `evt-${recordId}-${second}`,
+    type,
+    objectType: 'deals',
+    recordId,
+    timestamp: new Date(BASE + second * 1000).toISOString(),
+    data: { second },
+  });
+
+  it('같은 레코드 이벤트는 최신 변경만 한 배치로 저장', async () => {
+    const store = new RecordingStore();
+    await store.upsertRecords('deals', [{ id: 'rec-2', updatedAt: null, data: {} }]);
+    store.upsertCalls = [];
+
+    const service = new AttioSyncService('test-key', 'http://127.0.0.1:1/v2', {
+      store,
+      webhookFlushIntervalMs: 50,
+    });
+
+    await Promise.all([
+      service.handleWebhookEvent(event('record.updated', 'rec-1', 2)),
+      service.handleWebhookEvent(event('record.updated', 'rec-1', 1)),
+      service.handleWebhookEvent(event('record.updated', 'rec-1', 3)),
+      service.handleWebhookEvent(event('record.deleted', 'rec-2', 1)),
+    ]);
+
+    expect(store.upsertCalls).toEqual([1]);
+    expect(store.records.get('deals')?.get('rec-1')?.data).toEqual({ second: 3 });
+    expect(store.records.get('deals')?.has('rec-2')).toBe(false);
+  });
+});
@@ -71,4 +71,16 @@ export class AttioProvider implements ICRMProvider {
 export { AttioLeadManager } from './lead-manager.js';
 export { AttioDealManager } from './deal-manager.js';
 export { AttioCompanyManager } from './company-manager.js';
-export { AttioSyncService } from './sync-service.js';
+export { AttioSyncService, InMemoryAttioSyncStore } from './sync-service.js';
+export type {
+  SyncStatus,
+  SyncMode,
+  ISyncResult,
+  ISyncRecord,
+  ISyncSlice,
+  ISyncCheckpoint,
+  IAttioSyncStore,
+  IAttioSyncOptions,
+  WebhookEventType,
+  IWebhookEvent,
+} from './sync-service.js';
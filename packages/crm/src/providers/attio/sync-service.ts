@@ -10,6 +10,13 @@ import type { ICRMResponse } from '../../interfaces/index.js';
  */
 export type SyncStatus = 'idle' | 'syncing' | 'success' | 'error';
 
+/**
+ * 동기화 모드
+ * - full: 전체 레코드
+ * - incremental: 마지막 동기화 이후 변경된 레코드만 (high-water mark 기준)
+ */
+export type SyncMode = 'full' | 'incremental';
+
 /**
  * 동기화 결과
  */
@@ -47,24 +54,223 @@ export interface IWebhookEvent {
   data: unknown;
 }
 
+/**
+ * 로컬 저장 레코드
+ */
+export interface ISyncRecord {
+  id: string;
+  /** 마지막 변경 시각 (Attio updated_at, 없으면 created_at) */
+  updatedAt: string | null;
+  data: unknown;
+}
+
+/**
+ * 동기화 구간 (updated_at 기준 [from, to))
+ */
+export interface ISyncSlice {
+  from: string;
+  to: string;
+  /** 다음 페이지 시작 시각 */
+  cursor: string;
+  /** cursor와 같은 시각의 레코드 중 이미 처리한 수 */
+  skip: number;
+  done: boolean;
+}
+
+/**
+ * 동기화 체크포인트 (객체 타입별)
+ */
+export interface ISyncCheckpoint {
+  /** 이 시각까지 변경된 레코드는 모두 동기화됨 */
+  highWaterMark: string | null;
+  /** 진행 중인 실행 (중단되면 다음 호출에서 이어서 진행) */
+  run: {
+    mode: SyncMode;
+    until: string;
+    /** 변경분 동기화: updated_at 구간 */
+    slices: ISyncSlice[];
+    /** 전체 동기화: 저장이 끝난 위치 (다음 offset, 지정 시 구간 대신 offset 페이지 조회) */
+    offset?: number;
+  } | null;
+}
+
+/**
+ * 로컬 저장소
+ */
+export interface IAttioSyncStore {
+  /** 레코드 일괄 저장 (id 기준 upsert) */
+  upsertRecords(objectType: string, records: ISyncRecord[]): Promise<void>;
+  /** 레코드 일괄 삭제 */
+  deleteRecords(objectType: string, recordIds: string[]): Promise<void>;
+  loadCheckpoint(objectType: string): Promise<ISyncCheckpoint | null>;
+  saveCheckpoint(objectType: string, checkpoint: ISyncCheckpoint): Promise<void>;
+}
+
+/**
+ * 동기화 옵션
+ */
+export interface IAttioSyncOptions {
+  /** 로컬 저장소 (기본: 메모리) */
+  store?: IAttioSyncStore;
+  /** 동시에 가져올 페이지 수 (기본 4) */
+  concurrency?: number;
+  /** 페이지 크기 (기본 100) */
+  pageSize?: number;
+  /** 로컬 쓰기 배치 크기 (기본 500) */
+  writeBatchSize?: number;
+  /** 429/5xx 재시도 횟수 (기본 5) */
+  maxRetries?: number;
+  /** 재시도 기본 대기 시간 (기본 500ms, 지수 증가) */
+  retryBaseDelayMs?: number;
+  /** 웹훅 이벤트 모아쓰기 대기 시간 (기본 1000ms) */
+  webhookFlushIntervalMs?: number;
+}
+
+/**
+ * 메모리 저장소 (기본값, 테스트용)
+ */
+export class InMemoryAttioSyncStore implements IAttioSyncStore {
+  readonly records = new Map<string, Map<string, ISyncRecord>>();
+  private readonly checkpoints = new Map<string, ISyncCheckpoint>();
+
+  async upsertRecords(objectType: string, records: ISyncRecord[]): Promise<void> {
+    let table = this.records.get(objectType);
+    if (!table) {
+      table = new Map();
+      this.records.set(objectType, table);
+    }
+    for (const record of records) {
+      table.set(record.id, record);
+    }
+  }
+
+  async deleteRecords(objectType: string, recordIds: string[]): Promise<void> {
+    const table = this.records.get(objectType);
+    for (const id of recordIds) {
+      table?.delete(id);
+    }
+  }
+
+  async loadCheckpoint(objectType: string): Promise<ISyncCheckpoint | null> {
+    const checkpoint = this.checkpoints.get(objectType);
+    return checkpoint ? structuredClone(checkpoint) : null;
+  }
+
+  async saveCheckpoint(objectType: string, checkpoint: ISyncCheckpoint): Promise<void> {
+    this.checkpoints.set(objectType, structuredClone(checkpoint));
+  }
+}
+
+/**
+ * 쓰기 대기 항목 (같은 레코드는 최신 변경만 남김)
+ */
+interface IPendingWrite {
+  objectType: string;
+  id: string;
+  timestamp: number;
+  record: ISyncRecord | null;
+}
+
+/**
+ * 429/5xx 재시도 대상 에러
+ */
+class AttioRetryableError extends Error {
+  constructor(
+    message: string,
+    readonly retryAfterMs: number | null
+  ) {
+    super(message);
+    this.name = 'AttioRetryableError';
+  }
+}
+
+const DEFAULT_OPTIONS = {
+  concurrency: 4,
+  pageSize: 100,
+  writeBatchSize: 500,
+  maxRetries: 5,
+  retryBaseDelayMs: 500,
+  webhookFlushIntervalMs: 1000,
+};
+
+const sleep = (ms: number) => new Promise<void>((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Attio 레코드 → 로컬 저장 레코드
+ */
+function toSyncRecord(record: any): ISyncRecord {
+  return {
+    id: record.id?.record_id || record.id || 'unknown',
+    updatedAt: record.updated_at ?? record.created_at ?? null,
+    data: record,
+  };
+}
+
+/**
+ * 구간 조회 기준 시각 (서버 필터/정렬과 같은 updated_at만 사용)
+ */
+function updatedAtOf(record: any): string | null {
+  return record.updated_at ?? null;
+}
+
+function parseTime(value: string | null | undefined): number {
+  const time = value ? Date.parse(value) : NaN;
+  return Number.isNaN(time) ? 0 : time;
+}
+
 /**
  * Attio Sync Service
  * CRM 데이터 동기화 및 웹훅 처리
+ *
+ * - 객체 타입별 high-water mark로 변경분만 동기화
+ * - 전체 동기화는 필터 없이 offset 페이지를 최대 concurrency개 미리 조회
+ *   (updated_at이 없는 레코드도 포함)
+ * - 변경분 동기화는 updated_at 구간을 나눠 최대 concurrency개 페이지를 동시에 조회
+ * - 레코드/웹훅 이벤트를 모아 writeBatchSize 단위로 로컬 저장
+ * - 저장이 끝난 지점까지 체크포인트를 남겨 실패 시 이어서 진행
  */
 export class AttioSyncService {
   private syncStatus: SyncStatus = 'idle';
+  private readonly store: IAttioSyncStore;
+  private readonly options: typeof DEFAULT_OPTIONS;
+
+  /** 쓰기 대기 레코드 (objectType:id → 최신 변경) */
+  private pendingWrites = new Map<string, IPendingWrite>();
+  /** 대기 중인 웹훅 이벤트의 완료 콜백 */
+  private pendingWebhooks: Array<{ resolve: () => void; reject: (error: unknown) => void }> = [];
+  /** 쓰기가 끝난 뒤 실행할 작업 (성공 여부/실패 원인 전달, 체크포인트 반영) */
+  private pendingCommits: Array<(written: boolean, error?: unknown) => void> = [];
+  private writeChain: Promise<void> = Promise.resolve();
+  private webhookTimer: ReturnType<typeof setTimeout> | null = null;
+  /** 429 응답 후 모든 요청이 대기할 시각 */
+  private cooldownUntil = 0;
 
   constructor(
     private readonly apiKey: string,
-    private readonly baseUrl: string = 'https://api.attio.com/v2'
-  ) {}
+    private readonly baseUrl: string = 'https://api.attio.com/v2',
+    options: IAttioSyncOptions = {}
+  ) {
+    this.store = options.store ?? new InMemoryAttioSyncStore();
+    this.options = {
+      concurrency: options.concurrency ?? DEFAULT_OPTIONS.concurrency,
+      pageSize: options.pageSize ?? DEFAULT_OPTIONS.pageSize,
+      writeBatchSize: options.writeBatchSize ?? DEFAULT_OPTIONS.writeBatchSize,
+      maxRetries: options.maxRetries ?? DEFAULT_OPTIONS.maxRetries,
+      retryBaseDelayMs: options.retryBaseDelayMs ?? DEFAULT_OPTIONS.retryBaseDelayMs,
+      webhookFlushIntervalMs:
+        options.webhookFlushIntervalMs ?? DEFAULT_OPTIONS.webhookFlushIntervalMs,
+    };
+  }
 
   /**
    * 전체 데이터 동기화
+   * (mode: 'incremental'이면 마지막 동기화 이후 변경분만)
    */
   async syncAll(
-    objectTypes: string[] = ['leads', 'deals', 'companies']
+    objectTypes: string[] = ['leads', 'deals', 'companies'],
+    options: { mode?: SyncMode } = {}
   ): Promise<ICRMResponse<ISyncResult>> {
+    const mode = options.mode ?? 'full';
     this.syncStatus = 'syncing';
     const startedAt = new Date().toISOString();
     let totalRecords = 0;
@@ -74,14 +280,14 @@ export class AttioSyncService {
 
     try {
       for (const objectType of objectTypes) {
-        const result = await this.syncObjectType(objectType);
+        const result = await this.syncObjectType(objectType, mode);
         totalRecords += result.total;
         syncedRecords += result.synced;
         failedRecords += result.failed;
         errors.push(...result.errors);
       }
 
-      this.syncStatus = failedRecords > 0 ? 'error' : 'success';
+      this.syncStatus = failedRecords > 0 || errors.length > 0 ? 'error' : 'success';
 
       return {
         success: true,
@@ -114,10 +320,22 @@ export class AttioSyncService {
     }
   }
 
+  /**
+   * 변경분 동기화 (syncAll incremental 모드)
+   */
+  async syncIncremental(
+    objectTypes: string[] = ['leads', 'deals', 'companies']
+  ): Promise<ICRMResponse<ISyncResult>> {
+    return this.syncAll(objectTypes, { mode: 'incremental' });
+  }
+
   /**
    * 특정 객체 타입 동기화
    */
-  private async syncObjectType(objectType: string): Promise<{
+  private async syncObjectType(
+    objectType: string,
+    mode: SyncMode
+  ): Promise<{
     total: number;
     synced: number;
     failed: number;
@@ -130,53 +348,357 @@ export class AttioSyncService {
       errors: [] as Array<{ recordId: string; error: string }>,
     };
 
-    try {
-      let offset = 0;
-      const limit = 100;
-      let hasMore = true;
+    const checkpoint: ISyncCheckpoint = (await this.store.loadCheckpoint(objectType)) ?? {
+      highWaterMark: null,
+      run: null,
+    };
+
+    // 중단된 실행이 있으면 이어서, 없으면 새로 계획
+    // (이전 동기화 기록이 없으면 incremental도 전체 조회)
+    if (!checkpoint.run || checkpoint.run.mode !== mode) {
+      const until = new Date().toISOString();
+      const since = mode === 'incremental' ? checkpoint.highWaterMark : null;
+      checkpoint.run =
+        since === null
+          ? { mode, until, slices: [], offset: 0 }
+          : { mode, until, slices: await this.planSlices(objectType, since, until) };
+      await this.store.saveCheckpoint(objectType, checkpoint);
+    }
+
+    const run = checkpoint.run;
+    // 커밋된 진행 상황 (쓰기가 끝난 페이지까지만 반영)
+    const progress = { ...run, slices: run.slices.map((slice) => ({ ...slice })) };
+    let aborted: unknown = null;
+    // 쓰기가 한 번 실패하면 이후 페이지는 커밋하지 않음 (실패한 페이지를 건너뛰지 않도록)
+    // 웹훅 타이머 등 다른 경로의 flush에서 실패해도 이번 실행은 중단으로 처리
+    let writeFailed = false;
+
+    const saveProgress = () =>
+      this.store.saveCheckpoint(objectType, {
+        highWaterMark: checkpoint.highWaterMark,
+        run: { ...progress, slices: [...progress.slices] },
+      });
+
+    /** 가져온 페이지를 쓰기 대기열에 추가 (저장이 끝나면 commit 실행) */
+    const enqueuePage = async (records: any[], commit: () => void) => {
+      result.total += records.length;
+      this.enqueueRecords(objectType, records.map(toSyncRecord), (written, error) => {
+        if (!written) {
+          writeFailed = true;
+          aborted ??= error ?? new Error(`Failed to write ${objectType} records`);
+        }
+        if (writeFailed) return;
+        commit();
+        result.synced += records.length;
+      });
+
+      if (this.pendingWrites.size >= this.options.writeBatchSize) {
+        await this.flush(saveProgress).catch((error) => {
+          aborted ??= error;
+        });
+      }
+    };
+
+    let workers: Array<() => Promise<void>>;
+
+    if (progress.offset !== undefined) {
+      // 전체 동기화: 페이지는 순서와 무관하게 저장되지만,
+      // 진행 위치는 앞에서부터 연속으로 저장된 페이지까지만 이동
+      const pageSize = this.options.pageSize;
+      const writtenPages = new Set<number>();
+      let nextOffset = progress.offset;
+      let committedOffset = progress.offset;
+      let exhausted = false;
+
+      const worker = async () => {
+        while (!exhausted && !aborted) {
+          const offset = nextOffset;
+          nextOffset += pageSize;
+
+          let records: any[];
+          try {
+            records = await this.queryRecords(objectType, { limit: pageSize, offset });
+          } catch (error) {
+            aborted ??= error;
+            return;
+          }
+
+          if (records.length < pageSize) exhausted = true;
+          await enqueuePage(records, () => {
+            writtenPages.add(offset);
+            while (writtenPages.delete(committedOffset)) {
+              committedOffset += pageSize;
+            }
+            progress.offset = committedOffset;
+          });
+        }
+      };
+      workers = Array.from({ length: Math.max(1, this.options.concurrency) }, () => worker);
+    } else {
+      // 변경분 동기화: updated_at 구간별로 커서를 옮기며 조회
+      const queue = run.slices.map((slice, index) => ({ slice: { ...slice }, index }));
+
+      const worker = async () => {
+        for (let item = queue.shift(); item && !aborted; item = queue.shift()) {
+          const { slice, index } = item;
+
+          while (!slice.done && !aborted) {
+            let records: any[];
+            try {
+              records = await this.fetchPage(objectType, slice);
+            } catch (error) {
+              aborted ??= error;
+              return;
+            }
+
+            this.advanceSlice(slice, records);
+            const snapshot = { ...slice };
+            await enqueuePage(records, () => {
+              progress.slices[index] = snapshot;
+            });
+          }
+        }
+      };
+      const workerCount = Math.max(1, Math.min(this.options.concurrency, queue.length));
+      workers = Array.from({ length: workerCount }, () => worker);
+    }
+
+    await Promise.all(workers.map((worker) => worker()));
+
+    // 남은 레코드 저장 (중단된 경우에도 가져온 만큼은 커밋)
+    await this.flush(saveProgress).catch((error) => {
+      aborted ??= error;
+    });
+
+    if (aborted || writeFailed) {
+      result.failed = result.total - result.synced;
+      result.errors.push({
+        recordId: objectType,
+        error: aborted instanceof Error ? aborted.message : String(aborted),
+      });
+      return result;
+    }
+
+    // 모든 페이지 완료 → high-water mark 갱신
+    await this.store.saveCheckpoint(objectType, {
+      highWaterMark: run.until,
+      run: null,
+    });
+
+    return result;
+  }
 
-      while (hasMore) {
+  /**
+   * [since, until] 구간을 concurrency개 구간으로 분할
+   * (since ~ 실제 레코드가 있는 최신 변경 시각 기준으로 나눔)
+   */
+  private async planSlices(objectType: string, since: string, until: string): Promise<ISyncSlice[]> {
+    const [record] = await this.queryRecords(objectType, {
+      filter: { updated_at: { $gte: since, $lte: until } },
+      sorts: [{ attribute: 'updated_at', direction: 'desc' }],
+      limit: 1,
+      offset: 0,
+    });
+    const newest = record ? updatedAtOf(record) : null;
+    if (newest === null) {
+      return [];
+    }
+
+    const from = since;
+    const start = parseTime(from);
+    // 마지막 구간은 until까지 포함
+    const end = parseTime(until) + 1;
+    const last = Math.min(Math.max(parseTime(newest), start) + 1, end);
+    const count = Math.max(1, Math.min(this.options.concurrency, last - start));
+    const step = (last - start) / count;
+
+    return Array.from({ length: count }, (_, i) => {
+      const sliceFrom = i === 0 ? from : new Date(Math.floor(start + step * i)).toISOString();
+      const sliceTo =
+        i === count - 1
+          ? new Date(end).toISOString()
+          : new Date(Math.floor(start + step * (i + 1))).toISOString();
+      return { from: sliceFrom, to: sliceTo, cursor: sliceFrom, skip: 0, done: false };
+    });
+  }
+
+  /**
+   * 구간의 다음 페이지 조회
+   */
+  private fetchPage(objectType: string, slice: ISyncSlice): Promise<any[]> {
+    return this.queryRecords(objectType, {
+      filter: { updated_at: { $gte: slice.cursor, $lt: slice.to } },
+      sorts: [{ attribute: 'updated_at', direction: 'asc' }],
+      limit: this.options.pageSize,
+      offset: slice.skip,
+    });
+  }
+
+  /**
+   * 페이지 결과로 구간 커서 이동
+   * (같은 시각 레코드가 페이지 경계에 걸치면 skip으로 이어서 조회)
+   */
+  private advanceSlice(slice: ISyncSlice, records: any[]): void {
+    if (records.length < this.options.pageSize) {
+      slice.done = true;
+      return;
+    }
+
+    const lastAt = updatedAtOf(records[records.length - 1]) ?? slice.cursor;
+    if (parseTime(lastAt) === parseTime(slice.cursor)) {
+      slice.skip += records.length;
+      return;
+    }
+
+    let sameAt = 0;
+    for (const record of records) {
+      if (parseTime(updatedAtOf(record)) === parseTime(lastAt)) sameAt++;
+    }
+    slice.cursor = lastAt;
+    slice.skip = sameAt;
+  }
+
+  /**
+   * 레코드 조회 (429/5xx는 대기 후 재시도)
+   */
+  private async queryRecords(
+    objectType: string,
+    query: { filter?: unknown; sorts?: unknown[]; limit: number; offset: number }
+  ): Promise<any[]> {
+    for (let attempt = 0; ; attempt++) {
+      const wait = this.cooldownUntil - Date.now();
+      if (wait > 0) {
+        await sleep(wait);
+      }
+
+      try {
         const response = await fetch(`${this.baseUrl}/objects/${objectType}/records/query`, {
           method: 'POST',
           headers: {
             Authorization: `Bearer ${this.apiKey}`,
             'Content-Type': 'application/json',
           },
-          body: JSON.stringify({
-            limit,
-            offset,
-          }),
+          body: JSON.stringify(query),
         });
 
+        if (response.status === 429 || response.status >= 500) {
+          const retryAfter = Number(response.headers.get('retry-after'));
+          throw new AttioRetryableError(
+            `Failed to fetch ${objectType}: ${response.status} ${response.statusText}`,
+            Number.isFinite(retryAfter) && response.headers.has('retry-after')
+              ? retryAfter * 1000
+              : null
+          );
+        }
+
         if (!response.ok) {
           throw new Error(`Failed to fetch ${objectType}: ${response.statusText}`);
         }
 
         const data = (await response.json()) as any;
-        const records = data.data || [];
-        result.total += records.length;
-
-        for (const record of records) {
-          try {
-            // 로컬 DB에 저장하는 로직 (실제 구현 필요)
-            await this.saveToLocalDB(objectType, record);
-            result.synced++;
-          } catch (error) {
-            result.failed++;
-            result.errors.push({
-              recordId: record.id?.record_id || 'unknown',
-              error: error instanceof Error ? error.message : 'Unknown error',
-            });
-          }
+        return data.data || [];
+      } catch (error) {
+        const retryable = error instanceof AttioRetryableError || error instanceof TypeError;
+        if (!retryable || attempt >= this.options.maxRetries) {
+          throw error;
         }
 
-        hasMore = data.has_more || false;
-        offset += limit;
+        const backoff =
+          (error instanceof AttioRetryableError ? error.retryAfterMs : null) ??
+          this.options.retryBaseDelayMs * 2 ** attempt * (0.5 + Math.random() / 2);
+
+        // 429는 다른 요청도 함께 대기
+        this.cooldownUntil = Math.max(this.cooldownUntil, Date.now() + backoff);
       }
+    }
+  }
 
-      return result;
-    } catch (error) {
-      throw error;
+  /**
+   * 쓰기 대기열에 추가 (같은 레코드는 더 최근 변경만 유지)
+   */
+  private enqueueWrite(write: IPendingWrite): void {
+    const key = `${write.objectType}:${write.id}`;
+    const existing = this.pendingWrites.get(key);
+    if (!existing || existing.timestamp <= write.timestamp) {
+      this.pendingWrites.set(key, write);
+    }
+  }
+
+  private enqueueRecords(
+    objectType: string,
+    records: ISyncRecord[],
+    onCommit: (written: boolean, error?: unknown) => void
+  ): void {
+    for (const record of records) {
+      this.enqueueWrite({
+        objectType,
+        id: record.id,
+        timestamp: parseTime(record.updatedAt),
+        record,
+      });
+    }
+    this.pendingCommits.push(onCommit);
+  }
+
+  /**
+   * 대기 중인 레코드/웹훅 이벤트를 한 번에 저장
+   * (쓰기는 순서대로 하나씩, 끝나면 체크포인트 반영)
+   */
+  private flush(afterCommit?: () => Promise<void>): Promise<void> {
+    const writes = [...this.pendingWrites.values()];
+    const commits = this.pendingCommits;
+    const webhooks = this.pendingWebhooks;
+    this.pendingWrites = new Map();
+    this.pendingCommits = [];
+    this.pendingWebhooks = [];
+
+    if (this.webhookTimer) {
+      clearTimeout(this.webhookTimer);
+      this.webhookTimer = null;
+    }
+
+    const flushed = this.writeChain.then(async () => {
+      try {
+        await this.writeBatch(writes);
+      } catch (error) {
+        commits.forEach((commit) => commit(false, error));
+        webhooks.forEach(({ reject }) => reject(error));
+        throw error;
+      }
+
+      commits.forEach((commit) => commit(true));
+      try {
+        if (afterCommit) await afterCommit();
+      } finally {
+        webhooks.forEach(({ resolve }) => resolve());
+      }
+    });
+
+    // 실패해도 다음 쓰기는 진행
+    this.writeChain = flushed.catch(() => undefined);
+    return flushed;
+  }
+
+  private async writeBatch(writes: IPendingWrite[]): Promise<void> {
+    const byObjectType = new Map<string, { upserts: ISyncRecord[]; deletes: string[] }>();
+
+    for (const write of writes) {
+      let group = byObjectType.get(write.objectType);
+      if (!group) {
+        group = { upserts: [], deletes: [] };
+        byObjectType.set(write.objectType, group);
+      }
+      if (write.record) group.upserts.push(write.record);
+      else group.deletes.push(write.id);
+    }
+
+    for (const [objectType, { upserts, deletes }] of byObjectType) {
+      for (let i = 0; i < upserts.length; i += this.options.writeBatchSize) {
+        await this.store.upsertRecords(objectType, upserts.slice(i, i + this.options.writeBatchSize));
+      }
+      if (deletes.length > 0) {
+        await this.store.deleteRecords(objectType, deletes);
+      }
     }
   }
 
@@ -244,25 +766,51 @@ export class AttioSyncService {
 
   /**
    * 웹훅 이벤트 처리
+   * 이벤트는 쓰기 대기열에 모였다가 다음 배치(동기화 배치 포함)와 함께 저장되며,
+   * 반환된 Promise는 저장이 끝나면 완료됨
    */
   async handleWebhookEvent(event: IWebhookEvent): Promise<void> {
     try {
       switch (event.type) {
         case 'record.created':
-          await this.handleRecordCreated(event);
-          break;
         case 'record.updated':
-          await this.handleRecordUpdated(event);
+          this.enqueueWrite({
+            objectType: event.objectType,
+            id: event.recordId,
+            timestamp: parseTime(event.timestamp),
+            record: { id: event.recordId, updatedAt: event.timestamp, data: event.data },
+          });
           break;
         case 'record.deleted':
-          await this.handleRecordDeleted(event);
+          this.enqueueWrite({
+            objectType: event.objectType,
+            id: event.recordId,
+            timestamp: parseTime(event.timestamp),
+            record: null,
+          });
           break;
         case 'list.updated':
           await this.handleListUpdated(event);
-          break;
+          return;
         default:
           console.warn(`Unknown webhook event type: ${event.type}`);
+          return;
       }
+
+      const written = new Promise<void>((resolve, reject) => {
+        this.pendingWebhooks.push({ resolve, reject });
+      });
+
+      if (this.pendingWrites.size >= this.options.writeBatchSize) {
+        this.flush().catch(() => undefined);
+      } else {
+        this.webhookTimer ??= setTimeout(() => {
+          this.webhookTimer = null;
+          this.flush().catch(() => undefined);
+        }, this.options.webhookFlushIntervalMs);
+      }
+
+      await written;
     } catch (error) {
       console.error('Failed to handle webhook event:', error);
       throw error;
@@ -270,46 +818,17 @@ export class AttioSyncService {
   }
 
   /**
-   * 현재 동기화 상태 조회
-   */
-  getSyncStatus(): SyncStatus {
-    return this.syncStatus;
-  }
-
-  /**
-   * 로컬 DB에 저장 (구현 필요)
+   * 대기 중인 웹훅 이벤트 즉시 저장
    */
-  private async saveToLocalDB(objectType: string, record: unknown): Promise<void> {
-    // Supabase나 다른 로컬 DB에 저장하는 로직
-    // 실제 구현은 프로젝트 요구사항에 따라 작성
-    console.log(`Saving ${objectType} record:`, record);
+  async flushWebhookEvents(): Promise<void> {
+    await this.flush();
   }
 
   /**
-   * 레코드 생성 이벤트 처리
-   */
-  private async handleRecordCreated(event: IWebhookEvent): Promise<void> {
-    console.log('Record created:', event);
-    // 로컬 DB에 새 레코드 추가
-    await this.saveToLocalDB(event.objectType, event.data);
-  }
-
-  /**
-   * 레코드 업데이트 이벤트 처리
-   */
-  private async handleRecordUpdated(event: IWebhookEvent): Promise<void> {
-    console.log('Record updated:', event);
-    // 로컬 DB 레코드 업데이트
-    await this.saveToLocalDB(event.objectType, event.data);
-  }
-
-  /**
-   * 레코드 삭제 이벤트 처리
+   * 현재 동기화 상태 조회
    */
-  private async handleRecordDeleted(event: IWebhookEvent): Promise<void> {
-    console.log('Record deleted:', event);
-    // 로컬 DB에서 레코드 삭제
-    // 실제 구현 필요
+  getSyncStatus(): SyncStatus {
+    return this.syncStatus;
   }
 
   /**
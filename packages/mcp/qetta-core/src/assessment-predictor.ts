@@ -51,6 +51,11 @@ export interface AssessmentPrediction {
   source: 'historical' | 'pattern' | 'default';
 }
 
+export interface AssessmentPredictorSnapshot {
+  patterns: Array<[string, AssessmentPattern]>;
+  historicalRates: Array<[string, number[]]>;
+}
+
 export type OrgType = 'central' | 'local' | 'public_corp' | 'education' | 'military';
 export type PriceRange = 'under_50m' | '50m_100m' | '100m_500m' | '500m_1b' | '1b_5b' | 'over_5b';
 
@@ -428,6 +433,24 @@ export class AssessmentRatePredictor {
       this.patterns.set(this.normalizeOrgName(pattern.organizationName), pattern);
     }
   }
+
+  /**
+   * 전체 상태 스냅샷 (워커 복제용 - 키/순서 그대로 보존)
+   */
+  public snapshot(): AssessmentPredictorSnapshot {
+    return {
+      patterns: Array.from(this.patterns.entries()),
+      historicalRates: Array.from(this.historicalRates.entries()),
+    };
+  }
+
+  /**
+   * 스냅샷으로 상태 복원
+   */
+  public restore(snapshot: AssessmentPredictorSnapshot): void {
+    this.patterns = new Map(snapshot.patterns);
+    this.historicalRates = new Map(snapshot.historicalRates);
+  }
 }
 
 // ============================================================
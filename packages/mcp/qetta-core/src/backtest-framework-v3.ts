@@ -210,10 +210,27 @@ export class BacktestEngineV3 {
       throw new Error('No bids match the filter criteria');
     }
 
+    const result = this.evaluate(config, filteredBids);
+
+    console.log(`Backtest v3 completed in ${Date.now() - startTime}ms`);
+
+    return result;
+  }
+
+  /**
+   * 필터링된 입찰로 결과 생성 (run / 파라미터 스윕 공용)
+   *
+   * @param predict - 입찰별 예측 (스윕에서는 전략 단위 메모이즈된 예측을 주입)
+   */
+  public evaluate(
+    config: BacktestConfigV3,
+    filteredBids: HistoricalBidV3[],
+    predict: (bid: HistoricalBidV3) => BidStrategyV3 = (bid) => this.predictBid(bid, config)
+  ): BacktestResultV3 {
     // 2. 각 입찰 분석
     const details: BacktestDetailV3[] = [];
     for (const bid of filteredBids) {
-      const result = this.analyzeBid(bid, config);
+      const result = this.analyzeBid(bid, config, predict(bid));
       details.push(result);
     }
 
@@ -241,8 +258,6 @@ export class BacktestEngineV3 {
       end: filteredBids.reduce((max, b) => b.deadline > max ? b.deadline : max, filteredBids[0].deadline),
     };
 
-    console.log(`Backtest v3 completed in ${Date.now() - startTime}ms`);
-
     return {
       config,
       totalBids: this.historicalBids.length,
@@ -257,9 +272,11 @@ export class BacktestEngineV3 {
     };
   }
 
-  private analyzeBid(bid: HistoricalBidV3, config: BacktestConfigV3): BacktestDetailV3 {
-    // v3 엔진으로 예측
-    const prediction = generateBidPredictionV3({
+  /**
+   * v3 엔진 예측 (config 중 tenantId / productId / strategy에만 의존)
+   */
+  public predictBid(bid: HistoricalBidV3, config: BacktestConfigV3): BidStrategyV3 {
+    return generateBidPredictionV3({
       bidId: bid.id,
       bidTitle: bid.title,
       organization: bid.organization,
@@ -285,7 +302,13 @@ export class BacktestEngineV3 {
       isUrgent: bid.isUrgent,
       category: bid.category,
     });
+  }
 
+  private analyzeBid(
+    bid: HistoricalBidV3,
+    config: BacktestConfigV3,
+    prediction: BidStrategyV3
+  ): BacktestDetailV3 {
     // 실제 예정가격 계산
     const actualBudgetPrice = bid.estimatedPrice * bid.actualResult.assessmentRate;
 
@@ -0,0 +1,369 @@
+/**
+ * Qetta 백테스트 v3 파라미터 스윕
+ *
+ * 여러 BacktestConfigV3 변형을 한 번에 평가:
+ * 1. 과거 입찰을 한 번만 적재해 typed-array 컬럼 스토어로 변환
+ * 2. 필터는 컬럼 스캔 (기관/카테고리는 사전 인코딩)
+ * 3. v3 예측은 (tenantId, productId, strategy) 단위로 입찰별 1회만 계산
+ * 4. 설정 그리드를 worker_threads로 분산
+ *
+ * 결과 집계는 BacktestEngineV3.evaluate를 그대로 사용하므로
+ * 순차 run()과 비트 단위로 동일하다.
+ */
+
+import { availableParallelism } from 'node:os';
+import { extname } from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { Worker } from 'node:worker_threads';
+import type { BidStrategyV3 } from './bidding-engine-v3.js';
+import {
+  BacktestEngineV3,
+  type BacktestConfigV3,
+  type BacktestDetailV3,
+  type BacktestResultV3,
+  type HistoricalBidV3,
+} from './backtest-framework-v3.js';
+import {
+  getAssessmentPredictor,
+  type AssessmentPredictorSnapshot,
+} from './assessment-predictor.js';
+
+// ============================================================
+// 타입 정의
+// ============================================================
+
+export interface SweepOptionsV3 {
+  /** 워커 수 (0 = 현재 스레드에서 실행, 기본: CPU 수 - 1) */
+  workers?: number;
+  /** 워커 하나에 배정할 최소 설정 수 (기본 4) */
+  minConfigsPerWorker?: number;
+  /** 입찰별 상세 결과 포함 여부 (기본 false - 워커 간 전송량 절감) */
+  includeDetails?: boolean;
+}
+
+export type SweepResultV3 = Omit<BacktestResultV3, 'details'> & {
+  details?: BacktestDetailV3[];
+};
+
+export interface SweepEntryV3 {
+  config: BacktestConfigV3;
+  /** 필터 결과가 비어 있으면 undefined */
+  result?: SweepResultV3;
+  error?: string;
+}
+
+export interface SweepReportV3 {
+  entries: SweepEntryV3[];
+  totalBids: number;
+  workersUsed: number;
+  predictionsComputed: number;
+  elapsedMs: number;
+}
+
+/** @internal 워커 입력 */
+export interface SweepWorkerData {
+  bids: HistoricalBidV3[];
+  configs: BacktestConfigV3[];
+  includeDetails: boolean;
+  assessmentState: AssessmentPredictorSnapshot;
+}
+
+/** @internal 워커 출력 */
+export interface SweepWorkerOutput {
+  entries: SweepEntryV3[];
+  predictionsComputed: number;
+}
+
+// ============================================================
+// 컬럼 스토어
+// ============================================================
+
+/**
+ * 과거 입찰 컬럼 스토어
+ *
+ * 필터에 쓰이는 값만 typed array로 보관하고,
+ * 예측 입력(회사 스냅샷 등)은 원본 행 참조로 유지한다.
+ */
+export class HistoricalBidColumnsV3 {
+  public readonly length: number;
+  public readonly deadlineMs: Float64Array;
+  public readonly estimatedPrice: Float64Array;
+  /** 기관 사전 인덱스 */
+  public readonly organizationId: Uint32Array;
+  /** 카테고리 사전 인덱스 (-1 = 없음) */
+  public readonly categoryId: Int32Array;
+  public readonly organizations: string[] = [];
+  public readonly categories: string[] = [];
+
+  constructor(public readonly rows: HistoricalBidV3[]) {
+    const n = rows.length;
+    this.length = n;
+    this.deadlineMs = new Float64Array(n);
+    this.estimatedPrice = new Float64Array(n);
+    this.organizationId = new Uint32Array(n);
+    this.categoryId = new Int32Array(n);
+
+    const orgIndex = new Map<string, number>();
+    const categoryIndex = new Map<string, number>();
+
+    for (let i = 0; i < n; i++) {
+      const bid = rows[i];
+      this.deadlineMs[i] = new Date(bid.deadline).getTime();
+      this.estimatedPrice[i] = bid.estimatedPrice;
+
+      let orgId = orgIndex.get(bid.organization);
+      if (orgId === undefined) {
+        orgId = this.organizations.push(bid.organization) - 1;
+        orgIndex.set(bid.organization, orgId);
+      }
+      this.organizationId[i] = orgId;
+
+      if (bid.category) {
+        let catId = categoryIndex.get(bid.category);
+        if (catId === undefined) {
+          catId = this.categories.push(bid.category) - 1;
+          categoryIndex.set(bid.category, catId);
+        }
+        this.categoryId[i] = catId;
+      } else {
+        this.categoryId[i] = -1;
+      }
+    }
+  }
+
+  /**
+   * BacktestEngineV3.filterBids와 동일한 조건으로 행 인덱스 선택
+   */
+  public select(config: BacktestConfigV3): Uint32Array {
+    // 기관 필터: 사전 항목별로 한 번만 부분 문자열 검사
+    let orgMask: Uint8Array | null = null;
+    if (config.organizations?.length) {
+      const filters = config.organizations;
+      orgMask = new Uint8Array(this.organizations.length);
+      for (let o = 0; o < this.organizations.length; o++) {
+        const name = this.organizations[o];
+        orgMask[o] = filters.some(org => name.includes(org)) ? 1 : 0;
+      }
+    }
+
+    let categoryMask: Uint8Array | null = null;
+    if (config.categories?.length) {
+      categoryMask = new Uint8Array(this.categories.length);
+      for (let c = 0; c < this.categories.length; c++) {
+        categoryMask[c] = config.categories.includes(this.categories[c]) ? 1 : 0;
+      }
+    }
+
+    const start = config.dateRange ? config.dateRange.start.getTime() : NaN;
+    const end = config.dateRange ? config.dateRange.end.getTime() : NaN;
+    const minPrice = config.minPrice;
+    const maxPrice = config.maxPrice;
+
+    const selected = new Uint32Array(this.length);
+    let count = 0;
+
+    for (let i = 0; i < this.length; i++) {
+      if (config.dateRange) {
+        const deadline = this.deadlineMs[i];
+        if (deadline < start || deadline > end) continue;
+      }
+      if (orgMask && !orgMask[this.organizationId[i]]) continue;
+      if (categoryMask) {
+        const catId = this.categoryId[i];
+        if (catId < 0 || !categoryMask[catId]) continue;
+      }
+      const price = this.estimatedPrice[i];
+      if (minPrice && price < minPrice) continue;
+      if (maxPrice && price > maxPrice) continue;
+      selected[count++] = i;
+    }
+
+    return selected.subarray(0, count);
+  }
+}
+
+// ============================================================
+// 스윕 실행
+// ============================================================
+
+function predictionKey(config: BacktestConfigV3): string {
+  return `${config.tenantId}\u0000${config.productId}\u0000${config.strategy}`;
+}
+
+/**
+ * 현재 스레드에서 설정 그리드 평가
+ */
+export function runSweepInProcess(
+  bids: HistoricalBidV3[],
+  configs: BacktestConfigV3[],
+  includeDetails: boolean = false
+): SweepWorkerOutput {
+  const engine = new BacktestEngineV3();
+  engine.loadData(bids);
+  const columns = new HistoricalBidColumnsV3(bids);
+
+  // 예측 캐시: 전략 키 → 행 인덱스별 예측
+  const predictionCache = new Map<string, Array<BidStrategyV3 | undefined>>();
+  let predictionsComputed = 0;
+
+  const entries = configs.map((config): SweepEntryV3 => {
+    const indices = columns.select(config);
+    if (indices.length === 0) {
+      return { config, error: 'No bids match the filter criteria' };
+    }
+
+    const key = predictionKey(config);
+    let predictions = predictionCache.get(key);
+    if (!predictions) {
+      predictions = new Array(columns.length);
+      predictionCache.set(key, predictions);
+    }
+
+    const filteredBids: HistoricalBidV3[] = new Array(indices.length);
+    const rowOf = new Map<HistoricalBidV3, number>();
+    for (let i = 0; i < indices.length; i++) {
+      filteredBids[i] = columns.rows[indices[i]];
+      rowOf.set(filteredBids[i], indices[i]);
+    }
+
+    const cache = predictions;
+    const result = engine.evaluate(config, filteredBids, (bid) => {
+      const row = rowOf.get(bid)!;
+      let prediction = cache[row];
+      if (!prediction) {
+        prediction = engine.predictBid(bid, config);
+        cache[row] = prediction;
+        predictionsComputed++;
+      }
+      return prediction;
+    });
+
+    if (includeDetails) {
+      return { config, result };
+    }
+    const { details: _details, ...summary } = result;
+    return { config, result: summary };
+  });
+
+  return { entries, predictionsComputed };
+}
+
+/**
+ * 같은 예측 키끼리 같은 워커에 배정되도록 그리드 분할
+ */
+function partitionConfigs(configs: BacktestConfigV3[], workers: number): number[][] {
+  const order = configs
+    .map((config, index) => ({ key: predictionKey(config), index }))
+    .sort((a, b) => (a.key < b.key ? -1 : a.key > b.key ? 1 : a.index - b.index));
+
+  const chunkSize = Math.ceil(order.length / workers);
+  const chunks: number[][] = [];
+  for (let i = 0; i < order.length; i += chunkSize) {
+    chunks.push(order.slice(i, i + chunkSize).map(o => o.index));
+  }
+  return chunks;
+}
+
+// 빌드 결과(.js)와 소스 실행(tsx, vitest의 .ts) 모두에서 같은 확장자의 워커를 사용
+const WORKER_URL = new URL(
+  `./backtest-sweep-v3.worker${extname(fileURLToPath(import.meta.url))}`,
+  import.meta.url
+);
+
+/** 워커 엔트리 자체를 적재하지 못한 경우의 오류 코드 */
+const WORKER_LOAD_ERRORS = new Set([
+  'ERR_UNKNOWN_FILE_EXTENSION',
+  'ERR_MODULE_NOT_FOUND',
+  'MODULE_NOT_FOUND',
+]);
+
+/**
+ * 워커에서 배정된 설정 평가
+ *
+ * 워커 엔트리를 적재할 수 없는 환경(로더 없이 .ts 실행 등)에서는
+ * 현재 스레드에서 같은 결과를 계산한다.
+ */
+function runWorker(data: SweepWorkerData): Promise<SweepWorkerOutput> {
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(WORKER_URL, { workerData: data });
+    worker.once('message', (output: SweepWorkerOutput) => resolve(output));
+    worker.once('error', (error: NodeJS.ErrnoException) => {
+      if (error.code && WORKER_LOAD_ERRORS.has(error.code)) {
+        resolve(runSweepInProcess(data.bids, data.configs, data.includeDetails));
+      } else {
+        reject(error);
+      }
+    });
+    worker.once('exit', (code) => {
+      if (code !== 0) reject(new Error(`Sweep worker exited with code ${code}`));
+    });
+  });
+}
+
+/**
+ * 파라미터 스윕 실행
+ *
+ * 각 설정에 대해 run(config)와 동일한 결과를 반환한다.
+ * 필터 결과가 비어 run이 throw하는 설정은 error로 기록된다.
+ */
+export async function runBacktestSweepV3(
+  bids: HistoricalBidV3[],
+  configs: BacktestConfigV3[],
+  options: SweepOptionsV3 = {}
+): Promise<SweepReportV3> {
+  const startTime = Date.now();
+  const includeDetails = options.includeDetails ?? false;
+  const minPerWorker = Math.max(1, options.minConfigsPerWorker ?? 4);
+  const maxWorkers = options.workers ?? Math.max(1, availableParallelism() - 1);
+  const workers = Math.min(maxWorkers, Math.floor(configs.length / minPerWorker));
+
+  let entries: SweepEntryV3[];
+  let predictionsComputed = 0;
+
+  if (workers <= 1) {
+    const output = runSweepInProcess(bids, configs, includeDetails);
+    entries = output.entries;
+    predictionsComputed = output.predictionsComputed;
+  } else {
+    // 워커는 부모 스레드의 사정률 예측기 상태를 그대로 복제해 사용
+    const assessmentState = getAssessmentPredictor().snapshot();
+    const chunks = partitionConfigs(configs, workers);
+    const outputs = await Promise.all(
+      chunks.map(chunk =>
+        runWorker({
+          bids,
+          configs: chunk.map(i => configs[i]),
+          includeDetails,
+          assessmentState,
+        })
+      )
+    );
+
+    entries = new Array(configs.length);
+    chunks.forEach((chunk, c) => {
+      const output = outputs[c];
+      predictionsComputed += output.predictionsComputed;
+      chunk.forEach((configIndex, j) => {
+        // 원본 config 객체 참조 유지 (run 결과와 동일)
+        entries[configIndex] = { ...output.entries[j], config: configs[configIndex] };
+        if (entries[configIndex].result) {
+          entries[configIndex].result!.config = configs[configIndex];
+        }
+      });
+    });
+  }
+
+  const elapsedMs = Date.now() - startTime;
+  console.log(
+    `Backtest v3 sweep: ${configs.length} configs × ${bids.length} bids in ${elapsedMs}ms ` +
+    `(${Math.max(1, workers)} worker(s), ${predictionsComputed} predictions)`
+  );
+
+  return {
+    entries,
+    totalBids: bids.length,
+    workersUsed: Math.max(1, workers),
+    predictionsComputed,
+    elapsedMs,
+  };
+}
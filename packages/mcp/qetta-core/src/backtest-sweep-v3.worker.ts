@@ -0,0 +1,16 @@
+/**
+ * Qetta 백테스트 v3 파라미터 스윕 워커
+ *
+ * runBacktestSweepV3가 생성. 부모의 사정률 예측기 상태를 복원한 뒤
+ * 배정된 설정만 평가해 결과를 돌려준다.
+ */
+
+import { parentPort, workerData } from 'node:worker_threads';
+import { getAssessmentPredictor } from './assessment-predictor.js';
+import { runSweepInProcess, type SweepWorkerData } from './backtest-sweep-v3.js';
+
+const data = workerData as SweepWorkerData;
+
+getAssessmentPredictor().restore(data.assessmentState);
+
+parentPort?.postMessage(runSweepInProcess(data.bids, data.configs, data.includeDetails));
@@ -6,12 +6,25 @@
  * - 기관별 학습 시스템
  * - 민감도 분석
  * - 시나리오 기반 전략 제안
+ * - 일괄 최적화 (투찰률 곡선 그리드 + 메모)
  */
 
 import type { BidInfo } from './bidding-engine.js';
 import { erf } from './bidding-engine.js';
 import type { EnhancedCompanyProfile } from './qualification-scorer.js';
-import { EnhancedQualificationScorer } from './qualification-scorer.js';
+import {
+  EnhancedQualificationScorer,
+  calculatePriceScore,
+  combineQualificationTotal,
+} from './qualification-scorer.js';
+import {
+  LruCache,
+  WinningRateHistogram,
+  buildRateGrid,
+  getPriceBand,
+  normalCdfCurve,
+  priceScoreCurve,
+} from './bid-rate-grid.js';
 
 // ============================================================
 // 타입 정의
@@ -28,6 +41,17 @@ export interface OptimizationRequest {
   targetMinScore?: number;  // 최소 적격심사 점수 (기본 85)
 }
 
+/**
+ * 일괄 최적화 요청
+ * 투찰률 분포/경쟁사 수 미지정 시 기관(가격대별) 낙찰률 분포와 학습 데이터로 채움
+ */
+export interface BatchOptimizationRequest
+  extends Omit<OptimizationRequest, 'bidRateMean' | 'bidRateStdDev' | 'expectedCompetitors'> {
+  bidRateMean?: number;
+  bidRateStdDev?: number;
+  expectedCompetitors?: number;
+}
+
 export interface OptimizationResult {
   // 최적 투찰률
   optimalBidRate: number;
@@ -101,10 +125,21 @@ export interface OrgLearningData {
   lastUpdated: Date;
 }
 
+// 낙찰률 분포 최소 표본 수 (미만이면 상위 분포 사용: 기관×가격대 → 기관 → 전체)
+const MIN_DISTRIBUTION_SAMPLES = 5;
+
+// 기관명 조회 캐시 최대 크기
+const MAX_RESOLVED_KEYS = 10000;
+
 // 기관별 학습 데이터 저장소 (싱글톤)
 class OrgLearningStore {
   private static instance: OrgLearningStore;
   private data: Map<string, OrgLearningData> = new Map();
+  // 낙찰률 누적 히스토그램 (기관, 기관|가격대)
+  private distributions: Map<string, WinningRateHistogram> = new Map();
+  private overallDistribution = new WinningRateHistogram();
+  // 조회 기관명 → 저장된 기관 키 (부분 매칭 결과, null = 없음)
+  private resolvedKeys: Map<string, string | null> = new Map();
 
   private constructor() {
     // 기본 데이터 초기화
@@ -162,22 +197,47 @@ class OrgLearningStore {
   }
 
   public get(organization: string): OrgLearningData | undefined {
+    const key = this.resolveKey(organization);
+    return key === null ? undefined : this.data.get(key);
+  }
+
+  /**
+   * 기관명 → 저장된 기관 키 (정확히 매칭 → 부분 매칭)
+   * 부분 매칭 결과는 새 기관이 추가될 때까지 캐시
+   */
+  private resolveKey(organization: string): string | null {
     // 정확히 매칭
     if (this.data.has(organization)) {
-      return this.data.get(organization);
+      return organization;
+    }
+
+    const cached = this.resolvedKeys.get(organization);
+    if (cached !== undefined) {
+      return cached;
     }
 
     // 부분 매칭
-    for (const [key, value] of this.data.entries()) {
+    let resolved: string | null = null;
+    for (const key of this.data.keys()) {
       if (organization.includes(key) || key.includes(organization)) {
-        return value;
+        resolved = key;
+        break;
       }
     }
 
-    return undefined;
+    if (this.resolvedKeys.size >= MAX_RESOLVED_KEYS) {
+      this.resolvedKeys.clear();
+    }
+    this.resolvedKeys.set(organization, resolved);
+    return resolved;
   }
 
   public update(organization: string, newData: Partial<OrgLearningData>): void {
+    if (!this.data.has(organization)) {
+      // 새 기관이 앞선 부분 매칭 결과를 바꿀 수 있음
+      this.resolvedKeys.clear();
+    }
+
     const existing = this.get(organization);
     if (existing) {
       this.data.set(organization, { ...existing, ...newData, lastUpdated: new Date() });
@@ -204,6 +264,8 @@ class OrgLearningStore {
     month: number,
     priceRange: string
   ): void {
+    this.recordWinningRate(organization, priceRange, winningRate);
+
     const existing = this.get(organization);
     if (existing) {
       // 이동 평균 업데이트
@@ -240,14 +302,117 @@ class OrgLearningStore {
   public getAll(): OrgLearningData[] {
     return Array.from(this.data.values());
   }
+
+  /**
+   * 낙찰률 분포 조회
+   * 기관×가격대 → 기관 → 전체 순으로 표본이 충분한 분포 반환, 기관 미지정 시 전체 분포
+   */
+  public getWinningRateDistribution(
+    organization?: string,
+    priceRange?: string
+  ): WinningRateHistogram | undefined {
+    if (organization) {
+      const key = this.resolveKey(organization) ?? organization;
+
+      if (priceRange) {
+        const byPriceRange = this.distributions.get(`${key}|${priceRange}`);
+        if (byPriceRange && byPriceRange.count >= MIN_DISTRIBUTION_SAMPLES) {
+          return byPriceRange;
+        }
+      }
+
+      const byOrg = this.distributions.get(key);
+      if (byOrg && byOrg.count >= MIN_DISTRIBUTION_SAMPLES) {
+        return byOrg;
+      }
+    }
+
+    return this.overallDistribution.count >= MIN_DISTRIBUTION_SAMPLES
+      ? this.overallDistribution
+      : undefined;
+  }
+
+  private recordWinningRate(organization: string, priceRange: string, winningRate: number): void {
+    for (const key of [organization, `${organization}|${priceRange}`]) {
+      let histogram = this.distributions.get(key);
+      if (!histogram) {
+        histogram = new WinningRateHistogram();
+        this.distributions.set(key, histogram);
+      }
+      histogram.add(winningRate);
+    }
+    this.overallDistribution.add(winningRate);
+  }
 }
 
 // ============================================================
 // 최적화 엔진
 // ============================================================
 
+// 미지정 시 경쟁사 투찰률 분포 (경쟁자 평균 85.5%, 표준편차 1.5%)
+const DEFAULT_BID_RATE_DISTRIBUTION = { mean: 0.855, stdDev: 0.015 };
+const DEFAULT_EXPECTED_COMPETITORS = 10;
+
+// 경쟁사 적격심사 통과율
+const COMPETITOR_QUAL_PASS_RATE = 0.6;
+
+// 투찰률 곡선 메모 크기
+const RATE_CURVE_CACHE_SIZE = 256;
+
+interface RateCandidate {
+  bidRate: number;
+  qualificationScore: number;
+  winProbability: number;
+  expectedValue: number;
+}
+
+// 투찰률 곡선 (적격심사 점수/회사와 무관한 부분)
+interface OptimizerRateCurves {
+  // 탐색 그리드 (0.5% 단위)
+  rates: Float64Array;
+  priceScores: Float64Array;
+  // 적격심사 가점 전 낙찰확률
+  baseWinProbs: Float64Array;
+  // 임계점 그리드 (0.2% 단위)
+  thresholdRates: Float64Array;
+  thresholdPriceScores: Float64Array;
+  thresholdBaseWinProbs: Float64Array;
+}
+
+/**
+ * 적격심사 가점 전 낙찰확률 = 최저가 확률 × 경쟁사 적격 통과율
+ */
+function baseWinProbability(
+  proposedBidRate: number,
+  bidRateMean: number,
+  bidRateStdDev: number,
+  expectedCompetitors: number
+): number {
+  const zScore = (proposedBidRate - bidRateMean) / bidRateStdDev;
+  const cdf = 0.5 * (1 + erf(zScore / Math.sqrt(2)));
+  const lowerPriceRatio = cdf;
+
+  const baseProb = Math.pow(1 - lowerPriceRatio, expectedCompetitors - 1);
+  return baseProb * COMPETITOR_QUAL_PASS_RATE;
+}
+
+function baseWinProbabilityCurve(
+  rates: Float64Array,
+  bidRateMean: number,
+  bidRateStdDev: number,
+  expectedCompetitors: number
+): Float64Array {
+  const probs = normalCdfCurve(rates, bidRateMean, bidRateStdDev);
+  for (let i = 0; i < probs.length; i++) {
+    probs[i] = Math.pow(1 - probs[i], expectedCompetitors - 1) * COMPETITOR_QUAL_PASS_RATE;
+  }
+  return probs;
+}
+
 export class BidOptimizer {
   private learningStore = OrgLearningStore.getInstance();
+  // 기관 × 가격대 × 낙찰하한율 (+ 분포 파라미터) 단위 곡선 메모
+  private rateCurves = new LruCache<string, OptimizerRateCurves>(RATE_CURVE_CACHE_SIZE);
 
   /**
    * 최적 투찰률 계산
@@ -256,15 +421,157 @@ export class BidOptimizer {
     const { bid, company, predictedPrice, lowerLimitRate, bidRateMean, bidRateStdDev, expectedCompetitors } = request;
     const targetMinScore = request.targetMinScore || 85;
 
-    const reasoning: string[] = [];
-
     // 1. 가능한 투찰률 범위 탐색
     const candidates = this.exploreRateRange(
       bid, company, predictedPrice, lowerLimitRate,
       bidRateMean, bidRateStdDev, expectedCompetitors
     );
 
-    // 2. 최적점 찾기 (Expected Value 최대화)
+    // 2. 민감도 분석
+    const sensitivity = this.analyzeSensitivity(
+      bid, company, predictedPrice, lowerLimitRate,
+      bidRateMean, bidRateStdDev, expectedCompetitors, targetMinScore
+    );
+
+    // 3. 최적점/대안/추천
+    return this.buildResult(request, candidates, sensitivity);
+  }
+
+  /**
+   * 여러 입찰 일괄 최적화 (입찰별 optimize와 같은 결과)
+   * - 투찰률과 무관한 적격심사 점수는 입찰당 한 번만 계산
+   * - 투찰률 곡선은 Float64Array 그리드로 계산해 LRU에 메모
+   */
+  public optimizeBatch(requests: BatchOptimizationRequest[]): OptimizationResult[] {
+    return requests.map(request => this.optimizeWithCurves(this.resolveBatchRequest(request)));
+  }
+
+  /**
+   * 미지정 분포 파라미터를 기관 학습 데이터로 채움
+   */
+  private resolveBatchRequest(request: BatchOptimizationRequest): OptimizationRequest {
+    const { bidRateMean, bidRateStdDev, expectedCompetitors } = request;
+    if (bidRateMean !== undefined && bidRateStdDev !== undefined && expectedCompetitors !== undefined) {
+      return { ...request, bidRateMean, bidRateStdDev, expectedCompetitors };
+    }
+
+    const { organization, estimatedPrice } = request.bid;
+    const distribution = this.learningStore.getWinningRateDistribution(
+      organization,
+      getPriceBand(estimatedPrice)
+    );
+    const orgData = this.learningStore.get(organization);
+
+    return {
+      ...request,
+      bidRateMean: bidRateMean ?? distribution?.mean ?? DEFAULT_BID_RATE_DISTRIBUTION.mean,
+      bidRateStdDev: bidRateStdDev ??
+        (distribution && distribution.stdDev > 0 ? distribution.stdDev : DEFAULT_BID_RATE_DISTRIBUTION.stdDev),
+      expectedCompetitors: expectedCompetitors ??
+        Math.round(orgData?.avgCompetitors ?? DEFAULT_EXPECTED_COMPETITORS),
+    };
+  }
+
+  /**
+   * 곡선 기반 최적화 (exploreRateRange + analyzeSensitivity와 같은 계산)
+   */
+  private optimizeWithCurves(request: OptimizationRequest): OptimizationResult {
+    const { bid, company, lowerLimitRate, bidRateMean, bidRateStdDev, expectedCompetitors } = request;
+    const targetMinScore = request.targetMinScore || 85;
+
+    const fixed = new EnhancedQualificationScorer(bid, company, lowerLimitRate).calculateFixedScores();
+    const curves = this.getRateCurves(
+      bid.organization, getPriceBand(bid.estimatedPrice), lowerLimitRate,
+      bidRateMean, bidRateStdDev, expectedCompetitors
+    );
+
+    // 1. 가능한 투찰률 범위 탐색
+    const candidates: RateCandidate[] = [];
+    for (let i = 0; i < curves.rates.length; i++) {
+      const qualificationScore = combineQualificationTotal(fixed, curves.priceScores[i]);
+      const winProbability = this.applyQualificationBonus(curves.baseWinProbs[i], qualificationScore);
+      const expectedValue = qualificationScore >= 85
+        ? (qualificationScore - 85 + 1) * winProbability * 100
+        : qualificationScore * winProbability * 0.1;
+
+      candidates.push({
+        bidRate: Math.round(curves.rates[i] * 10000) / 10000,
+        qualificationScore,
+        winProbability,
+        expectedValue,
+      });
+    }
+
+    // 2. 민감도 분석
+    const score86 = combineQualificationTotal(fixed, calculatePriceScore(0.86));
+    const score87 = combineQualificationTotal(fixed, calculatePriceScore(0.87));
+    const winProb86 = this.calculateWinProbability(0.86, lowerLimitRate, bidRateMean, bidRateStdDev, expectedCompetitors, score86);
+    const winProb87 = this.calculateWinProbability(0.87, lowerLimitRate, bidRateMean, bidRateStdDev, expectedCompetitors, score87);
+
+    let minPassRate = 0.90;
+    let maxCompetitiveRate = lowerLimitRate;
+    for (let i = 0; i < curves.thresholdRates.length; i++) {
+      const rate = curves.thresholdRates[i];
+      const score = combineQualificationTotal(fixed, curves.thresholdPriceScores[i]);
+
+      if (score >= targetMinScore && rate < minPassRate) {
+        minPassRate = rate;
+      }
+
+      const winProb = this.applyQualificationBonus(curves.thresholdBaseWinProbs[i], score);
+      if (winProb >= 0.05 && rate > maxCompetitiveRate) {
+        maxCompetitiveRate = rate;
+      }
+    }
+
+    const sensitivity = this.buildSensitivity(
+      lowerLimitRate, score86, score87, winProb86, winProb87, minPassRate, maxCompetitiveRate
+    );
+
+    // 3. 최적점/대안/추천
+    return this.buildResult(request, candidates, sensitivity);
+  }
+
+  private getRateCurves(
+    organization: string,
+    priceBand: string,
+    lowerLimitRate: number,
+    bidRateMean: number,
+    bidRateStdDev: number,
+    expectedCompetitors: number
+  ): OptimizerRateCurves {
+    const key = `${organization}|${priceBand}|${lowerLimitRate}|${bidRateMean}|${bidRateStdDev}|${expectedCompetitors}`;
+    const cached = this.rateCurves.get(key);
+    if (cached) return cached;
+
+    const rates = buildRateGrid(lowerLimitRate, 0.005);
+    const thresholdRates = buildRateGrid(lowerLimitRate, 0.002);
+    const curves: OptimizerRateCurves = {
+      rates,
+      priceScores: priceScoreCurve(rates),
+      baseWinProbs: baseWinProbabilityCurve(rates, bidRateMean, bidRateStdDev, expectedCompetitors),
+      thresholdRates,
+      thresholdPriceScores: priceScoreCurve(thresholdRates),
+      thresholdBaseWinProbs: baseWinProbabilityCurve(thresholdRates, bidRateMean, bidRateStdDev, expectedCompetitors),
+    };
+    this.rateCurves.set(key, curves);
+    return curves;
+  }
+
+  /**
+   * 탐색 결과 → 최적화 결과 (최적점 선택, 대안 전략, 추천)
+   */
+  private buildResult(
+    request: OptimizationRequest,
+    candidates: RateCandidate[],
+    sensitivity: SensitivityAnalysis
+  ): OptimizationResult {
+    const { predictedPrice, lowerLimitRate, expectedCompetitors } = request;
+    const targetMinScore = request.targetMinScore || 85;
+
+    const reasoning: string[] = [];
+
+    // 최적점 찾기 (Expected Value 최대화)
     const validCandidates = candidates.filter(c => c.qualificationScore >= targetMinScore);
 
     let optimal: typeof candidates[0];
@@ -282,18 +589,12 @@ export class BidOptimizer {
       reasoning.push('적격심사 통과 불가 - 점수 최대화 전략');
     }
 
-    // 3. 대안 전략 생성
+    // 대안 전략 생성
     const alternatives = this.generateAlternatives(
       candidates, optimal, lowerLimitRate, targetMinScore
     );
 
-    // 4. 민감도 분석
-    const sensitivity = this.analyzeSensitivity(
-      bid, company, predictedPrice, lowerLimitRate,
-      bidRateMean, bidRateStdDev, expectedCompetitors, targetMinScore
-    );
-
-    // 5. 추천 결정
+    // 추천 결정
     const recommendation = this.determineRecommendation(
       optimal, targetMinScore, expectedCompetitors
     );
@@ -388,13 +689,15 @@ export class BidOptimizer {
     if (qualificationScore < 85) return 0;
     if (proposedBidRate < lowerLimitRate) return 0;
 
-    const zScore = (proposedBidRate - bidRateMean) / bidRateStdDev;
-    const cdf = 0.5 * (1 + erf(zScore / Math.sqrt(2)));
-    const lowerPriceRatio = cdf;
+    const adjustedProb = baseWinProbability(proposedBidRate, bidRateMean, bidRateStdDev, expectedCompetitors);
+    return this.applyQualificationBonus(adjustedProb, qualificationScore);
+  }
 
-    const baseProb = Math.pow(1 - lowerPriceRatio, expectedCompetitors - 1);
-    const qualPassRate = 0.6;
-    const adjustedProb = baseProb * qualPassRate;
+  /**
+   * 적격심사 가점 반영 (85점 미만은 0)
+   */
+  private applyQualificationBonus(adjustedProb: number, qualificationScore: number): number {
+    if (qualificationScore < 85) return 0;
 
     const qualBonus = qualificationScore > 85
       ? 1 + (qualificationScore - 85) / 100
@@ -520,6 +823,23 @@ export class BidOptimizer {
       }
     }
 
+    return this.buildSensitivity(
+      lowerLimitRate, score86, score87, winProb86, winProb87, minPassRate, maxCompetitiveRate
+    );
+  }
+
+  /**
+   * 민감도 분석 결과 구성
+   */
+  private buildSensitivity(
+    lowerLimitRate: number,
+    score86: number,
+    score87: number,
+    winProb86: number,
+    winProb87: number,
+    minPassRate: number,
+    maxCompetitiveRate: number
+  ): SensitivityAnalysis {
     // 리스크 구간
     const riskZones: RiskZone[] = [
       {
@@ -589,6 +909,19 @@ export class BidOptimizer {
     return 'SKIP';
   }
 
+  /**
+   * 기관(가격대별) 낙찰률 분포
+   */
+  public getWinningRateDistribution(
+    organization: string,
+    estimatedPrice?: number
+  ): WinningRateHistogram | undefined {
+    return this.learningStore.getWinningRateDistribution(
+      organization,
+      estimatedPrice === undefined ? undefined : getPriceBand(estimatedPrice)
+    );
+  }
+
   /**
    * 기관 데이터 가져오기
    */
@@ -621,10 +954,7 @@ export class BidOptimizer {
   }
 
   private getPriceRange(price: number): string {
-    if (price < 50000000) return 'under50m';
-    if (price < 100000000) return '50m-100m';
-    if (price < 500000000) return '100m-500m';
-    return 'over500m';
+    return getPriceBand(price);
   }
 }
 
@@ -0,0 +1,194 @@
+/**
+ * Qetta 투찰률 그리드
+ *
+ * 낙찰하한율 ~ 90% 투찰률 구간을 Float64Array로 펼쳐 곡선 단위로 계산:
+ * - 가격점수 / 정규분포 CDF 곡선
+ * - 기관별 낙찰률 누적 히스토그램 (결과가 들어올 때마다 증분 갱신)
+ * - 곡선 메모용 LRU 캐시
+ *
+ * 곡선 값은 기존 스칼라 루프와 같은 연산 순서로 계산하므로 결과가 동일하다.
+ */
+
+import { erf } from './bidding-engine.js';
+import { calculatePriceScore } from './qualification-scorer.js';
+
+// ============================================================
+// 투찰률 곡선
+// ============================================================
+
+/** 탐색 상한 투찰률 */
+export const RATE_GRID_MAX = 0.90;
+
+/**
+ * 투찰률 그리드 생성
+ * 기존 루프(rate += step)와 같은 부동소수점 누적으로 만들어 동일한 투찰률을 얻음
+ */
+export function buildRateGrid(
+  lowerLimitRate: number,
+  step: number,
+  max: number = RATE_GRID_MAX
+): Float64Array {
+  let count = 0;
+  for (let rate = lowerLimitRate; rate <= max; rate += step) {
+    count++;
+  }
+
+  const rates = new Float64Array(count);
+  let rate = lowerLimitRate;
+  for (let i = 0; i < count; i++) {
+    rates[i] = rate;
+    rate += step;
+  }
+  return rates;
+}
+
+/**
+ * 투찰률별 가격점수
+ */
+export function priceScoreCurve(rates: Float64Array): Float64Array {
+  const scores = new Float64Array(rates.length);
+  for (let i = 0; i < rates.length; i++) {
+    scores[i] = calculatePriceScore(rates[i]);
+  }
+  return scores;
+}
+
+/**
+ * 투찰률별 정규분포 누적확률 (경쟁사 투찰률이 더 낮을 확률)
+ */
+export function normalCdfCurve(rates: Float64Array, mean: number, stdDev: number): Float64Array {
+  const cdf = new Float64Array(rates.length);
+  for (let i = 0; i < rates.length; i++) {
+    const zScore = (rates[i] - mean) / stdDev;
+    cdf[i] = 0.5 * (1 + erf(zScore / Math.sqrt(2)));
+  }
+  return cdf;
+}
+
+/**
+ * 추정가격 → 가격대 (기관 학습 데이터의 priceRangePattern 키)
+ */
+export function getPriceBand(price: number): string {
+  if (price < 50000000) return 'under50m';
+  if (price < 100000000) return '50m-100m';
+  if (price < 500000000) return '100m-500m';
+  return 'over500m';
+}
+
+// ============================================================
+// 낙찰률 누적 히스토그램
+// ============================================================
+
+const HISTOGRAM_MIN_RATE = 0.80;
+const HISTOGRAM_BIN_WIDTH = 0.001;
+const HISTOGRAM_BINS = 150;  // 80.0% ~ 95.0%
+
+/**
+ * 낙찰률 누적 히스토그램
+ * 0.1% 단위 구간 + 범위 밖 구간 2개, 결과 추가 시 누적 카운트를 바로 갱신해
+ * CDF/분위수 조회에 전체 표본을 다시 훑지 않음
+ */
+export class WinningRateHistogram {
+  /** 구간별 누적 카운트 (0: 80% 미만, 1..150: 0.1% 구간, 151: 95% 이상) */
+  private readonly cumulative = new Float64Array(HISTOGRAM_BINS + 2);
+  private total = 0;
+  private runningMean = 0;
+  private m2 = 0;
+
+  public add(rate: number): void {
+    for (let i = this.binOf(rate); i < this.cumulative.length; i++) {
+      this.cumulative[i]++;
+    }
+
+    // Welford 분산 갱신
+    this.total++;
+    const delta = rate - this.runningMean;
+    this.runningMean += delta / this.total;
+    this.m2 += delta * (rate - this.runningMean);
+  }
+
+  public get count(): number {
+    return this.total;
+  }
+
+  public get mean(): number {
+    return this.runningMean;
+  }
+
+  public get stdDev(): number {
+    return this.total > 1 ? Math.sqrt(this.m2 / (this.total - 1)) : 0;
+  }
+
+  /**
+   * rate 이하 낙찰률 비율 (rate가 속한 구간까지 포함)
+   */
+  public cdf(rate: number): number {
+    if (this.total === 0) return 0;
+    return this.cumulative[this.binOf(rate)] / this.total;
+  }
+
+  /**
+   * p 분위 낙찰률 (해당 구간의 상한)
+   */
+  public quantile(p: number): number {
+    if (this.total === 0) return NaN;
+    const target = Math.max(1, Math.ceil(p * this.total));
+
+    let lo = 0;
+    let hi = this.cumulative.length - 1;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.cumulative[mid] >= target) hi = mid;
+      else lo = mid + 1;
+    }
+
+    if (lo === 0) return HISTOGRAM_MIN_RATE;
+    const upper = HISTOGRAM_MIN_RATE + Math.min(lo, HISTOGRAM_BINS) * HISTOGRAM_BIN_WIDTH;
+    return Math.round(upper * 10000) / 10000;
+  }
+
+  private binOf(rate: number): number {
+    if (rate < HISTOGRAM_MIN_RATE) return 0;
+    const bin = Math.floor((rate - HISTOGRAM_MIN_RATE) / HISTOGRAM_BIN_WIDTH) + 1;
+    return Math.min(bin, HISTOGRAM_BINS + 1);
+  }
+}
+
+// ============================================================
+// LRU 캐시
+// ============================================================
+
+/**
+ * 크기 제한 LRU 캐시 (Map 삽입 순서 = 사용 순서)
+ */
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, V>();
+
+  constructor(private readonly maxSize: number) {}
+
+  public get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  public set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) this.entries.delete(oldest.value);
+    }
+  }
+
+  public get size(): number {
+    return this.entries.size;
+  }
+
+  public clear(): void {
+    this.entries.clear();
+  }
+}
@@ -6,15 +6,25 @@
  * 2. 개선된 추천 알고리즘 (ROI 기반)
  * 3. 동적 가격점수 모델 (사정률 반영)
  * 4. 기관/카테고리별 패턴 학습
+ * 5. 일괄 예측 (투찰률 곡선 그리드 + 메모)
  */
 
 import type { BidInfo, CompanyProfile, BidType, ContractType, CreditRating } from './bidding-engine.js';
 import { getLowerLimitRate, erf } from './bidding-engine.js';
 import {
   EnhancedQualificationScorer,
+  calculatePriceScore,
+  combineQualificationTotal,
   toEnhancedProfile,
   type QualificationResult,
 } from './qualification-scorer.js';
+import {
+  LruCache,
+  buildRateGrid,
+  getPriceBand,
+  normalCdfCurve,
+  priceScoreCurve,
+} from './bid-rate-grid.js';
 import {
   getAssessmentPredictor,
   type AssessmentPrediction,
@@ -137,6 +147,13 @@ const QUALIFICATION_PASS_THRESHOLD = 85;
 const EXPECTED_MARGIN_RATE = 0.12;
 const BID_PARTICIPATION_COST = 500000;
 
+// 경쟁자 투찰률 분포 (실제 데이터 기반)
+const COMPETITOR_BID_RATE_MEAN = 0.855;
+const COMPETITOR_BID_RATE_STD = 0.015;
+
+// 투찰률 곡선 메모 크기
+const RATE_CURVE_CACHE_SIZE = 256;
+
 const RECOMMENDATION_THRESHOLDS = {
   STRONG_BID: { minWinProb: 0.25, minQualMargin: 5, minROI: 0.15 },
   BID: { minWinProb: 0.12, minQualMargin: 2, minROI: 0.08 },
@@ -178,6 +195,30 @@ export interface BidPredictionRequestV3 {
 }
 
 export function generateBidPredictionV3(request: BidPredictionRequestV3): BidStrategyV3 {
+  return predictV3(request, calculateOptimalStrategyV3);
+}
+
+/**
+ * 여러 입찰 일괄 예측 (입찰별 generateBidPredictionV3와 같은 결과)
+ * 최적 투찰률 탐색을 투찰률 곡선으로 계산하고 기관 × 가격대 × 낙찰하한율 단위로 메모
+ */
+export function generateBidPredictionsV3(requests: BidPredictionRequestV3[]): BidStrategyV3[] {
+  return requests.map(request => predictV3(request, calculateOptimalStrategyFromCurvesV3));
+}
+
+type OptimalStrategyCalculatorV3 = (
+  bid: BidInfo,
+  company: CompanyProfile,
+  predictedBudgetPrice: number,
+  lowerLimitRate: number,
+  expectedCompetitors: number,
+  strategyType: string
+) => OptimalStrategyV3;
+
+function predictV3(
+  request: BidPredictionRequestV3,
+  calculateOptimalStrategy: OptimalStrategyCalculatorV3
+): BidStrategyV3 {
   const strategy = request.strategy || 'balanced';
   const bidDate = new Date(request.deadline);
 
@@ -238,7 +279,7 @@ export function generateBidPredictionV3(request: BidPredictionRequestV3): BidStr
   const floorPrice = predictedBudgetPrice * lowerLimitRate;
 
   // 7. 최적 투찰률 계산
-  const optimalStrategy = calculateOptimalStrategyV3(
+  const optimalStrategy = calculateOptimalStrategy(
     bid, companyProfile, predictedBudgetPrice, lowerLimitRate,
     competitionAnalysis.expectedCompetitors, strategy
   );
@@ -336,7 +377,6 @@ function calculateOptimalStrategyV3(
   strategyType: string
 ): OptimalStrategyV3 {
   const enhancedProfile = toEnhancedProfile(company);
-  const scenarios: BidScenario[] = [];
 
   const rateStep = 0.005;
   let bestExpectedValue = -Infinity;
@@ -361,6 +401,99 @@ function calculateOptimalStrategyV3(
     }
   }
 
+  return buildOptimalStrategyV3(
+    predictedBudgetPrice, lowerLimitRate, expectedCompetitors, strategyType, optimalRate,
+    rate => new EnhancedQualificationScorer(bid, enhancedProfile, rate).calculate().total
+  );
+}
+
+/**
+ * 최적 전략 계산 (곡선 기반, calculateOptimalStrategyV3와 같은 결과)
+ */
+function calculateOptimalStrategyFromCurvesV3(
+  bid: BidInfo,
+  company: CompanyProfile,
+  predictedBudgetPrice: number,
+  lowerLimitRate: number,
+  expectedCompetitors: number,
+  strategyType: string
+): OptimalStrategyV3 {
+  const enhancedProfile = toEnhancedProfile(company);
+  const fixed = new EnhancedQualificationScorer(bid, enhancedProfile, lowerLimitRate).calculateFixedScores();
+  const curves = getRateCurvesV3(
+    bid.organization, getPriceBand(bid.estimatedPrice), lowerLimitRate, expectedCompetitors
+  );
+
+  let bestExpectedValue = -Infinity;
+  let optimalRate = 0.86;
+
+  for (let i = 0; i < curves.rates.length; i++) {
+    const qualTotal = combineQualificationTotal(fixed, curves.priceScores[i]);
+    if (qualTotal < QUALIFICATION_PASS_THRESHOLD) continue;
+
+    const rate = curves.rates[i];
+    const winProb = applyQualificationAdvantage(curves.lowestProbs[i], qualTotal);
+
+    const bidPrice = Math.round(predictedBudgetPrice * rate);
+    const expectedProfit = bidPrice * EXPECTED_MARGIN_RATE * winProb - BID_PARTICIPATION_COST * (1 - winProb);
+
+    if (expectedProfit > bestExpectedValue) {
+      bestExpectedValue = expectedProfit;
+      optimalRate = rate;
+    }
+  }
+
+  return buildOptimalStrategyV3(
+    predictedBudgetPrice, lowerLimitRate, expectedCompetitors, strategyType, optimalRate,
+    rate => combineQualificationTotal(fixed, calculatePriceScore(rate))
+  );
+}
+
+// 투찰률 곡선 (0.5% 단위 그리드, 적격심사 점수와 무관한 부분)
+interface RateCurvesV3 {
+  rates: Float64Array;
+  priceScores: Float64Array;
+  // 최저가 확률 (적격심사 보정 전)
+  lowestProbs: Float64Array;
+}
+
+const rateCurveCacheV3 = new LruCache<string, RateCurvesV3>(RATE_CURVE_CACHE_SIZE);
+
+function getRateCurvesV3(
+  organization: string,
+  priceBand: string,
+  lowerLimitRate: number,
+  competitors: number
+): RateCurvesV3 {
+  // 기관 × 가격대 × 낙찰하한율 (+ 경쟁사 수)
+  const key = `${organization}|${priceBand}|${lowerLimitRate}|${competitors}`;
+  const cached = rateCurveCacheV3.get(key);
+  if (cached) return cached;
+
+  const rates = buildRateGrid(lowerLimitRate, 0.005);
+  const lowestProbs = normalCdfCurve(rates, COMPETITOR_BID_RATE_MEAN, COMPETITOR_BID_RATE_STD);
+  for (let i = 0; i < lowestProbs.length; i++) {
+    lowestProbs[i] = lowestBidProbability(lowestProbs[i], competitors);
+  }
+
+  const curves: RateCurvesV3 = { rates, priceScores: priceScoreCurve(rates), lowestProbs };
+  rateCurveCacheV3.set(key, curves);
+  return curves;
+}
+
+/**
+ * 탐색된 최적 투찰률 → 전략 (시나리오 구성)
+ */
+function buildOptimalStrategyV3(
+  predictedBudgetPrice: number,
+  lowerLimitRate: number,
+  expectedCompetitors: number,
+  strategyType: string,
+  optimalRate: number,
+  qualificationTotalAt: (rate: number) => number
+): OptimalStrategyV3 {
+  const scenarios: BidScenario[] = [];
+
   const strategyRates: Record<string, number> = {
     aggressive: lowerLimitRate + 0.005,  // 84.75%: 하한가 근접
     balanced: 0.855,                      // 85.5%: 평균 낙찰률 근접
@@ -378,10 +511,9 @@ function calculateOptimalStrategyV3(
   ];
 
   for (const config of scenarioConfigs) {
-    const scorer = new EnhancedQualificationScorer(bid, enhancedProfile, config.rate);
-    const qual = scorer.calculate();
+    const qualTotal = qualificationTotalAt(config.rate);
     const winProb = calculateRealisticWinProb(
-      config.rate, lowerLimitRate, expectedCompetitors, qual.total
+      config.rate, lowerLimitRate, expectedCompetitors, qualTotal
     );
     const bidPrice = Math.round(predictedBudgetPrice * config.rate);
     const expectedProfit = bidPrice * EXPECTED_MARGIN_RATE * winProb;
@@ -390,11 +522,11 @@ function calculateOptimalStrategyV3(
       name: config.name,
       bidRate: Math.round(config.rate * 10000) / 10000,
       bidPrice,
-      qualificationScore: qual.total,
+      qualificationScore: qualTotal,
       winProbability: winProb,
       expectedProfit: Math.round(expectedProfit),
       risk: config.risk,
-      description: getScenarioDescription(qual.total, winProb),
+      description: getScenarioDescription(qualTotal, winProb),
     });
   }
 
@@ -434,18 +566,28 @@ function calculateRealisticWinProb(
   if (qualificationScore < QUALIFICATION_PASS_THRESHOLD) return 0;
   if (bidRate < lowerLimitRate) return 0;
 
-  // 경쟁자 투찰률 분포 (실제 데이터 기반)
-  const competitorMean = 0.855;
-  const competitorStd = 0.015;
-
-  const zScore = (bidRate - competitorMean) / competitorStd;
+  const zScore = (bidRate - COMPETITOR_BID_RATE_MEAN) / COMPETITOR_BID_RATE_STD;
   const cdf = 0.5 * (1 + erf(zScore / Math.sqrt(2)));
+
+  return applyQualificationAdvantage(lowestBidProbability(cdf, competitors), qualificationScore);
+}
+
+/**
+ * 적격 경쟁사 모두보다 낮게 투찰할 확률
+ * @param cdf - 경쟁사 투찰률이 우리보다 낮을 확률
+ */
+function lowestBidProbability(cdf: number, competitors: number): number {
   const higherThanUs = 1 - cdf;
 
   const competitorPassRate = 0.70;
   const effectiveCompetitors = competitors * competitorPassRate;
-  const adjustedLowestProb = Math.pow(higherThanUs, Math.max(0, effectiveCompetitors - 1));
+  return Math.pow(higherThanUs, Math.max(0, effectiveCompetitors - 1));
+}
 
+/**
+ * 적격심사 점수 우위 보정 (0 ~ 60%)
+ */
+function applyQualificationAdvantage(adjustedLowestProb: number, qualificationScore: number): number {
   const avgCompetitorScore = 88;
   const qualAdvantage = qualificationScore > avgCompetitorScore
     ? 1 + (qualificationScore - avgCompetitorScore) * 0.02
@@ -81,6 +81,17 @@ export interface QualificationResult {
   recommendations: string[];
 }
 
+/**
+ * 투찰률과 무관한 점수 (반올림 전)
+ * 투찰률별 총점은 combineQualificationTotal로 가격점수만 더해 계산
+ */
+export interface FixedQualificationScores {
+  delivery: number;
+  tech: number;
+  credit: number;
+  reliability: number;
+}
+
 export interface DeliveryBreakdown {
   identicalRecords: { count: number; amount: number; score: number };
   similarRecords: { count: number; amount: number; score: number };
@@ -165,6 +176,18 @@ const ORG_RELATIONSHIP_BONUS = {
   none: 0,
 };
 
+// 키워드 불용어 (입찰 공고에서 자주 나오는 일반 단어)
+const KEYWORD_STOP_WORDS = new Set([
+  // 동작
+  '구매', '설치', '공급', '납품', '교체', '유지', '보수', '운영',
+  '관리', '시공', '제작', '용역', '사업', '추진', '개발',
+  // 시간
+  '년', '월', '일', '분기', '반기', '상반기', '하반기',
+  // 일반
+  '외', '및', '등', '건', '차', '차분', '물량', '일괄', '일체',
+  '단가', '계약', '입찰', '조달', '긴급', '추가', '신규',
+]);
+
 // ============================================================
 // 핵심 클래스
 // ============================================================
@@ -403,25 +426,13 @@ export class EnhancedQualificationScorer {
    * 텍스트에서 키워드 추출 (불용어 필터링 포함)
    */
   private extractKeywords(text: string): string[] {
-    // 불용어 목록 (입찰 공고에서 자주 나오는 일반 단어)
-    const stopWords = new Set([
-      // 동작
-      '구매', '설치', '공급', '납품', '교체', '유지', '보수', '운영',
-      '관리', '시공', '제작', '용역', '사업', '추진', '개발',
-      // 시간
-      '년', '월', '일', '분기', '반기', '상반기', '하반기',
-      // 일반
-      '외', '및', '등', '건', '차', '차분', '물량', '일괄', '일체',
-      '단가', '계약', '입찰', '조달', '긴급', '추가', '신규',
-    ]);
-
     const keywords: string[] = [];
 
     // 한글 키워드
     const koreanPattern = /[가-힣]+/g;
     const koreanMatches = text.match(koreanPattern) || [];
     for (const k of koreanMatches) {
-      if (k.length >= 2 && !stopWords.has(k)) {
+      if (k.length >= 2 && !KEYWORD_STOP_WORDS.has(k)) {
         keywords.push(k);
       }
     }
@@ -498,27 +509,22 @@ export class EnhancedQualificationScorer {
 
   /**
    * 가격점수 계산
-   * 공식: 50 - 20 × |88/100 - 입찰가격/예정가격| × 100
    */
   private calculatePriceScore(): number {
-    // 적격심사 가격점수 계산 (실제 나라장터 기준)
-    // 공식: 가격점수 = 50 × (하한가 / 투찰가)
-    // - 하한가(84.245%)로 입찰 시 최고 점수 (50점)
-    // - 높은 가격(100%)으로 입찰 시 낮은 점수 (~42점)
-    // - 하한가 미만 시 0점 (무효)
-    const floorRate = 0.84245;
-
-    // 하한율 미만이면 0점
-    if (this.proposedBidRate < floorRate) {
-      return 0;
-    }
-
-    // 가격점수 = 50 × (하한가율 / 투찰률)
-    // 예: 85%로 입찰 시 = 50 × (0.84245 / 0.85) = 49.6점
-    // 예: 88%로 입찰 시 = 50 × (0.84245 / 0.88) = 47.9점
-    const score = 50 * (floorRate / this.proposedBidRate);
+    return calculatePriceScore(this.proposedBidRate);
+  }
 
-    return Math.max(0, Math.min(50, Math.round(score * 10) / 10));
+  /**
+   * 투찰률과 무관한 점수 (납품실적, 기술능력, 신용등급, 신인도)
+   * 투찰률만 바꿔 가며 총점을 구할 때 한 번만 계산하기 위함
+   */
+  public calculateFixedScores(): FixedQualificationScores {
+    return {
+      delivery: this.calculateDeliveryScore().score,
+      tech: this.calculateTechScore().score,
+      credit: this.calculateCreditScore(),
+      reliability: this.calculateReliabilityScore().score,
+    };
   }
 
   /**
@@ -643,6 +649,42 @@ export class EnhancedQualificationScorer {
 // 유틸리티 함수
 // ============================================================
 
+/**
+ * 가격점수 계산
+ * 공식: 50 - 20 × |88/100 - 입찰가격/예정가격| × 100
+ */
+export function calculatePriceScore(bidRate: number): number {
+  // 적격심사 가격점수 계산 (실제 나라장터 기준)
+  // 공식: 가격점수 = 50 × (하한가 / 투찰가)
+  // - 하한가(84.245%)로 입찰 시 최고 점수 (50점)
+  // - 높은 가격(100%)으로 입찰 시 낮은 점수 (~42점)
+  // - 하한가 미만 시 0점 (무효)
+  const floorRate = 0.84245;
+
+  // 하한율 미만이면 0점
+  if (bidRate < floorRate) {
+    return 0;
+  }
+
+  // 가격점수 = 50 × (하한가율 / 투찰률)
+  // 예: 85%로 입찰 시 = 50 × (0.84245 / 0.85) = 49.6점
+  // 예: 88%로 입찰 시 = 50 × (0.84245 / 0.88) = 47.9점
+  const score = 50 * (floorRate / bidRate);
+
+  return Math.max(0, Math.min(50, Math.round(score * 10) / 10));
+}
+
+/**
+ * 고정 점수 + 가격점수 → 총점 (calculate()의 total과 동일)
+ */
+export function combineQualificationTotal(
+  fixed: FixedQualificationScores,
+  priceScore: number
+): number {
+  const total = fixed.delivery + fixed.tech + fixed.credit + priceScore + fixed.reliability;
+  return Math.round(total * 10) / 10;
+}
+
 /**
  * 간편 적격심사 점수 계산 (기존 인터페이스 호환)
  */
@@ -0,0 +1,196 @@
+/**
+ * Qetta 일괄 투찰 최적화 테스트
+ *
+ * 1. optimizeBatch / generateBidPredictionsV3 결과가 입찰별 호출과 동일한지 검증
+ * 2. 기관별 낙찰률 누적 히스토그램 증분 갱신 검증
+ * 3. 하루치 입찰 목록 기준 입찰별 루프 대비 소요 시간 비교
+ */
+
+import { getBidOptimizer } from './dist/bid-optimizer.js';
+import { generateBidPredictionV3, generateBidPredictionsV3 } from './dist/bidding-engine-v3.js';
+import { getLowerLimitRate } from './dist/bidding-engine.js';
+import { toEnhancedProfile } from './dist/qualification-scorer.js';
+import { isDeepStrictEqual } from 'node:util';
+
+const BID_COUNT = Number(process.env.BATCH_BIDS || 500);
+const ROUNDS = 5;
+
+console.log('='.repeat(70));
+console.log(`Qetta 일괄 투찰 최적화 테스트 (하루 ${BID_COUNT}건)`);
+console.log('='.repeat(70));
+
+let failures = 0;
+const check = (label, ok) => {
+  console.log(`${ok ? '✅' : '❌'} ${label}`);
+  if (!ok) failures++;
+};
+
+// ============================================================
+// 합성 입찰 목록
+// ============================================================
+
+const ORGANIZATIONS = [
+  '서울특별시 상수도사업본부',
+  '한국수자원공사',
+  '한국지역난방공사',
+  '부산광역시 상수도사업본부',
+  '한국환경공단',
+  '인천광역시',
+];
+const CATEGORIES = ['flow_meter', 'heat_meter', 'water_quality', 'pressure_gauge', 'valve'];
+const RATINGS = ['AAA', 'AA+', 'A0', 'BBB+', 'BB0'];
+const PRICES = [30000000, 80000000, 150000000, 300000000, 800000000];
+
+let seed = 11;
+const rand = () => {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+};
+const pick = (arr) => arr[Math.floor(rand() * arr.length)];
+
+// 같은 날 공고는 기관/가격대가 겹치는 경우가 많음
+const requestsV3 = Array.from({ length: BID_COUNT }, (_, i) => {
+  const category = pick(CATEGORIES);
+  return {
+    bidId: `day-${i}`,
+    bidTitle: `${category} 구매 ${i}`,
+    organization: pick(ORGANIZATIONS),
+    estimatedPrice: pick(PRICES),
+    bidType: 'goods',
+    contractType: rand() < 0.7 ? 'qualification_review' : 'lowest_price',
+    deadline: '2025-03-14T10:00:00Z',
+    tenantId: 'batch-tenant',
+    productId: 'ur-1000-plus',
+    creditRating: pick(RATINGS),
+    deliveryRecords: [
+      {
+        organization: pick(ORGANIZATIONS),
+        productName: category,
+        amount: Math.round(50000000 + rand() * 300000000),
+        completedAt: '2024-06-01T00:00:00Z',
+        category,
+        keywords: [category],
+      },
+    ],
+    certifications: rand() < 0.5 ? ['iso9001', 'patent_utility'] : ['iso9001'],
+    techStaffCount: 2 + Math.floor(rand() * 10),
+    strategy: pick(['aggressive', 'balanced', 'conservative', 'optimal']),
+    category,
+  };
+});
+
+const optimizationRequests = requestsV3.map((r) => {
+  const company = toEnhancedProfile({
+    tenantId: r.tenantId,
+    creditRating: r.creditRating,
+    deliveryRecords: r.deliveryRecords.map((d) => ({ ...d, completedAt: new Date(d.completedAt) })),
+    certifications: r.certifications,
+    techStaffCount: r.techStaffCount,
+    penalties: [],
+    preferredOrgs: [],
+  });
+  return {
+    bid: {
+      id: r.bidId,
+      title: r.bidTitle,
+      organization: r.organization,
+      estimatedPrice: r.estimatedPrice,
+      bidType: r.bidType,
+      contractType: r.contractType,
+      deadline: new Date(r.deadline),
+    },
+    company,
+    predictedPrice: r.estimatedPrice,
+    lowerLimitRate: getLowerLimitRate(r.bidType, r.contractType, r.estimatedPrice),
+    bidRateMean: pick([0.852, 0.855, 0.858]),
+    bidRateStdDev: pick([0.01, 0.015]),
+    expectedCompetitors: pick([6, 10, 14]),
+  };
+});
+
+const optimizer = getBidOptimizer();
+
+// ============================================================
+// 1. 결과 동일성
+// ============================================================
+
+console.log('\n[1] 입찰별 호출 대비 결과 동일성');
+
+const perBid = optimizationRequests.map((r) => optimizer.optimize(r));
+const batch = optimizer.optimizeBatch(optimizationRequests);
+check(
+  `optimizeBatch = optimize (${BID_COUNT}건)`,
+  perBid.every((result, i) => isDeepStrictEqual(result, batch[i]))
+);
+
+const perBidV3 = requestsV3.map((r) => generateBidPredictionV3(r));
+const batchV3 = generateBidPredictionsV3(requestsV3);
+check(
+  `generateBidPredictionsV3 = generateBidPredictionV3 (${BID_COUNT}건)`,
+  perBidV3.every((result, i) => isDeepStrictEqual(result, batchV3[i]))
+);
+
+// ============================================================
+// 2. 낙찰률 분포
+// ============================================================
+
+console.log('\n[2] 기관별 낙찰률 누적 히스토그램');
+
+const org = '테스트 시설관리공단';
+const rates = [];
+for (let i = 0; i < 200; i++) {
+  const winningRate = 0.845 + rand() * 0.02;
+  rates.push(winningRate);
+  optimizer.learnFromBidResult(org, 1.0, 8, winningRate, new Date('2025-03-01'), 150000000);
+}
+
+const distribution = optimizer.getWinningRateDistribution(org, 150000000);
+const mean = rates.reduce((a, b) => a + b, 0) / rates.length;
+const below = rates.filter((r) => Math.floor((r - 0.8) / 0.001) <= Math.floor((0.855 - 0.8) / 0.001)).length;
+check('표본 수', distribution?.count === rates.length);
+check('평균 (증분 갱신)', Math.abs(distribution.mean - mean) < 1e-12);
+check('누적 비율', Math.abs(distribution.cdf(0.855) - below / rates.length) < 1e-12);
+const median = [...rates].sort((a, b) => a - b)[rates.length / 2 - 1];
+check('중앙값 구간', Math.abs(distribution.quantile(0.5) - median) <= 0.001);
+
+// 분포 파라미터 미지정 → 기관 분포 사용
+const { bidRateMean, bidRateStdDev, expectedCompetitors, ...base } = optimizationRequests[0];
+const orgBid = { ...base.bid, organization: org, estimatedPrice: 150000000 };
+const [learned] = optimizer.optimizeBatch([{ ...base, bid: orgBid }]);
+const expected = optimizer.optimize({
+  ...base,
+  bid: orgBid,
+  bidRateMean: distribution.mean,
+  bidRateStdDev: distribution.stdDev,
+  expectedCompetitors: 8,
+});
+check('미지정 파라미터를 기관 분포로 채움', isDeepStrictEqual(learned, expected));
+
+// ============================================================
+// 3. 소요 시간
+// ============================================================
+
+console.log(`\n[3] 하루치 ${BID_COUNT}건 소요 시간 (${ROUNDS}회 평균)`);
+
+const time = (fn) => {
+  fn();  // 워밍업
+  const start = performance.now();
+  for (let i = 0; i < ROUNDS; i++) fn();
+  return (performance.now() - start) / ROUNDS;
+};
+
+const optimizeMs = time(() => optimizationRequests.map((r) => optimizer.optimize(r)));
+const optimizeBatchMs = time(() => optimizer.optimizeBatch(optimizationRequests));
+const v3Ms = time(() => requestsV3.map((r) => generateBidPredictionV3(r)));
+const v3BatchMs = time(() => generateBidPredictionsV3(requestsV3));
+
+console.log(`BidOptimizer   입찰별 optimize:        ${optimizeMs.toFixed(1)}ms`);
+console.log(`BidOptimizer   optimizeBatch:          ${optimizeBatchMs.toFixed(1)}ms (${(optimizeMs / optimizeBatchMs).toFixed(1)}x)`);
+console.log(`v3 엔진        입찰별 예측:             ${v3Ms.toFixed(1)}ms`);
+console.log(`v3 엔진        generateBidPredictionsV3: ${v3BatchMs.toFixed(1)}ms (${(v3Ms / v3BatchMs).toFixed(1)}x)`);
+
+if (failures > 0) {
+  console.error(`\n❌ ${failures}개 검증 실패`);
+  process.exit(1);
+}
+console.log('\n✅ 모든 검증 통과');
@@ -0,0 +1,144 @@
+/**
+ * Qetta 백테스트 v3 파라미터 스윕 테스트
+ *
+ * 1. 스윕 결과가 순차 run()과 동일한지 검증
+ * 2. 순차 run() 대비 소요 시간 비교
+ */
+
+import { BacktestEngineV3 } from './dist/backtest-framework-v3.js';
+import { runBacktestSweepV3 } from './dist/backtest-sweep-v3.js';
+import { isDeepStrictEqual } from 'node:util';
+
+const BID_COUNT = Number(process.env.SWEEP_BIDS || 2000);
+
+console.log('='.repeat(70));
+console.log(`Qetta 백테스트 v3 스윕 테스트 (${BID_COUNT}건)`);
+console.log('='.repeat(70));
+
+// ============================================================
+// 합성 과거 데이터
+// ============================================================
+
+const ORGANIZATIONS = [
+  '서울특별시 상수도사업본부',
+  '한국수자원공사',
+  '한국지역난방공사',
+  '부산광역시 상수도사업본부',
+  '한국환경공단',
+  '인천광역시',
+  '한국농어촌공사',
+  '대구광역시',
+];
+const CATEGORIES = ['flow_meter', 'heat_meter', 'water_quality', 'pressure_gauge', 'level_sensor', 'valve'];
+const RATINGS = ['AAA', 'AA+', 'A0', 'BBB+', 'BB0'];
+
+let seed = 7;
+const rand = () => {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+};
+const pick = (arr) => arr[Math.floor(rand() * arr.length)];
+
+const bids = Array.from({ length: BID_COUNT }, (_, i) => {
+  const estimatedPrice = Math.round(20000000 + rand() * 800000000);
+  const assessmentRate = 0.997 + rand() * 0.006;
+  const winningRate = 0.84 + rand() * 0.03;
+  const category = pick(CATEGORIES);
+  const month = String(1 + (i % 12)).padStart(2, '0');
+  return {
+    id: `sweep-${i}`,
+    title: `${category} 구매 ${i}`,
+    organization: pick(ORGANIZATIONS),
+    estimatedPrice,
+    bidType: 'goods',
+    contractType: rand() < 0.7 ? 'qualification_review' : 'lowest_price',
+    deadline: `2024-${month}-${String(1 + (i % 28)).padStart(2, '0')}T10:00:00Z`,
+    category: rand() < 0.9 ? category : undefined,
+    isUrgent: rand() < 0.1,
+    actualResult: {
+      winningPrice: Math.round(estimatedPrice * assessmentRate * winningRate),
+      winningRate,
+      assessmentRate,
+      competitorCount: 3 + Math.floor(rand() * 25),
+    },
+    companySnapshot: {
+      creditRating: pick(RATINGS),
+      deliveryRecords: [
+        {
+          organization: pick(ORGANIZATIONS),
+          productName: category,
+          amount: Math.round(50000000 + rand() * 300000000),
+          completedAt: '2023-06-01T00:00:00Z',
+          category,
+          keywords: [category],
+        },
+      ],
+      certifications: rand() < 0.5 ? ['iso9001', 'patent_utility'] : ['iso9001'],
+      techStaffCount: 2 + Math.floor(rand() * 10),
+    },
+  };
+});
+
+// ============================================================
+// 설정 그리드
+// ============================================================
+
+const configs = [];
+for (const strategy of ['aggressive', 'balanced', 'conservative', 'optimal']) {
+  for (const followRecommendation of [true, false]) {
+    for (const useActualAssessmentRate of [true, false]) {
+      for (const filter of [{}, { categories: ['flow_meter'] }, { organizations: ['상수도'] }, { maxPrice: 100000000 }]) {
+        configs.push({
+          tenantId: 'sweep-tenant',
+          productId: 'ur-1000-plus',
+          strategy,
+          simulateBidding: true,
+          followRecommendation,
+          useActualAssessmentRate,
+          calculateOptimalParams: true,
+          ...filter,
+        });
+      }
+    }
+  }
+}
+
+// ============================================================
+// 순차 실행 vs 스윕
+// ============================================================
+
+const originalLog = console.log;
+console.log = () => {};
+const engine = new BacktestEngineV3();
+engine.loadData(bids);
+let t = Date.now();
+const sequential = configs.map(config => engine.run(config));
+const sequentialMs = Date.now() - t;
+
+t = Date.now();
+const inProcess = await runBacktestSweepV3(bids, configs, { workers: 0, includeDetails: true });
+const inProcessMs = Date.now() - t;
+
+t = Date.now();
+const parallel = await runBacktestSweepV3(bids, configs, { includeDetails: true });
+const parallelMs = Date.now() - t;
+console.log = originalLog;
+
+let mismatches = 0;
+for (let i = 0; i < configs.length; i++) {
+  // insights/수치 모두 비교 (Date 포함 config는 동일 참조)
+  if (!isDeepStrictEqual(inProcess.entries[i].result, sequential[i])) mismatches++;
+  if (!isDeepStrictEqual(parallel.entries[i].result, sequential[i])) mismatches++;
+}
+
+console.log(`\n설정 수: ${configs.length}`);
+console.log(`순차 run():        ${sequentialMs}ms`);
+console.log(`스윕 (단일 스레드): ${inProcessMs}ms (예측 ${inProcess.predictionsComputed}회)`);
+console.log(`스윕 (워커 ${parallel.workersUsed}개):   ${parallelMs}ms`);
+console.log(`불일치: ${mismatches}`);
+
+if (mismatches > 0) {
+  console.error('❌ 스윕 결과가 순차 run()과 다릅니다');
+  process.exit(1);
+}
+console.log('✅ 스윕 결과가 순차 run()과 동일');
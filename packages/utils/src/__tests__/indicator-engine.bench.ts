@@ -0,0 +1,93 @@
+/**
+ * @qetta/utils - Indicator Engine Benchmark
+ *
+ * 1M 캔들 × 50 전략 시그널 감지: 증분 엔진 vs 전체 재계산
+ *
+ * 실행: pnpm --filter @qetta/utils bench
+ *
+ * 기존 경로는 bar마다 전체 시리즈를 재계산하므로(O(n × 조건)) 1M bar 전체를
+ * 돌릴 수 없다. 같은 1M 캔들 배열에서 마지막 LEGACY_BARS개 bar만 평가하고,
+ * 증분 엔진은 1M bar 전체를 평가한다. bar당 비용은 결과 시간 / bar 수로 비교.
+ */
+
+import { bench, describe } from 'vitest';
+import { evaluateConditionGroup } from '../signal-detector';
+import { IndicatorEngine } from '../indicator-engine';
+import type { HephaitosTypes } from '@qetta/types';
+
+type IOHLCV = HephaitosTypes.IOHLCV;
+type IConditionGroup = HephaitosTypes.IConditionGroup;
+type IIndicatorConfig = HephaitosTypes.IIndicatorConfig;
+
+const CANDLE_COUNT = 1_000_000;
+const STRATEGY_COUNT = 50;
+const LEGACY_BARS = 1;
+
+let seed = 20240101;
+const rand = () => {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+};
+
+const candles: IOHLCV[] = [];
+let price = 100;
+for (let i = 0; i < CANDLE_COUNT; i++) {
+  const open = price;
+  price *= 1 + (rand() - 0.5) * 0.01;
+  candles.push({
+    timestamp: '',
+    open,
+    high: Math.max(open, price) * 1.002,
+    low: Math.min(open, price) * 0.998,
+    close: price,
+    volume: 1000 * rand(),
+  });
+}
+
+const INDICATOR_POOL: IIndicatorConfig[] = [
+  { type: 'sma', period: 10 },
+  { type: 'sma', period: 50 },
+  { type: 'ema', period: 12 },
+  { type: 'ema', period: 26 },
+  { type: 'rsi', period: 14 },
+  { type: 'macd' },
+  { type: 'bollinger', params: { band: 1 } },
+  { type: 'bollinger', params: { band: -1 } },
+  { type: 'atr', period: 14 },
+  { type: 'price' },
+];
+
+const pick = () => INDICATOR_POOL[Math.floor(rand() * INDICATOR_POOL.length)];
+
+const strategies: IConditionGroup[] = Array.from({ length: STRATEGY_COUNT }, () => ({
+  logic: rand() < 0.5 ? 'and' : 'or',
+  conditions: [
+    { left: pick(), operator: 'cross_above', right: pick() },
+    { left: { type: 'rsi', period: 14 }, operator: rand() < 0.5 ? 'lt' : 'gt', right: 50 },
+  ],
+}));
+
+describe(`signal detection: ${CANDLE_COUNT} candles × ${STRATEGY_COUNT} strategies`, () => {
+  bench(
+    'IndicatorEngine (all bars)',
+    () => {
+      const engine = new IndicatorEngine();
+      strategies.forEach((s) => engine.compile(s));
+      for (let i = 0; i < candles.length; i++) {
+        engine.update(candles[i]);
+        for (const strategy of strategies) engine.evaluate(strategy);
+      }
+    },
+    { iterations: 3 }
+  );
+
+  bench(
+    `evaluateConditionGroup (last ${LEGACY_BARS} bars)`,
+    () => {
+      for (let i = candles.length - LEGACY_BARS; i < candles.length; i++) {
+        for (const strategy of strategies) evaluateConditionGroup(candles, strategy, i);
+      }
+    },
+    { iterations: 1 }
+  );
+});
@@ -0,0 +1,246 @@
+/**
+ * @qetta/utils - Indicator Engine Tests
+ * 증분 지표 엔진 테스트
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  calculateSMA,
+  calculateEMA,
+  calculateRSI,
+  calculateMACD,
+  calculateBollingerBands,
+  calculateATR,
+  evaluateConditionGroup,
+  detectEntrySignal,
+} from '../signal-detector';
+import {
+  Float64RingBuffer,
+  IndicatorEngine,
+  createStreamingIndicator,
+  getIndicatorKey,
+} from '../indicator-engine';
+import type { HephaitosTypes } from '@qetta/types';
+
+type IOHLCV = HephaitosTypes.IOHLCV;
+type IConditionGroup = HephaitosTypes.IConditionGroup;
+type IIndicatorConfig = HephaitosTypes.IIndicatorConfig;
+
+// ═══════════════════════════════════════════════════════════════
+// 테스트 데이터 헬퍼
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 결정적 랜덤워크 캔들 생성
+ */
+const createRandomWalk = (length: number, seed: number = 42): IOHLCV[] => {
+  let state = seed;
+  const rand = () => {
+    state = (state * 1103515245 + 12345) % 2147483648;
+    return state / 2147483648;
+  };
+
+  const candles: IOHLCV[] = [];
+  let price = 100;
+  for (let i = 0; i < length; i++) {
+    const open = price;
+    price *= 1 + (rand() - 0.5) * 0.02;
+    candles.push({
+      timestamp: new Date(2024, 0, 1, 0, i).toISOString(),
+      open,
+      high: Math.max(open, price) * 1.01,
+      low: Math.min(open, price) * 0.99,
+      close: price,
+      volume: 1000 * rand(),
+    });
+  }
+  return candles;
+};
+
+const candles = createRandomWalk(600);
+const closes = candles.map((c) => c.close);
+
+const streamAll = (config: IIndicatorConfig): number[] => {
+  const indicator = createStreamingIndicator(config, candles.length);
+  return candles.map((c) => indicator.update(c));
+};
+
+const expectSeriesClose = (actual: number[], expected: number[]) => {
+  expect(actual).toHaveLength(expected.length);
+  for (let i = 0; i < expected.length; i++) {
+    if (isNaN(expected[i])) {
+      expect(isNaN(actual[i])).toBe(true);
+    } else {
+      expect(actual[i]).toBeCloseTo(expected[i], 8);
+    }
+  }
+};
+
+// ═══════════════════════════════════════════════════════════════
+// 링버퍼 테스트
+// ═══════════════════════════════════════════════════════════════
+
+describe('Float64RingBuffer', () => {
+  it('최신 값부터 offset으로 조회', () => {
+    const buffer = new Float64RingBuffer(3);
+    buffer.push(1);
+    buffer.push(2);
+
+    expect(buffer.length).toBe(2);
+    expect(buffer.get(0)).toBe(2);
+    expect(buffer.get(1)).toBe(1);
+    expect(isNaN(buffer.get(2))).toBe(true);
+  });
+
+  it('용량 초과 시 오래된 값 덮어쓰기', () => {
+    const buffer = new Float64RingBuffer(3);
+    [1, 2, 3, 4, 5].forEach((v) => buffer.push(v));
+
+    expect(buffer.length).toBe(3);
+    expect(buffer.get(0)).toBe(5);
+    expect(buffer.get(2)).toBe(3);
+    expect(isNaN(buffer.get(3))).toBe(true);
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// 스트리밍 지표 = 배치 지표
+// ═══════════════════════════════════════════════════════════════
+
+describe('createStreamingIndicator', () => {
+  it('SMA가 calculateSMA와 일치', () => {
+    expectSeriesClose(streamAll({ type: 'sma', period: 20 }), calculateSMA(closes, 20));
+  });
+
+  it('EMA가 calculateEMA와 일치', () => {
+    expectSeriesClose(streamAll({ type: 'ema', period: 12 }), calculateEMA(closes, 12));
+  });
+
+  it('RSI가 calculateRSI와 일치', () => {
+    expectSeriesClose(streamAll({ type: 'rsi', period: 14 }), calculateRSI(closes, 14));
+  });
+
+  it('MACD 라인이 calculateMACD와 일치', () => {
+    expectSeriesClose(
+      streamAll({ type: 'macd', params: { fastPeriod: 12, slowPeriod: 26 } }),
+      calculateMACD(closes, 12, 26, 9).macd
+    );
+  });
+
+  it('볼린저 밴드가 calculateBollingerBands와 일치', () => {
+    const { upper, middle, lower } = calculateBollingerBands(closes, 20, 2);
+
+    expectSeriesClose(streamAll({ type: 'bollinger', params: { band: 1 } }), upper);
+    expectSeriesClose(streamAll({ type: 'bollinger' }), middle);
+    expectSeriesClose(streamAll({ type: 'bollinger', params: { band: -1 } }), lower);
+  });
+
+  it('ATR이 calculateATR과 일치', () => {
+    expectSeriesClose(streamAll({ type: 'atr', period: 14 }), calculateATR(candles, 14));
+  });
+
+  it('긴 시리즈에서도 롤링 합계 오차 누적 없음', () => {
+    const long = createRandomWalk(20000, 7);
+    const indicator = createStreamingIndicator({ type: 'sma', period: 50 });
+    long.forEach((c) => indicator.update(c));
+
+    const tail = long.slice(-50).reduce((sum, c) => sum + c.close, 0) / 50;
+    expect(indicator.valueAt(0)).toBeCloseTo(tail, 10);
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// 엔진 테스트
+// ═══════════════════════════════════════════════════════════════
+
+describe('IndicatorEngine', () => {
+  const strategyA: IConditionGroup = {
+    logic: 'and',
+    conditions: [
+      { left: { type: 'sma', period: 10 }, operator: 'cross_above', right: { type: 'ema' } },
+      { left: { type: 'rsi' }, operator: 'lt', right: 70 },
+    ],
+  };
+
+  const strategyB: IConditionGroup = {
+    logic: 'or',
+    conditions: [
+      { left: { type: 'rsi', period: 14 }, operator: 'lt', right: 35 },
+      {
+        logic: 'and',
+        conditions: [
+          {
+            left: { type: 'price' },
+            operator: 'lt',
+            right: { type: 'bollinger', params: { band: -1 } },
+          },
+          { left: { type: 'ema', period: 20 }, operator: 'gt', right: 0 },
+        ],
+      },
+    ],
+  };
+
+  it('같은 설정의 지표를 전략 간 공유', () => {
+    const engine = new IndicatorEngine();
+    engine.compile(strategyA);
+    engine.compile(strategyB);
+
+    // sma:10, ema:20, rsi:14, price:close, bollinger:20:2:-1
+    expect(engine.indicatorCount).toBe(5);
+    expect(getIndicatorKey({ type: 'rsi' })).toBe(getIndicatorKey({ type: 'rsi', period: 14 }));
+  });
+
+  it('모든 bar에서 evaluateConditionGroup과 같은 결과', () => {
+    const engine = new IndicatorEngine();
+
+    candles.forEach((candle, i) => {
+      engine.update(candle);
+      expect(engine.evaluate(strategyA)).toBe(evaluateConditionGroup(candles, strategyA, i));
+      expect(engine.evaluate(strategyB)).toBe(evaluateConditionGroup(candles, strategyB, i));
+    });
+  });
+
+  it('source 지정 시 도중 등록된 지표를 backfill', () => {
+    const engine = new IndicatorEngine({ source: candles });
+    engine.advanceTo(300);
+
+    expect(engine.evaluate(strategyB)).toBe(evaluateConditionGroup(candles, strategyB, 300));
+    expect(engine.evaluate(strategyB, 5)).toBe(evaluateConditionGroup(candles, strategyB, 295));
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// detectEntrySignal 증분 경로
+// ═══════════════════════════════════════════════════════════════
+
+describe('detectEntrySignal (incremental)', () => {
+  it('순차/역순 인덱스 모두 전체 재계산 결과와 일치', () => {
+    const series = createRandomWalk(400, 3);
+    const group: IConditionGroup = {
+      logic: 'or',
+      conditions: [
+        { left: { type: 'macd' }, operator: 'cross_above', right: 0 },
+        { left: { type: 'rsi' }, operator: 'lt', right: 40 },
+      ],
+    };
+
+    for (let i = 0; i < series.length; i++) {
+      expect(detectEntrySignal(series, group, i)).toBe(evaluateConditionGroup(series, group, i));
+    }
+    for (let i = series.length - 1; i >= 0; i -= 37) {
+      expect(detectEntrySignal(series, group, i)).toBe(evaluateConditionGroup(series, group, i));
+    }
+  });
+
+  it('마지막 캔들이 교체되면 다시 계산', () => {
+    const series = createRandomWalk(100, 5);
+    const group: IConditionGroup = {
+      logic: 'and',
+      conditions: [{ left: { type: 'price' }, operator: 'gt', right: 1000 }],
+    };
+
+    expect(detectEntrySignal(series, group, 99)).toBe(false);
+    series[99] = { ...series[99], close: 5000 };
+    expect(detectEntrySignal(series, group, 99)).toBe(true);
+  });
+});
@@ -0,0 +1,287 @@
+/**
+ * @qetta/utils - Monte Carlo VaR Tests
+ * 시드 기반 몬테카를로 커널 및 VaR/CVaR 테스트
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  MONTE_CARLO_CHUNK_SIZE,
+  createSeededRandom,
+  quickselect,
+  summarizeLowerTail,
+  choleskyDecompose,
+  simulateMonteCarloChunk,
+  runMonteCarlo,
+  runMonteCarloAsync,
+  type IMonteCarloChunk,
+  type IMonteCarloWorkerPool,
+  type MonteCarloTask,
+} from '../monte-carlo';
+import {
+  calculateHistoricalVaR,
+  calculateCVaR,
+  calculateMonteCarloVaR,
+  calculateMonteCarloCVaR,
+  calculateMonteCarloCVaRAsync,
+  calculatePortfolioMonteCarloCVaR,
+  calculateCorrelationMatrix,
+} from '../risk-calc';
+
+// ═══════════════════════════════════════════════════════════════
+// 테스트 데이터 헬퍼
+// ═══════════════════════════════════════════════════════════════
+
+const createReturns = (count: number, seed: number, stdDev: number = 0.02): number[] => {
+  const random = createSeededRandom(seed);
+  return Array.from({ length: count }, () => (random() - 0.5) * 2 * stdDev * Math.sqrt(3));
+};
+
+interface ICountingPool extends IMonteCarloWorkerPool {
+  calls: number;
+}
+
+/** 청크를 비동기로(역순 완료) 실행하는 가짜 풀 */
+const createReversePool = (): ICountingPool => {
+  let pending = 0;
+  const pool = {
+    size: 4,
+    calls: 0,
+    run(chunk: IMonteCarloChunk): Promise<Float64Array> {
+      pool.calls++;
+      const delay = 10 - pending++;
+      return new Promise((resolve) =>
+        setTimeout(() => resolve(simulateMonteCarloChunk(chunk)), Math.max(0, delay))
+      );
+    },
+  };
+  return pool;
+};
+
+// ═══════════════════════════════════════════════════════════════
+// 커널
+// ═══════════════════════════════════════════════════════════════
+
+describe('createSeededRandom', () => {
+  it('같은 시드는 같은 수열, 값은 (0, 1) 구간', () => {
+    const a = createSeededRandom(123);
+    const b = createSeededRandom(123);
+    for (let i = 0; i < 1000; i++) {
+      const value = a();
+      expect(value).toBe(b());
+      expect(value).toBeGreaterThan(0);
+      expect(value).toBeLessThan(1);
+    }
+  });
+
+  it('시드가 다르면 다른 수열', () => {
+    expect(createSeededRandom(1)()).not.toBe(createSeededRandom(2)());
+  });
+});
+
+describe('quickselect / summarizeLowerTail', () => {
+  it('정렬 기반 선택과 동일', () => {
+    const values = createReturns(1001, 7);
+    const sorted = [...values].sort((a, b) => a - b);
+    for (const k of [0, 1, 50, 500, 999, 1000]) {
+      expect(quickselect(Float64Array.from(values), k)).toBe(sorted[k]);
+    }
+  });
+
+  it('정렬 기반 VaR 분위수/꼬리 평균과 동일', () => {
+    const values = createReturns(2000, 11);
+    const sorted = [...values].sort((a, b) => a - b);
+    const cutoff = Math.floor(0.05 * values.length);
+    const expectedTail = sorted.slice(0, cutoff).reduce((s, v) => s + v, 0) / cutoff;
+
+    const summary = summarizeLowerTail(Float64Array.from(values), 0.95);
+    expect(summary.percentile).toBe(sorted[cutoff]);
+    expect(summary.tailMean).toBeCloseTo(expectedTail, 12);
+  });
+
+  it('원소 1~2개 입력 처리', () => {
+    expect(summarizeLowerTail(new Float64Array(0), 0.95)).toEqual({ percentile: 0, tailMean: 0 });
+    expect(summarizeLowerTail(Float64Array.from([0.01]), 0.99)).toEqual({
+      percentile: 0.01,
+      tailMean: 0.01,
+    });
+  });
+});
+
+describe('choleskyDecompose', () => {
+  it('L·Lᵀ로 상관행렬 복원', () => {
+    const matrix = [
+      [1, 0.6, 0.2],
+      [0.6, 1, 0.4],
+      [0.2, 0.4, 1],
+    ];
+    const L = choleskyDecompose(matrix);
+    for (let i = 0; i < 3; i++) {
+      for (let j = 0; j < 3; j++) {
+        let sum = 0;
+        for (let k = 0; k < 3; k++) sum += L[i * 3 + k] * L[j * 3 + k];
+        expect(sum).toBeCloseTo(matrix[i][j], 10);
+      }
+    }
+  });
+
+  it('양의 정부호에서 크게 벗어난 행렬은 거부', () => {
+    expect(() =>
+      choleskyDecompose([
+        [1, 2],
+        [2, 1],
+      ])
+    ).toThrow('not positive definite');
+  });
+});
+
+describe('runMonteCarlo', () => {
+  const task: MonteCarloTask = { kind: 'single', mean: 0.001, stdDev: 0.02, holdingPeriod: 10 };
+
+  it('같은 시드는 같은 결과', () => {
+    expect(runMonteCarlo(task, 5000, 42)).toEqual(runMonteCarlo(task, 5000, 42));
+    expect(runMonteCarlo(task, 5000, 42)).not.toEqual(runMonteCarlo(task, 5000, 43));
+  });
+
+  it('보유 기간에 비례해 평균/분산 증가', () => {
+    const simulated = runMonteCarlo(task, 200000, 5);
+    let sum = 0;
+    for (const v of simulated) sum += v;
+    const avg = sum / simulated.length;
+    let sq = 0;
+    for (const v of simulated) sq += (v - avg) ** 2;
+    const std = Math.sqrt(sq / (simulated.length - 1));
+
+    expect(avg).toBeCloseTo(0.01, 3);
+    expect(std).toBeCloseTo(0.02 * Math.sqrt(10), 3);
+  });
+
+  it('가짜 워커 풀(역순 완료)로도 같은 버퍼', async () => {
+    const simulations = MONTE_CARLO_CHUNK_SIZE * 3 + 17;
+    const pool = createReversePool();
+    const viaPool = await runMonteCarloAsync(task, simulations, 99, pool);
+
+    expect(pool.calls).toBe(4);
+    expect(viaPool).toEqual(runMonteCarlo(task, simulations, 99));
+  });
+});
+
+// ═══════════════════════════════════════════════════════════════
+// VaR / CVaR
+// ═══════════════════════════════════════════════════════════════
+
+describe('calculateMonteCarloVaR', () => {
+  const returns = createReturns(500, 3);
+
+  it('시드 지정 시 재현 가능', () => {
+    const a = calculateMonteCarloVaR(returns, 1000000, 0.95, 1, 20000, 7);
+    const b = calculateMonteCarloVaR(returns, 1000000, 0.95, 1, 20000, 7);
+    expect(a.value).toBe(b.value);
+    expect(a.method).toBe('monte_carlo');
+  });
+
+  it('모수적 정규분포 VaR에 수렴', () => {
+    const result = calculateMonteCarloVaR(returns, 1000000, 0.95, 1, 200000, 1);
+    const avg = returns.reduce((s, r) => s + r, 0) / returns.length;
+    const std = Math.sqrt(
+      returns.reduce((s, r) => s + (r - avg) ** 2, 0) / (returns.length - 1)
+    );
+    const expected = Math.abs(avg - 1.645 * std) * 1000000;
+
+    expect(Math.abs(result.value - expected) / expected).toBeLessThan(0.02);
+  });
+
+  it('데이터 부족 시 빈 결과', () => {
+    expect(calculateMonteCarloVaR([0.01], 1000000).value).toBe(0);
+  });
+});
+
+describe('calculateMonteCarloCVaR', () => {
+  const returns = createReturns(500, 4);
+
+  it('CVaR는 VaR 이상', () => {
+    const result = calculateMonteCarloCVaR(returns, 1000000, { simulations: 50000, seed: 8 });
+    expect(result.cvarValue).toBeGreaterThanOrEqual(result.value);
+  });
+
+  it('가짜 워커 풀로도 동기 결과와 동일', async () => {
+    const options = { simulations: MONTE_CARLO_CHUNK_SIZE + 100, seed: 21 };
+    const sync = calculateMonteCarloCVaR(returns, 1000000, options);
+    const async = await calculateMonteCarloCVaRAsync(returns, 1000000, {
+      ...options,
+      pool: createReversePool(),
+    });
+
+    expect(async.value).toBe(sync.value);
+    expect(async.cvarValue).toBe(sync.cvarValue);
+  });
+});
+
+describe('calculateHistoricalVaR / calculateCVaR', () => {
+  it('정렬 기반 결과 유지', () => {
+    const returns = createReturns(1000, 9);
+    const sorted = [...returns].sort((a, b) => a - b);
+    const index = Math.floor(0.05 * returns.length);
+    const tail = sorted.slice(0, index);
+    const tailMean = tail.reduce((s, r) => s + r, 0) / tail.length;
+
+    const historical = calculateHistoricalVaR(returns, 1000000, 0.95, 1);
+    const cvar = calculateCVaR(returns, 1000000, 0.95, 1);
+
+    expect(historical.value).toBeCloseTo(Math.abs(sorted[index] * 1000000), 6);
+    expect(cvar.value).toBeCloseTo(historical.value, 6);
+    expect(cvar.cvarValue).toBeCloseTo(Math.abs(tailMean * 1000000), 6);
+  });
+
+  it('입력 배열은 변경하지 않음', () => {
+    const returns = [0.03, -0.02, 0.01, -0.05, 0.02];
+    calculateCVaR(returns, 1000);
+    expect(returns).toEqual([0.03, -0.02, 0.01, -0.05, 0.02]);
+  });
+});
+
+describe('calculatePortfolioMonteCarloCVaR', () => {
+  const base = createReturns(500, 12);
+  const noise = createReturns(500, 13);
+  const correlated = base.map((r, i) => 0.8 * r + 0.6 * noise[i]);
+  const independent = createReturns(500, 14);
+
+  it('대칭 상관행렬 계산', () => {
+    const matrix = calculateCorrelationMatrix([base, correlated, independent]);
+    expect(matrix[0][0]).toBe(1);
+    expect(matrix[0][1]).toBe(matrix[1][0]);
+    expect(matrix[0][1]).toBeGreaterThan(0.7);
+    expect(Math.abs(matrix[0][2])).toBeLessThan(0.2);
+  });
+
+  it('상관된 보유 자산은 VaR 증가', () => {
+    const options = { simulations: 100000, seed: 3 };
+    const together = calculatePortfolioMonteCarloCVaR(
+      [base, correlated],
+      [0.5, 0.5],
+      1000000,
+      undefined,
+      options
+    );
+    const diversified = calculatePortfolioMonteCarloCVaR(
+      [base, independent],
+      [0.5, 0.5],
+      1000000,
+      undefined,
+      options
+    );
+
+    expect(together.value).toBeGreaterThan(diversified.value);
+    expect(together.cvarValue).toBeGreaterThanOrEqual(together.value);
+  });
+
+  it('자산 1개면 단일 자산 VaR와 동일', () => {
+    const options = { simulations: 20000, seed: 5 };
+    const portfolio = calculatePortfolioMonteCarloCVaR([base], [1], 1000000, [[1]], options);
+    const single = calculateMonteCarloCVaR(base, 1000000, options);
+    expect(portfolio.value).toBeCloseTo(single.value, 6);
+  });
+
+  it('입력 길이 불일치 시 빈 결과', () => {
+    expect(calculatePortfolioMonteCarloCVaR([base], [0.5, 0.5], 1000000).value).toBe(0);
+  });
+});
@@ -82,6 +82,18 @@ export {
   detectExitSignal,
 } from './signal-detector.js';
 
+// Streaming Indicator Engine (HEPHAITOS)
+export {
+  Float64RingBuffer,
+  IndicatorEngine,
+  createStreamingIndicator,
+  getIndicatorKey,
+  getSeriesEngine,
+  evaluateConditionGroupIncremental,
+  type IStreamingIndicator,
+  type IIndicatorEngineOptions,
+} from './indicator-engine.js';
+
 // Time Series Analysis
 export {
   calculateSimpleMovingAverage,
@@ -127,6 +139,10 @@ export {
   calculateHistoricalVaR,
   calculateParametricVaR,
   calculateMonteCarloVaR,
+  calculateMonteCarloCVaR,
+  calculateMonteCarloCVaRAsync,
+  calculatePortfolioMonteCarloCVaR,
+  calculatePortfolioMonteCarloCVaRAsync,
   calculateVaR,
   calculateCVaR,
   analyzeDrawdown,
@@ -142,12 +158,34 @@ export {
   calculateBeta,
   calculateHHI,
   calculateCorrelationRisk,
+  calculateCorrelationMatrix,
   recommendPositionSize,
   assessRiskLevel,
   calculateRiskScore,
   getRiskLevelFromScore,
+  type IMonteCarloOptions,
 } from './risk-calc.js';
 
+// Monte Carlo Simulation Kernel (HEPHAITOS)
+export {
+  MONTE_CARLO_CHUNK_SIZE,
+  createSeededRandom,
+  deriveChunkSeed,
+  fillStandardNormal,
+  quickselect,
+  summarizeLowerTail,
+  choleskyDecompose,
+  simulateMonteCarloChunk,
+  runMonteCarlo,
+  runMonteCarloAsync,
+  randomSeed,
+  type IMonteCarloSingleTask,
+  type IMonteCarloPortfolioTask,
+  type MonteCarloTask,
+  type IMonteCarloChunk,
+  type IMonteCarloWorkerPool,
+} from './monte-carlo.js';
+
 // Promotion Calculation Utilities (HEPHAITOS)
 export {
   calculateDiscount,
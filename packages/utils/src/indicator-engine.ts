@@ -0,0 +1,680 @@
+/**
+ * @qetta/utils - Streaming Indicator Engine
+ * L1 (Molecules) - 증분(O(1)/bar) 지표 계산 엔진
+ *
+ * signal-detector의 calculate* 함수는 호출마다 전체 시리즈를 재계산한다.
+ * 이 모듈은 롤링 합계 / Wilder 상태를 유지하는 상태형 지표를 제공하며,
+ * 결과는 Float64Array 링버퍼에 보관된다. 동일한 설정의 지표는
+ * 엔진 내에서 하나의 인스턴스로 공유된다.
+ */
+
+import type { HephaitosTypes } from '@qetta/types';
+import { evaluateComparison, evaluateConditionGroup } from './signal-detector.js';
+
+type IOHLCV = HephaitosTypes.IOHLCV;
+type ICondition = HephaitosTypes.ICondition;
+type IConditionGroup = HephaitosTypes.IConditionGroup;
+type IIndicatorConfig = HephaitosTypes.IIndicatorConfig;
+type ComparisonOperator = HephaitosTypes.ComparisonOperator;
+
+/**
+ * 기본 결과 보관 길이 (bar)
+ */
+const DEFAULT_HISTORY_SIZE = 256;
+
+// ═══════════════════════════════════════════════════════════════
+// 링버퍼
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 고정 용량 Float64 링버퍼
+ *
+ * offset 0 = 가장 최근 값, 범위를 벗어나면 NaN
+ */
+export class Float64RingBuffer {
+  private readonly data: Float64Array;
+  private head = -1;
+  private size = 0;
+
+  constructor(readonly capacity: number) {
+    if (capacity < 1) {
+      throw new Error('RingBuffer capacity must be at least 1');
+    }
+    this.data = new Float64Array(capacity);
+  }
+
+  get length(): number {
+    return this.size;
+  }
+
+  push(value: number): void {
+    this.head = (this.head + 1) % this.capacity;
+    this.data[this.head] = value;
+    if (this.size < this.capacity) this.size++;
+  }
+
+  get(offset: number = 0): number {
+    if (offset < 0 || offset >= this.size) return NaN;
+    const idx = (this.head - offset + this.capacity) % this.capacity;
+    return this.data[idx];
+  }
+
+  clear(): void {
+    this.head = -1;
+    this.size = 0;
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 스트리밍 지표
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 스트리밍 지표 공통 인터페이스
+ */
+export interface IStreamingIndicator {
+  /** 정규화된 설정 키 (공유 기준) */
+  readonly key: string;
+  /** 처리한 bar 수 */
+  readonly count: number;
+  /** 새 캔들 반영 후 최신 값 반환 */
+  update(candle: IOHLCV): number;
+  /** offset번째 이전 값 (0 = 최신) */
+  valueAt(offset?: number): number;
+}
+
+abstract class StreamingIndicator implements IStreamingIndicator {
+  private readonly values: Float64RingBuffer;
+  private processed = 0;
+
+  constructor(
+    readonly key: string,
+    historySize: number
+  ) {
+    this.values = new Float64RingBuffer(historySize);
+  }
+
+  get count(): number {
+    return this.processed;
+  }
+
+  update(candle: IOHLCV): number {
+    const value = this.next(candle);
+    this.values.push(value);
+    this.processed++;
+    return value;
+  }
+
+  valueAt(offset: number = 0): number {
+    return this.values.get(offset);
+  }
+
+  protected abstract next(candle: IOHLCV): number;
+}
+
+/**
+ * 가격 / 거래량 소스
+ */
+class SourceIndicator extends StreamingIndicator {
+  constructor(
+    key: string,
+    historySize: number,
+    private readonly source: 'open' | 'high' | 'low' | 'close' | 'volume'
+  ) {
+    super(key, historySize);
+  }
+
+  protected next(candle: IOHLCV): number {
+    return candle[this.source];
+  }
+}
+
+/**
+ * 롤링 합계 SMA
+ *
+ * period bar마다 윈도우를 다시 합산해 누적 오차를 제거 (분할상환 O(1))
+ */
+class SMAState {
+  private readonly window: Float64Array;
+  private count = 0;
+  private sum = 0;
+
+  constructor(private readonly period: number) {
+    this.window = new Float64Array(period);
+  }
+
+  next(value: number): number {
+    const slot = this.count % this.period;
+    if (this.count >= this.period) {
+      this.sum -= this.window[slot];
+    }
+    this.window[slot] = value;
+    this.sum += value;
+    this.count++;
+
+    if (this.count % this.period === 0) {
+      let exact = 0;
+      for (let i = 0; i < this.period; i++) exact += this.window[i];
+      this.sum = exact;
+    }
+
+    return this.count >= this.period ? this.sum / this.period : NaN;
+  }
+}
+
+/**
+ * EMA 상태 (calculateEMA와 동일한 시드/워밍업 규칙)
+ */
+class EMAState {
+  private readonly multiplier: number;
+  private count = 0;
+  private ema = NaN;
+
+  constructor(private readonly period: number) {
+    this.multiplier = 2 / (period + 1);
+  }
+
+  next(value: number): number {
+    this.ema = this.count === 0 ? value : (value - this.ema) * this.multiplier + this.ema;
+    this.count++;
+    // 처음 period-1개는 불안정
+    return this.count < this.period ? NaN : this.ema;
+  }
+}
+
+class SMAIndicator extends StreamingIndicator {
+  private readonly state: SMAState;
+
+  constructor(key: string, historySize: number, period: number) {
+    super(key, historySize);
+    this.state = new SMAState(period);
+  }
+
+  protected next(candle: IOHLCV): number {
+    return this.state.next(candle.close);
+  }
+}
+
+class EMAIndicator extends StreamingIndicator {
+  private readonly state: EMAState;
+
+  constructor(key: string, historySize: number, period: number) {
+    super(key, historySize);
+    this.state = new EMAState(period);
+  }
+
+  protected next(candle: IOHLCV): number {
+    return this.state.next(candle.close);
+  }
+}
+
+/**
+ * Wilder RSI
+ */
+class RSIIndicator extends StreamingIndicator {
+  private count = 0;
+  private prevClose = NaN;
+  private avgGain = 0;
+  private avgLoss = 0;
+
+  constructor(
+    key: string,
+    historySize: number,
+    private readonly period: number
+  ) {
+    super(key, historySize);
+  }
+
+  protected next(candle: IOHLCV): number {
+    const close = candle.close;
+    const i = this.count++;
+    const prevClose = this.prevClose;
+    this.prevClose = close;
+    if (i === 0) return NaN;
+
+    const change = close - prevClose;
+    const gain = change > 0 ? change : 0;
+    const loss = change < 0 ? -change : 0;
+
+    if (i <= this.period) {
+      // 초기 평균 누적
+      this.avgGain += gain;
+      this.avgLoss += loss;
+      if (i < this.period) return NaN;
+      this.avgGain /= this.period;
+      this.avgLoss /= this.period;
+    } else {
+      // Smoothed RSI
+      this.avgGain = (this.avgGain * (this.period - 1) + gain) / this.period;
+      this.avgLoss = (this.avgLoss * (this.period - 1) + loss) / this.period;
+    }
+
+    const rs = this.avgLoss === 0 ? 100 : this.avgGain / this.avgLoss;
+    return 100 - 100 / (1 + rs);
+  }
+}
+
+/**
+ * MACD 라인 (fast EMA - slow EMA)
+ */
+class MACDIndicator extends StreamingIndicator {
+  private readonly fast: EMAState;
+  private readonly slow: EMAState;
+
+  constructor(key: string, historySize: number, fastPeriod: number, slowPeriod: number) {
+    super(key, historySize);
+    this.fast = new EMAState(fastPeriod);
+    this.slow = new EMAState(slowPeriod);
+  }
+
+  protected next(candle: IOHLCV): number {
+    const fast = this.fast.next(candle.close);
+    const slow = this.slow.next(candle.close);
+    if (isNaN(fast) || isNaN(slow)) return NaN;
+    return fast - slow;
+  }
+}
+
+/**
+ * 볼린저 밴드 (슬라이딩 Welford 분산)
+ *
+ * period bar마다 윈도우로 평균/편차제곱합을 다시 계산
+ */
+class BollingerIndicator extends StreamingIndicator {
+  private readonly window: Float64Array;
+  private count = 0;
+  private mean = 0;
+  private m2 = 0;
+
+  constructor(
+    key: string,
+    historySize: number,
+    private readonly period: number,
+    private readonly stdDevMultiplier: number,
+    private readonly band: number
+  ) {
+    super(key, historySize);
+    this.window = new Float64Array(period);
+  }
+
+  protected next(candle: IOHLCV): number {
+    const value = candle.close;
+    const period = this.period;
+    const slot = this.count % period;
+
+    if (this.count < period) {
+      const n = this.count + 1;
+      const delta = value - this.mean;
+      this.mean += delta / n;
+      this.m2 += delta * (value - this.mean);
+    } else {
+      const old = this.window[slot];
+      const prevMean = this.mean;
+      this.mean += (value - old) / period;
+      this.m2 += (value - old) * (value - this.mean + old - prevMean);
+    }
+    this.window[slot] = value;
+    this.count++;
+
+    if (this.count % period === 0) {
+      let sum = 0;
+      for (let i = 0; i < period; i++) sum += this.window[i];
+      const mean = sum / period;
+      let m2 = 0;
+      for (let i = 0; i < period; i++) m2 += (this.window[i] - mean) ** 2;
+      this.mean = mean;
+      this.m2 = m2;
+    }
+
+    if (this.count < period) return NaN;
+    if (this.band === 0) return this.mean;
+
+    const stdDev = Math.sqrt(Math.max(0, this.m2) / period);
+    return this.band > 0
+      ? this.mean + this.stdDevMultiplier * stdDev
+      : this.mean - this.stdDevMultiplier * stdDev;
+  }
+}
+
+/**
+ * ATR (True Range의 EMA - calculateATR와 동일)
+ */
+class ATRIndicator extends StreamingIndicator {
+  private readonly state: EMAState;
+  private prevClose = NaN;
+
+  constructor(key: string, historySize: number, period: number) {
+    super(key, historySize);
+    this.state = new EMAState(period);
+  }
+
+  protected next(candle: IOHLCV): number {
+    const tr = isNaN(this.prevClose)
+      ? candle.high - candle.low
+      : Math.max(
+          candle.high - candle.low,
+          Math.abs(candle.high - this.prevClose),
+          Math.abs(candle.low - this.prevClose)
+        );
+    this.prevClose = candle.close;
+    return this.state.next(tr);
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 지표 생성
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 지표 설정 정규화 키 (기본값 적용)
+ *
+ * getIndicatorValues와 동일한 기본값을 사용하므로
+ * 같은 키 = 같은 값 시리즈
+ */
+export function getIndicatorKey(config: IIndicatorConfig): string {
+  switch (config.type) {
+    case 'price':
+      return `price:${config.source ?? 'close'}`;
+    case 'sma':
+      return `sma:${config.period ?? 20}`;
+    case 'ema':
+      return `ema:${config.period ?? 20}`;
+    case 'rsi':
+      return `rsi:${config.period ?? 14}`;
+    case 'macd':
+      return `macd:${config.params?.fastPeriod ?? 12}:${config.params?.slowPeriod ?? 26}`;
+    case 'bollinger':
+      return `bollinger:${config.params?.period ?? 20}:${config.params?.stdDev ?? 2}:${Math.sign(
+        config.params?.band ?? 0
+      )}`;
+    case 'atr':
+      return `atr:${config.period ?? 14}`;
+    case 'volume':
+      return 'volume';
+    default:
+      return 'price:close';
+  }
+}
+
+/**
+ * 지표 설정으로 스트리밍 지표 생성
+ */
+export function createStreamingIndicator(
+  config: IIndicatorConfig,
+  historySize: number = DEFAULT_HISTORY_SIZE
+): IStreamingIndicator {
+  const key = getIndicatorKey(config);
+
+  switch (config.type) {
+    case 'price':
+      return new SourceIndicator(key, historySize, config.source ?? 'close');
+    case 'sma':
+      return new SMAIndicator(key, historySize, config.period ?? 20);
+    case 'ema':
+      return new EMAIndicator(key, historySize, config.period ?? 20);
+    case 'rsi':
+      return new RSIIndicator(key, historySize, config.period ?? 14);
+    case 'macd':
+      return new MACDIndicator(
+        key,
+        historySize,
+        config.params?.fastPeriod ?? 12,
+        config.params?.slowPeriod ?? 26
+      );
+    case 'bollinger':
+      return new BollingerIndicator(
+        key,
+        historySize,
+        config.params?.period ?? 20,
+        config.params?.stdDev ?? 2,
+        Math.sign(config.params?.band ?? 0)
+      );
+    case 'atr':
+      return new ATRIndicator(key, historySize, config.period ?? 14);
+    case 'volume':
+      return new SourceIndicator(key, historySize, 'volume');
+    default:
+      return new SourceIndicator(key, historySize, 'close');
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 엔진
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 엔진 옵션
+ */
+export interface IIndicatorEngineOptions {
+  /** 지표별 결과 보관 길이 (기본 256) */
+  historySize?: number;
+  /**
+   * 엔진이 소비하는 캔들 원본
+   * 지정하면 도중에 등록된 지표를 처음부터 재생(backfill)한다.
+   */
+  source?: readonly IOHLCV[];
+}
+
+interface ICompiledCondition {
+  left: IStreamingIndicator;
+  operator: ComparisonOperator;
+  right: IStreamingIndicator | number;
+}
+
+interface ICompiledGroup {
+  logic: 'and' | 'or';
+  conditions: (ICompiledCondition | ICompiledGroup)[];
+}
+
+/**
+ * 증분 지표 엔진
+ *
+ * - update()로 bar를 하나씩 공급 → 등록된 모든 지표가 O(1) 갱신
+ * - 같은 설정 키의 지표는 모든 조건/전략이 공유
+ * - 조건 그룹은 최초 평가 시 컴파일되어 캐시됨
+ */
+export class IndicatorEngine {
+  private readonly historySize: number;
+  private readonly source: readonly IOHLCV[] | undefined;
+  private readonly indicators = new Map<string, IStreamingIndicator>();
+  private readonly compiled = new WeakMap<IConditionGroup, ICompiledGroup>();
+  private bars = 0;
+  private lastCandle: IOHLCV | undefined;
+
+  constructor(options: IIndicatorEngineOptions = {}) {
+    this.historySize = Math.max(2, options.historySize ?? DEFAULT_HISTORY_SIZE);
+    this.source = options.source;
+  }
+
+  /** 처리한 bar 수 */
+  get barCount(): number {
+    return this.bars;
+  }
+
+  /** 마지막으로 처리한 캔들 */
+  get latestCandle(): IOHLCV | undefined {
+    return this.lastCandle;
+  }
+
+  /** 공유 중인 지표 수 */
+  get indicatorCount(): number {
+    return this.indicators.size;
+  }
+
+  /**
+   * 지표 조회 (없으면 생성 후 공유)
+   */
+  getIndicator(config: IIndicatorConfig): IStreamingIndicator {
+    const key = getIndicatorKey(config);
+    let indicator = this.indicators.get(key);
+    if (!indicator) {
+      indicator = createStreamingIndicator(config, this.historySize);
+      if (this.bars > 0 && this.source) {
+        for (let i = 0; i < this.bars; i++) indicator.update(this.source[i]);
+      }
+      this.indicators.set(key, indicator);
+    }
+    return indicator;
+  }
+
+  /**
+   * 새 bar 공급
+   */
+  update(candle: IOHLCV): void {
+    for (const indicator of this.indicators.values()) {
+      indicator.update(candle);
+    }
+    this.lastCandle = candle;
+    this.bars++;
+  }
+
+  /**
+   * source의 index번째 bar까지 진행
+   */
+  advanceTo(index: number): void {
+    if (!this.source) {
+      throw new Error('IndicatorEngine.advanceTo requires a source series');
+    }
+    const end = Math.min(index, this.source.length - 1);
+    for (let i = this.bars; i <= end; i++) {
+      this.update(this.source[i]);
+    }
+  }
+
+  /**
+   * 조건 그룹을 지표 참조로 컴파일 (그룹 객체 단위 캐시)
+   */
+  compile(group: IConditionGroup): ICompiledGroup {
+    let compiled = this.compiled.get(group);
+    if (!compiled) {
+      compiled = {
+        logic: group.logic,
+        conditions: group.conditions.map((cond) => {
+          if ('logic' in cond) {
+            return this.compile(cond as IConditionGroup);
+          }
+          const condition = cond as ICondition;
+          return {
+            left: this.getIndicator(condition.left),
+            operator: condition.operator,
+            right:
+              typeof condition.right === 'number'
+                ? condition.right
+                : this.getIndicator(condition.right),
+          };
+        }),
+      };
+      this.compiled.set(group, compiled);
+    }
+    return compiled;
+  }
+
+  /**
+   * 조건 그룹 평가
+   *
+   * @param group - 조건 그룹
+   * @param offset - 최신 bar로부터의 거리 (0 = 최신, historySize-2까지)
+   */
+  evaluate(group: IConditionGroup, offset: number = 0): boolean {
+    // 컴파일(지표 등록)을 먼저 수행해야 backfill된 값으로 평가된다
+    const compiled = this.compile(group);
+    return this.evaluateCompiled(compiled, offset);
+  }
+
+  private evaluateCompiled(group: ICompiledGroup, offset: number): boolean {
+    if (group.logic === 'and') {
+      for (const cond of group.conditions) {
+        if (!this.evaluateNode(cond, offset)) return false;
+      }
+      return true;
+    }
+    for (const cond of group.conditions) {
+      if (this.evaluateNode(cond, offset)) return true;
+    }
+    return false;
+  }
+
+  private evaluateNode(node: ICompiledCondition | ICompiledGroup, offset: number): boolean {
+    if ('logic' in node) {
+      return this.evaluateCompiled(node, offset);
+    }
+
+    // evaluateCondition과 동일: 이전 bar가 없으면 false
+    if (offset < 0 || this.bars - offset < 2) return false;
+
+    const leftValue = node.left.valueAt(offset);
+    const prevLeftValue = node.left.valueAt(offset + 1);
+
+    let rightValue: number;
+    let prevRightValue: number;
+    if (typeof node.right === 'number') {
+      rightValue = node.right;
+      prevRightValue = node.right;
+    } else {
+      rightValue = node.right.valueAt(offset);
+      prevRightValue = node.right.valueAt(offset + 1);
+    }
+
+    // NaN 체크
+    if (isNaN(leftValue) || isNaN(rightValue)) {
+      return false;
+    }
+
+    return evaluateComparison(leftValue, node.operator, rightValue, prevLeftValue, prevRightValue);
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 캔들 배열 바인딩
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 캔들 배열별 엔진 캐시
+ *
+ * 배열 참조가 같으면 엔진을 재사용한다. 인덱스가 증가하는 일반적인
+ * 백테스트/실시간 루프에서는 새 bar만 반영되므로 bar당 O(1).
+ */
+const seriesEngines = new WeakMap<readonly IOHLCV[], IndicatorEngine>();
+
+/**
+ * 캔들 배열에 바인딩된 엔진을 index까지 진행시켜 반환
+ *
+ * - index가 보관 범위보다 과거이거나
+ * - 이미 처리한 마지막 캔들이 교체된 경우(미완성 봉 갱신 등)
+ * 엔진을 새로 만들어 처음부터 재생한다.
+ * 캔들 객체를 제자리에서 수정하는 경우는 감지하지 못한다.
+ */
+export function getSeriesEngine(candles: readonly IOHLCV[], index: number): IndicatorEngine {
+  let engine = seriesEngines.get(candles);
+  const lastIndex = engine ? engine.barCount - 1 : -1;
+
+  if (
+    !engine ||
+    (lastIndex >= 0 && candles[lastIndex] !== engine.latestCandle) ||
+    lastIndex - index >= DEFAULT_HISTORY_SIZE - 1
+  ) {
+    engine = new IndicatorEngine({ source: candles });
+    seriesEngines.set(candles, engine);
+  }
+
+  engine.advanceTo(index);
+  return engine;
+}
+
+/**
+ * 캔들 배열의 index 시점에서 조건 그룹 평가 (증분)
+ *
+ * evaluateConditionGroup과 같은 결과를 내지만 지표를 재계산하지 않는다.
+ */
+export function evaluateConditionGroupIncremental(
+  candles: readonly IOHLCV[],
+  group: IConditionGroup,
+  index: number
+): boolean {
+  // 범위 밖 인덱스는 지표 계산 없이 끝나므로 기존 경로 사용
+  if (index < 1 || index >= candles.length) {
+    return evaluateConditionGroup(candles as IOHLCV[], group, index);
+  }
+  const engine = getSeriesEngine(candles, index);
+  return engine.evaluate(group, engine.barCount - 1 - index);
+}
@@ -0,0 +1,386 @@
+/**
+ * @qetta/utils - Monte Carlo Simulation Kernel
+ * L1 (Molecules) - 시드 고정 배치 시뮬레이션
+ *
+ * risk-calc의 몬테카를로 VaR/CVaR가 사용하는 저수준 커널
+ * - 시드 가능한 PRNG (xoshiro128**) → 재현 가능한 결과
+ * - Float64Array 배치 버퍼
+ * - quickselect 기반 백분위수 추출 (전체 정렬 불필요)
+ * - 고정 크기 청크 단위 시뮬레이션 → 워커 풀 분산 시에도 결과 동일
+ */
+
+/**
+ * 청크당 시뮬레이션 수
+ *
+ * 청크 경계와 청크별 시드는 워커 수와 무관하게 고정되므로
+ * 동기/워커 풀 실행 결과가 비트 단위로 같다.
+ */
+export const MONTE_CARLO_CHUNK_SIZE = 65536;
+
+// ═══════════════════════════════════════════════════════════════
+// 시드 PRNG
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * SplitMix32 - 시드 확장용
+ */
+function splitMix32(state: number): () => number {
+  let s = state >>> 0;
+  return () => {
+    s = (s + 0x9e3779b9) >>> 0;
+    let z = s;
+    z = Math.imul(z ^ (z >>> 16), 0x85ebca6b);
+    z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35);
+    return (z ^ (z >>> 16)) >>> 0;
+  };
+}
+
+/**
+ * 시드 고정 균등분포 난수 생성기 (xoshiro128**)
+ *
+ * 반환값은 (0, 1) 개구간 - Box-Muller의 log(0)을 피한다.
+ */
+export function createSeededRandom(seed: number): () => number {
+  const next = splitMix32(seed);
+  let a = next();
+  let b = next();
+  let c = next();
+  let d = next();
+
+  return () => {
+    const result = Math.imul(rotl(Math.imul(b, 5), 7), 9) >>> 0;
+    const t = b << 9;
+    c ^= a;
+    d ^= b;
+    b ^= c;
+    a ^= d;
+    c ^= t;
+    d = rotl(d, 11);
+    return (result + 0.5) / 4294967296;
+  };
+}
+
+function rotl(x: number, k: number): number {
+  return (x << k) | (x >>> (32 - k));
+}
+
+/**
+ * 청크별 파생 시드
+ */
+export function deriveChunkSeed(seed: number, chunkIndex: number): number {
+  return splitMix32((seed ^ Math.imul(chunkIndex + 1, 0x9e3779b1)) >>> 0)();
+}
+
+/**
+ * 표준정규 난수로 버퍼 채우기 (Box-Muller, cos/sin 쌍 모두 사용)
+ */
+export function fillStandardNormal(out: Float64Array, random: () => number): Float64Array {
+  const n = out.length;
+  let i = 0;
+  for (; i + 1 < n; i += 2) {
+    const r = Math.sqrt(-2 * Math.log(random()));
+    const theta = 2 * Math.PI * random();
+    out[i] = r * Math.cos(theta);
+    out[i + 1] = r * Math.sin(theta);
+  }
+  if (i < n) {
+    out[i] = Math.sqrt(-2 * Math.log(random())) * Math.cos(2 * Math.PI * random());
+  }
+  return out;
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 선택 알고리즘
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * k번째 작은 값 선택 (in-place quickselect, 평균 O(n))
+ *
+ * 호출 후 values[k]는 정렬 시 k번째 값이며,
+ * values[0..k)는 모두 values[k] 이하 (순서는 보장하지 않음)
+ */
+export function quickselect(values: Float64Array | number[], k: number): number {
+  let left = 0;
+  let right = values.length - 1;
+
+  while (right > left) {
+    // median-of-3 피벗
+    const mid = (left + right) >>> 1;
+    if (values[mid] < values[left]) swap(values, mid, left);
+    if (values[right] < values[left]) swap(values, right, left);
+    if (values[right] < values[mid]) swap(values, right, mid);
+    const pivot = values[mid];
+
+    let i = left;
+    let j = right;
+    while (i <= j) {
+      while (values[i] < pivot) i++;
+      while (values[j] > pivot) j--;
+      if (i <= j) {
+        swap(values, i, j);
+        i++;
+        j--;
+      }
+    }
+
+    if (k <= j) {
+      right = j;
+    } else if (k >= i) {
+      left = i;
+    } else {
+      break;
+    }
+  }
+
+  return values[k];
+}
+
+function swap(values: Float64Array | number[], i: number, j: number): void {
+  const tmp = values[i];
+  values[i] = values[j];
+  values[j] = tmp;
+}
+
+/**
+ * 하위 꼬리 요약 (VaR 백분위수 + 꼬리 평균)
+ *
+ * calculateHistoricalVaR / calculateCVaR와 같은 인덱스 규칙:
+ * - VaR = 정렬 시 floor((1 - c) × n)번째 값
+ * - 꼬리 평균 = 정렬 시 앞쪽 max(1, floor((1 - c) × n))개 값의 평균
+ *
+ * values는 in-place로 부분 정렬된다.
+ */
+export function summarizeLowerTail(
+  values: Float64Array | number[],
+  confidenceLevel: number
+): { percentile: number; tailMean: number } {
+  const n = values.length;
+  if (n === 0) return { percentile: 0, tailMean: 0 };
+
+  const cutoff = Math.floor((1 - confidenceLevel) * n);
+  const index = Math.min(n - 1, Math.max(0, cutoff));
+  const tailSize = Math.min(n, Math.max(1, cutoff));
+
+  // tailSize는 index 또는 index+1이므로 한 번의 선택으로
+  // 앞쪽 tailSize개가 최솟값 집합이 된다
+  const percentile = quickselect(values, index);
+
+  let sum = 0;
+  for (let i = 0; i < tailSize; i++) sum += values[i];
+
+  return { percentile, tailMean: sum / tailSize };
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 상관행렬
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 촐레스키 분해 (하삼각, 행 우선 n×n)
+ *
+ * 양의 정부호가 아니면 대각에 jitter를 더해 재시도
+ * (추정된 상관행렬은 반올림으로 미세하게 PD를 벗어나는 경우가 많다)
+ */
+export function choleskyDecompose(matrix: number[][]): Float64Array {
+  const n = matrix.length;
+  let jitter = 0;
+
+  // jitter: 0 → 1e-10 → … → 1e-4 (그 이상은 행렬 자체가 잘못된 것)
+  for (let attempt = 0; attempt < 5; attempt++) {
+    const lower = new Float64Array(n * n);
+    let ok = true;
+
+    for (let i = 0; i < n && ok; i++) {
+      for (let j = 0; j <= i; j++) {
+        let sum = matrix[i][j] + (i === j ? jitter : 0);
+        for (let k = 0; k < j; k++) {
+          sum -= lower[i * n + k] * lower[j * n + k];
+        }
+        if (i === j) {
+          if (sum <= 0) {
+            ok = false;
+            break;
+          }
+          lower[i * n + i] = Math.sqrt(sum);
+        } else {
+          lower[i * n + j] = sum / lower[j * n + j];
+        }
+      }
+    }
+
+    if (ok) return lower;
+    jitter = jitter === 0 ? 1e-10 : jitter * 100;
+  }
+
+  throw new Error('Correlation matrix is not positive definite');
+}
+
+// ═══════════════════════════════════════════════════════════════
+// 시뮬레이션 태스크
+// ═══════════════════════════════════════════════════════════════
+
+/**
+ * 단일 자산 (또는 포트폴리오 수익률 시리즈) 정규 시뮬레이션
+ */
+export interface IMonteCarloSingleTask {
+  kind: 'single';
+  /** 일 평균 수익률 */
+  mean: number;
+  /** 일 표준편차 */
+  stdDev: number;
+  holdingPeriod: number;
+}
+
+/**
+ * 다자산 상관 시뮬레이션
+ */
+export interface IMonteCarloPortfolioTask {
+  kind: 'portfolio';
+  /** 자산별 일 평균 수익률 */
+  means: number[];
+  /** 자산별 일 표준편차 */
+  stdDevs: number[];
+  /** 자산별 비중 */
+  weights: number[];
+  /** 촐레스키 하삼각 (행 우선 n×n) */
+  cholesky: number[];
+  holdingPeriod: number;
+}
+
+export type MonteCarloTask = IMonteCarloSingleTask | IMonteCarloPortfolioTask;
+
+/**
+ * 청크 작업 (워커로 전달되는 단위)
+ */
+export interface IMonteCarloChunk {
+  task: MonteCarloTask;
+  seed: number;
+  count: number;
+}
+
+/**
+ * 워커 풀 백엔드
+ *
+ * 구현체는 simulateMonteCarloChunk를 다른 스레드에서 실행하고
+ * 결과 버퍼를 돌려주면 된다 (@qetta/core의 MonteCarloWorkerPool 참고).
+ */
+export interface IMonteCarloWorkerPool {
+  readonly size: number;
+  run(chunk: IMonteCarloChunk): Promise<Float64Array>;
+}
+
+/**
+ * 청크 하나 시뮬레이션 → 보유기간 누적 수익률 버퍼
+ *
+ * 일별 수익률이 i.i.d. 정규분포이면 h일 누적 수익률은
+ * N(h·μ, h·σ²)이므로 경로당 정규난수 하나(자산당 하나)로 충분하다.
+ */
+export function simulateMonteCarloChunk(chunk: IMonteCarloChunk): Float64Array {
+  const { task, count } = chunk;
+  const random = createSeededRandom(chunk.seed);
+  const out = new Float64Array(count);
+  const h = task.holdingPeriod;
+  const sqrtH = Math.sqrt(h);
+
+  if (task.kind === 'single') {
+    fillStandardNormal(out, random);
+    const drift = h * task.mean;
+    const scale = sqrtH * task.stdDev;
+    for (let i = 0; i < count; i++) {
+      out[i] = drift + scale * out[i];
+    }
+    return out;
+  }
+
+  // 다자산: x = L·z 로 상관된 표준정규를 만든 뒤 비중 합산
+  const n = task.weights.length;
+  const L = task.cholesky;
+  const drift = task.means.reduce((sum, m, a) => sum + task.weights[a] * m, 0) * h;
+  const scaled = new Float64Array(n);
+  for (let a = 0; a < n; a++) scaled[a] = task.weights[a] * task.stdDevs[a] * sqrtH;
+
+  const z = new Float64Array(n * Math.min(count, 4096));
+  const batch = z.length / n;
+
+  for (let start = 0; start < count; start += batch) {
+    const size = Math.min(batch, count - start);
+    fillStandardNormal(z, random);
+
+    for (let s = 0; s < size; s++) {
+      const base = s * n;
+      let portfolioReturn = drift;
+      for (let a = 0; a < n; a++) {
+        let x = 0;
+        const row = a * n;
+        for (let k = 0; k <= a; k++) x += L[row + k] * z[base + k];
+        portfolioReturn += scaled[a] * x;
+      }
+      out[start + s] = portfolioReturn;
+    }
+  }
+
+  return out;
+}
+
+function createChunks(task: MonteCarloTask, simulations: number, seed: number): IMonteCarloChunk[] {
+  const chunks: IMonteCarloChunk[] = [];
+  for (let start = 0, index = 0; start < simulations; start += MONTE_CARLO_CHUNK_SIZE, index++) {
+    chunks.push({
+      task,
+      seed: deriveChunkSeed(seed, index),
+      count: Math.min(MONTE_CARLO_CHUNK_SIZE, simulations - start),
+    });
+  }
+  return chunks;
+}
+
+/**
+ * 시뮬레이션 실행 (동기)
+ */
+export function runMonteCarlo(
+  task: MonteCarloTask,
+  simulations: number,
+  seed: number
+): Float64Array {
+  const out = new Float64Array(simulations);
+  let offset = 0;
+  for (const chunk of createChunks(task, simulations, seed)) {
+    out.set(simulateMonteCarloChunk(chunk), offset);
+    offset += chunk.count;
+  }
+  return out;
+}
+
+/**
+ * 시뮬레이션 실행 (워커 풀 분산)
+ *
+ * 청크가 하나뿐이거나 풀이 없으면 현재 스레드에서 실행.
+ * 같은 seed면 runMonteCarlo와 동일한 버퍼를 반환한다.
+ */
+export async function runMonteCarloAsync(
+  task: MonteCarloTask,
+  simulations: number,
+  seed: number,
+  pool?: IMonteCarloWorkerPool
+): Promise<Float64Array> {
+  const chunks = createChunks(task, simulations, seed);
+  if (!pool || pool.size < 1 || chunks.length < 2) {
+    return runMonteCarlo(task, simulations, seed);
+  }
+
+  const results = await Promise.all(chunks.map((chunk) => pool.run(chunk)));
+  const out = new Float64Array(simulations);
+  let offset = 0;
+  for (const result of results) {
+    out.set(result, offset);
+    offset += result.length;
+  }
+  return out;
+}
+
+/**
+ * 시드 미지정 시 사용할 무작위 시드
+ */
+export function randomSeed(): number {
+  return Math.floor(Math.random() * 4294967296) >>> 0;
+}
@@ -6,6 +6,15 @@
  */
 
 import type { HephaitosTypes } from '@qetta/types';
+import {
+  choleskyDecompose,
+  randomSeed,
+  runMonteCarlo,
+  runMonteCarloAsync,
+  summarizeLowerTail,
+  type IMonteCarloWorkerPool,
+  type MonteCarloTask,
+} from './monte-carlo.js';
 
 type RiskLevel = HephaitosTypes.RiskLevel;
 type VaRMethod = HephaitosTypes.VaRMethod;
@@ -48,12 +57,11 @@ export function calculateHistoricalVaR(
     return createEmptyVaR(portfolioValue, confidenceLevel, holdingPeriod, 'historical');
   }
 
-  // 수익률 정렬 (오름차순)
-  const sortedReturns = [...returns].sort((a, b) => a - b);
-
-  // 백분위수 인덱스 계산
-  const percentileIndex = Math.floor((1 - confidenceLevel) * sortedReturns.length);
-  const varReturn = sortedReturns[Math.max(0, percentileIndex)];
+  // 백분위수 추출 (quickselect - 전체 정렬 불필요)
+  const { percentile: varReturn } = summarizeLowerTail(
+    Float64Array.from(returns),
+    confidenceLevel
+  );
 
   // 보유기간 조정 (√T 룰)
   const adjustedVarReturn = varReturn * Math.sqrt(holdingPeriod);
@@ -115,6 +123,22 @@ export function calculateParametricVaR(
   };
 }
 
+/**
+ * 몬테카를로 시뮬레이션 옵션
+ */
+export interface IMonteCarloOptions {
+  /** 신뢰수준 (기본 0.95) */
+  confidenceLevel?: number;
+  /** 보유기간 (일, 기본 1) */
+  holdingPeriod?: number;
+  /** 시뮬레이션 횟수 (기본 10000) */
+  simulations?: number;
+  /** 난수 시드 (지정 시 결과 재현 가능) */
+  seed?: number;
+  /** 워커 풀 (대규모 시뮬레이션 분산, async 함수 전용) */
+  pool?: IMonteCarloWorkerPool;
+}
+
 /**
  * 몬테카를로 VaR 계산
  *
@@ -123,52 +147,126 @@ export function calculateParametricVaR(
  * @param confidenceLevel - 신뢰수준
  * @param holdingPeriod - 보유기간 (일)
  * @param simulations - 시뮬레이션 횟수
+ * @param seed - 난수 시드 (미지정 시 매 호출 무작위)
  */
 export function calculateMonteCarloVaR(
   returns: number[],
   portfolioValue: number,
   confidenceLevel: number = 0.95,
   holdingPeriod: number = 1,
-  simulations: number = 10000
+  simulations: number = 10000,
+  seed?: number
 ): IVaRResult {
+  const result = calculateMonteCarloCVaR(returns, portfolioValue, {
+    confidenceLevel,
+    holdingPeriod,
+    simulations,
+    seed,
+  });
+  return {
+    value: result.value,
+    percentage: result.percentage,
+    confidenceLevel: result.confidenceLevel,
+    holdingPeriod: result.holdingPeriod,
+    method: result.method,
+    calculatedAt: result.calculatedAt,
+  };
+}
+
+/**
+ * 몬테카를로 VaR + CVaR 계산 (한 번의 시뮬레이션에서 함께 추출)
+ */
+export function calculateMonteCarloCVaR(
+  returns: number[],
+  portfolioValue: number,
+  options: IMonteCarloOptions = {}
+): ICVaRResult {
+  const { confidenceLevel = 0.95, holdingPeriod = 1, simulations = 10000 } = options;
   if (returns.length < 2) {
-    return createEmptyVaR(portfolioValue, confidenceLevel, holdingPeriod, 'monte_carlo');
+    return createEmptyCVaR(portfolioValue, confidenceLevel, holdingPeriod, 'monte_carlo');
   }
 
-  const meanReturn = mean(returns);
-  const stdDev = standardDeviation(returns);
+  const task = createSingleAssetTask(returns, holdingPeriod);
+  const simulated = runMonteCarlo(task, simulations, options.seed ?? randomSeed());
 
-  // 몬테카를로 시뮬레이션
-  const simulatedReturns: number[] = [];
-  for (let i = 0; i < simulations; i++) {
-    let cumulativeReturn = 0;
-    for (let d = 0; d < holdingPeriod; d++) {
-      // Box-Muller 변환으로 정규분포 난수 생성
-      const u1 = Math.random();
-      const u2 = Math.random();
-      const z = Math.sqrt(-2 * Math.log(u1)) * Math.cos(2 * Math.PI * u2);
-      const dailyReturn = meanReturn + stdDev * z;
-      cumulativeReturn += dailyReturn;
-    }
-    simulatedReturns.push(cumulativeReturn);
+  return createSimulatedCVaR(simulated, portfolioValue, confidenceLevel, holdingPeriod);
+}
+
+/**
+ * 몬테카를로 VaR + CVaR 계산 (워커 풀 분산)
+ *
+ * 같은 seed면 calculateMonteCarloCVaR와 동일한 결과
+ */
+export async function calculateMonteCarloCVaRAsync(
+  returns: number[],
+  portfolioValue: number,
+  options: IMonteCarloOptions = {}
+): Promise<ICVaRResult> {
+  const { confidenceLevel = 0.95, holdingPeriod = 1, simulations = 10000 } = options;
+  if (returns.length < 2) {
+    return createEmptyCVaR(portfolioValue, confidenceLevel, holdingPeriod, 'monte_carlo');
   }
 
-  // 정렬 후 백분위수 추출
-  simulatedReturns.sort((a, b) => a - b);
-  const percentileIndex = Math.floor((1 - confidenceLevel) * simulations);
-  const varReturn = simulatedReturns[Math.max(0, percentileIndex)];
+  const task = createSingleAssetTask(returns, holdingPeriod);
+  const simulated = await runMonteCarloAsync(
+    task,
+    simulations,
+    options.seed ?? randomSeed(),
+    options.pool
+  );
 
-  const varValue = Math.abs(varReturn * portfolioValue);
-  const varPercentage = Math.abs(varReturn) * 100;
+  return createSimulatedCVaR(simulated, portfolioValue, confidenceLevel, holdingPeriod);
+}
 
-  return {
-    value: varValue,
-    percentage: varPercentage,
-    confidenceLevel,
-    holdingPeriod,
-    method: 'monte_carlo',
-    calculatedAt: new Date().toISOString(),
-  };
+/**
+ * 다자산 포트폴리오 몬테카를로 VaR + CVaR (상관 시뮬레이션)
+ *
+ * @param assetReturns - 자산별 일별 수익률 배열 (같은 길이)
+ * @param weights - 자산별 비중 (합 1 권장)
+ * @param portfolioValue - 포트폴리오 총 가치
+ * @param correlationMatrix - 상관행렬 (calculateCorrelationRisk와 같은 행렬,
+ *                            미지정 시 calculateCorrelationMatrix로 계산)
+ */
+export function calculatePortfolioMonteCarloCVaR(
+  assetReturns: number[][],
+  weights: number[],
+  portfolioValue: number,
+  correlationMatrix?: number[][],
+  options: IMonteCarloOptions = {}
+): ICVaRResult {
+  const { confidenceLevel = 0.95, holdingPeriod = 1, simulations = 10000 } = options;
+  const task = createPortfolioTask(assetReturns, weights, holdingPeriod, correlationMatrix);
+  if (!task) {
+    return createEmptyCVaR(portfolioValue, confidenceLevel, holdingPeriod, 'monte_carlo');
+  }
+
+  const simulated = runMonteCarlo(task, simulations, options.seed ?? randomSeed());
+  return createSimulatedCVaR(simulated, portfolioValue, confidenceLevel, holdingPeriod);
+}
+
+/**
+ * 다자산 포트폴리오 몬테카를로 VaR + CVaR (워커 풀 분산)
+ */
+export async function calculatePortfolioMonteCarloCVaRAsync(
+  assetReturns: number[][],
+  weights: number[],
+  portfolioValue: number,
+  correlationMatrix?: number[][],
+  options: IMonteCarloOptions = {}
+): Promise<ICVaRResult> {
+  const { confidenceLevel = 0.95, holdingPeriod = 1, simulations = 10000 } = options;
+  const task = createPortfolioTask(assetReturns, weights, holdingPeriod, correlationMatrix);
+  if (!task) {
+    return createEmptyCVaR(portfolioValue, confidenceLevel, holdingPeriod, 'monte_carlo');
+  }
+
+  const simulated = await runMonteCarloAsync(
+    task,
+    simulations,
+    options.seed ?? randomSeed(),
+    options.pool
+  );
+  return createSimulatedCVaR(simulated, portfolioValue, confidenceLevel, holdingPeriod);
 }
 
 /**
@@ -226,16 +324,24 @@ export function calculateCVaR(
     };
   }
 
-  // VaR 먼저 계산
-  const varResult = calculateHistoricalVaR(returns, portfolioValue, confidenceLevel, holdingPeriod);
+  // VaR 백분위수와 꼬리 평균(Expected Shortfall)을 한 번의 quickselect로 추출
+  const { percentile: varReturn, tailMean: avgTailReturn } = summarizeLowerTail(
+    Float64Array.from(returns),
+    confidenceLevel
+  );
 
-  // VaR 이하 수익률들의 평균 (Expected Shortfall)
-  const sortedReturns = [...returns].sort((a, b) => a - b);
-  const cutoffIndex = Math.floor((1 - confidenceLevel) * sortedReturns.length);
-  const tailReturns = sortedReturns.slice(0, Math.max(1, cutoffIndex));
+  const sqrtHoldingPeriod = Math.sqrt(holdingPeriod);
+  const adjustedVarReturn = varReturn * sqrtHoldingPeriod;
+  const varResult: IVaRResult = {
+    value: Math.abs(adjustedVarReturn * portfolioValue),
+    percentage: Math.abs(adjustedVarReturn) * 100,
+    confidenceLevel,
+    holdingPeriod,
+    method: 'historical',
+    calculatedAt: new Date().toISOString(),
+  };
 
-  const avgTailReturn = mean(tailReturns);
-  const adjustedTailReturn = avgTailReturn * Math.sqrt(holdingPeriod);
+  const adjustedTailReturn = avgTailReturn * sqrtHoldingPeriod;
 
   const cvarValue = Math.abs(adjustedTailReturn * portfolioValue);
   const cvarPercentage = Math.abs(adjustedTailReturn) * 100;
@@ -541,6 +647,36 @@ export function calculateCorrelationRisk(correlationMatrix: number[][]): number
   return (totalCorr / count) * 100;
 }
 
+/**
+ * 자산별 수익률로 상관행렬 계산
+ *
+ * calculateCorrelationRisk와 calculatePortfolioMonteCarloCVaR에 같은 행렬을 전달
+ *
+ * @param assetReturns - 자산별 일별 수익률 배열 (같은 길이)
+ */
+export function calculateCorrelationMatrix(assetReturns: number[][]): number[][] {
+  const n = assetReturns.length;
+  const stdDevs = assetReturns.map((r) => standardDeviation(r));
+  const matrix: number[][] = [];
+
+  for (let i = 0; i < n; i++) {
+    matrix.push(new Array(n).fill(0));
+    matrix[i][i] = 1;
+  }
+
+  for (let i = 0; i < n; i++) {
+    for (let j = i + 1; j < n; j++) {
+      const denom = stdDevs[i] * stdDevs[j];
+      const corr =
+        denom === 0 ? 0 : calculateCovariance(assetReturns[i], assetReturns[j]) / denom;
+      matrix[i][j] = corr;
+      matrix[j][i] = corr;
+    }
+  }
+
+  return matrix;
+}
+
 // ═══════════════════════════════════════════════════════════════
 // 포지션 사이징
 // ═══════════════════════════════════════════════════════════════
@@ -702,6 +838,72 @@ function createEmptyVaR(
   };
 }
 
+function createEmptyCVaR(
+  portfolioValue: number,
+  confidenceLevel: number,
+  holdingPeriod: number,
+  method: VaRMethod
+): ICVaRResult {
+  return {
+    ...createEmptyVaR(portfolioValue, confidenceLevel, holdingPeriod, method),
+    cvarValue: 0,
+    cvarPercentage: 0,
+  };
+}
+
+function createSingleAssetTask(returns: number[], holdingPeriod: number): MonteCarloTask {
+  return {
+    kind: 'single',
+    mean: mean(returns),
+    stdDev: standardDeviation(returns),
+    holdingPeriod,
+  };
+}
+
+function createPortfolioTask(
+  assetReturns: number[][],
+  weights: number[],
+  holdingPeriod: number,
+  correlationMatrix?: number[][]
+): MonteCarloTask | null {
+  if (assetReturns.length === 0 || assetReturns.length !== weights.length) return null;
+  if (assetReturns.some((r) => r.length < 2)) return null;
+
+  const matrix = correlationMatrix ?? calculateCorrelationMatrix(assetReturns);
+  return {
+    kind: 'portfolio',
+    means: assetReturns.map((r) => mean(r)),
+    stdDevs: assetReturns.map((r) => standardDeviation(r)),
+    weights,
+    cholesky: Array.from(choleskyDecompose(matrix)),
+    holdingPeriod,
+  };
+}
+
+/**
+ * 시뮬레이션된 보유기간 수익률 버퍼 → VaR/CVaR
+ * (보유기간은 시뮬레이션에 이미 반영됨)
+ */
+function createSimulatedCVaR(
+  simulated: Float64Array,
+  portfolioValue: number,
+  confidenceLevel: number,
+  holdingPeriod: number
+): ICVaRResult {
+  const { percentile, tailMean } = summarizeLowerTail(simulated, confidenceLevel);
+
+  return {
+    value: Math.abs(percentile * portfolioValue),
+    percentage: Math.abs(percentile) * 100,
+    confidenceLevel,
+    holdingPeriod,
+    method: 'monte_carlo',
+    calculatedAt: new Date().toISOString(),
+    cvarValue: Math.abs(tailMean * portfolioValue),
+    cvarPercentage: Math.abs(tailMean) * 100,
+  };
+}
+
 function createEmptyDrawdownAnalysis(): IDrawdownAnalysis {
   return {
     currentDrawdown: 0,
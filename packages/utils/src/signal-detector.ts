@@ -6,6 +6,7 @@
  */
 
 import type { HephaitosTypes } from '@qetta/types';
+import { evaluateConditionGroupIncremental } from './indicator-engine.js';
 
 type IOHLCV = HephaitosTypes.IOHLCV;
 type ICondition = HephaitosTypes.ICondition;
@@ -61,38 +62,43 @@ export function calculateEMA(closes: number[], period: number): number[] {
 
 /**
  * RSI (Relative Strength Index)
+ *
+ * Wilder 평활. 결과는 closes와 같은 길이이며 i번째 값은 i번째 종가까지만 사용한다.
  */
 export function calculateRSI(closes: number[], period: number = 14): number[] {
   const result: number[] = [];
-  const gains: number[] = [];
-  const losses: number[] = [];
-
-  // 변화량 계산
-  for (let i = 1; i < closes.length; i++) {
-    const change = closes[i] - closes[i - 1];
-    gains.push(change > 0 ? change : 0);
-    losses.push(change < 0 ? -change : 0);
-  }
+  let avgGain = 0;
+  let avgLoss = 0;
 
-  // 초기 평균
-  let avgGain = gains.slice(0, period).reduce((a, b) => a + b, 0) / period;
-  let avgLoss = losses.slice(0, period).reduce((a, b) => a + b, 0) / period;
-
-  // 첫 번째 RSI
-  result.push(...Array(period).fill(NaN));
+  for (let i = 0; i < closes.length; i++) {
+    if (i === 0) {
+      result.push(NaN);
+      continue;
+    }
 
-  for (let i = period; i < gains.length; i++) {
-    if (i === period) {
-      // 첫 RSI 계산
-      const rs = avgLoss === 0 ? 100 : avgGain / avgLoss;
-      result.push(100 - 100 / (1 + rs));
+    // 변화량 계산
+    const change = closes[i] - closes[i - 1];
+    const gain = change > 0 ? change : 0;
+    const loss = change < 0 ? -change : 0;
+
+    if (i <= period) {
+      // 초기 평균
+      avgGain += gain;
+      avgLoss += loss;
+      if (i < period) {
+        result.push(NaN);
+        continue;
+      }
+      avgGain /= period;
+      avgLoss /= period;
     } else {
       // Smoothed RSI
-      avgGain = (avgGain * (period - 1) + gains[i]) / period;
-      avgLoss = (avgLoss * (period - 1) + losses[i]) / period;
-      const rs = avgLoss === 0 ? 100 : avgGain / avgLoss;
-      result.push(100 - 100 / (1 + rs));
+      avgGain = (avgGain * (period - 1) + gain) / period;
+      avgLoss = (avgLoss * (period - 1) + loss) / period;
     }
+
+    const rs = avgLoss === 0 ? 100 : avgGain / avgLoss;
+    result.push(100 - 100 / (1 + rs));
   }
 
   return result;
@@ -400,13 +406,16 @@ export function evaluateConditionGroup(
 
 /**
  * 진입 시그널 감지
+ *
+ * 캔들 배열별 IndicatorEngine을 재사용하므로 currentIndex가 증가하는
+ * 루프에서는 새 bar당 O(1) (indicator-engine 참고)
  */
 export function detectEntrySignal(
   candles: IOHLCV[],
   entryConditions: IConditionGroup,
   currentIndex: number
 ): boolean {
-  return evaluateConditionGroup(candles, entryConditions, currentIndex);
+  return evaluateConditionGroupIncremental(candles, entryConditions, currentIndex);
 }
 
 /**
@@ -439,7 +448,7 @@ export function detectExitSignal(
   }
 
   // 조건 체크
-  if (evaluateConditionGroup(candles, exitConditions, currentIndex)) {
+  if (evaluateConditionGroupIncremental(candles, exitConditions, currentIndex)) {
     return { exit: true, reason: 'condition' };
   }
 